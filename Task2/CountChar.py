@@ -1,32 +1,482 @@
-text = "hello world"
+"""
+Task2/CountChar.py - Character frequency counter
 
-# Options
-include_spaces = 'no' #give the value in lower case
-ignore_case = 'yes' #give the value in lower case
+Counts characters of a string, files or stdin. Input is streamed in fixed-size
+chunks, so memory stays flat for log files and page-source dumps of any size.
 
-# Apply case option
-if ignore_case == "yes":
-    text = text.lower()
+Usage:
+    python Task2/CountChar.py                          # counts the sample "hello world"
+    python Task2/CountChar.py --text "Hello World" --ignore-case no
+    python Task2/CountChar.py logs/*.log --include-spaces yes
+    cat page_source.html | python Task2/CountChar.py -
+    python Task2/CountChar.py huge.log --workers 8       # memory-mapped, one slice per process
+    python Task2/CountChar.py page.txt --casefold --normalize NFKC --graphemes
+    python Task2/CountChar.py app.log --follow 2         # re-count only appended bytes every 2s
+"""
+import argparse
+import codecs
+import mmap
+import os
+import sys
+import time
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-counts = {}
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: slices are then counted with Counter
+    np = None
 
-for char in text:
-    # Space option
-    if include_spaces == "no" and char == " ":
-        continue
+try:
+    import regex
+except ImportError:  # regex is optional: graphemes then use a simplified segmenter
+    regex = None
 
-    if char not in counts:
-        counts[char] = 1
+SAMPLE_TEXT = "hello world"
+CHUNK_SIZE = 1 << 20  # 1 MiB
+MIN_SLICE_SIZE = 8 << 20  # 8 MiB; smaller files are not worth a process pool
+NORMALIZATION_FORMS = ("NFC", "NFKC", "NFD", "NFKD")
+ZWJ = "\u200d"
+
+
+def count_text(text, include_spaces=False, ignore_case=True):
+    """
+    Count characters in a string
+
+    Args:
+        text: Text to count
+        include_spaces: Count the space character
+        ignore_case: Count upper and lower case as the same character
+
+    Returns:
+        Counter of character -> count, in order of first occurrence
+    """
+    counts = Counter(text.lower() if ignore_case else text)
+    if not include_spaces:
+        counts.pop(" ", None)
+    return counts
+
+
+def iter_chunks(stream, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """
+    Yield text chunks from a binary or text stream
+
+    Binary streams are decoded incrementally, so multi-byte characters split
+    across chunk boundaries are decoded correctly.
+    """
+    decoder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def count_stream(stream, include_spaces=False, ignore_case=True, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """Count characters of a stream, one chunk at a time"""
+    counts = Counter()
+    for chunk in iter_chunks(stream, chunk_size, encoding):
+        # Counter.update on a str runs the counting loop in C
+        counts.update(chunk.lower() if ignore_case else chunk)
+    if not include_spaces:
+        counts.pop(" ", None)
+    return counts
+
+
+def count_file(path, include_spaces=False, ignore_case=True, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """Count characters of a file ('-' reads stdin)"""
+    if path == "-":
+        return count_stream(sys.stdin.buffer, include_spaces, ignore_case, chunk_size, encoding)
+    with open(path, "rb") as f:
+        return count_stream(f, include_spaces, ignore_case, chunk_size, encoding)
+
+
+def _is_extender(char):
+    """Characters that extend the preceding grapheme cluster"""
+    code = ord(char)
+    return (unicodedata.category(char) in ("Mn", "Mc", "Me")
+            or char == ZWJ
+            or 0xFE00 <= code <= 0xFE0F  # variation selectors
+            or 0x1F3FB <= code <= 0x1F3FF  # emoji skin-tone modifiers
+            or 0xE0020 <= code <= 0xE007F  # emoji tag sequences
+            or 0x1160 <= code <= 0x11FF)  # Hangul jamo vowels/trailing consonants
+
+
+def _is_regional_indicator(char):
+    return 0x1F1E6 <= ord(char) <= 0x1F1FF
+
+
+def split_graphemes(text):
+    """
+    Split text into extended grapheme clusters
+
+    Uses the regex module's \\X when installed; otherwise a simplified segmenter that
+    handles combining marks, ZWJ emoji sequences, modifiers, flags and CRLF.
+    """
+    if regex is not None:
+        return regex.findall(r"\X", text)
+    clusters = []
+    i, size = 0, len(text)
+    while i < size:
+        j = i + 1
+        if text[i] == "\r" and text[j:j + 1] == "\n":
+            j += 1
+        elif _is_regional_indicator(text[i]) and j < size and _is_regional_indicator(text[j]):
+            j += 1
+        while j < size and (_is_extender(text[j]) or text[j - 1] == ZWJ):
+            j += 1
+        clusters.append(text[i:j])
+        i = j
+    return clusters
+
+
+def _stable_prefix_end(text):
+    """
+    Index up to which text can be counted without seeing what follows
+
+    The last starter and anything after it are held back, because the next chunk
+    may add combining marks, ZWJ sequences or a second flag half to it.
+    """
+    i = len(text) - 1
+    while i > 0 and (_is_extender(text[i]) or text[i - 1] == ZWJ):
+        i -= 1
+    while i > 0 and _is_regional_indicator(text[i]) and _is_regional_indicator(text[i - 1]):
+        i -= 1
+    if i > 0 and text[i] == "\n" and text[i - 1] == "\r":
+        i -= 1
+    return max(i, 0)
+
+
+class CharCounter:
+    """
+    Incremental, Unicode-aware character counter
+
+    Feed chunks (str or bytes) with update(); only new input is processed, so
+    tailing a growing file costs O(new bytes). Counters over different inputs
+    combine with merge().
+    """
+
+    def __init__(self, include_spaces=False, ignore_case=True, casefold=False, normalize=None,
+                 graphemes=False, encoding="utf-8"):
+        """
+        Args:
+            include_spaces: Count the space character
+            ignore_case: Count upper and lower case as the same character
+            casefold: Use full Unicode case folding (ß -> ss) instead of lower()
+            normalize: Unicode normalization form applied before counting (NFC, NFKC, NFD, NFKD)
+            graphemes: Count user-perceived characters (grapheme clusters) instead of code points
+            encoding: Encoding of bytes passed to update()
+        """
+        if normalize is not None and normalize not in NORMALIZATION_FORMS:
+            raise ValueError(f"Unsupported normalization form: {normalize}")
+        self.include_spaces = include_spaces
+        self.ignore_case = ignore_case
+        self.casefold = casefold
+        self.normalize = normalize
+        self.graphemes = graphemes
+        self.counts = Counter()
+        self._pending = ""
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._offsets = {}
+
+    def _options(self):
+        return self.include_spaces, self.ignore_case, self.casefold, self.normalize, self.graphemes
+
+    def _transform(self, text):
+        if self.normalize:
+            text = unicodedata.normalize(self.normalize, text)
+        if self.ignore_case:
+            text = text.casefold() if self.casefold else text.lower()
+            if self.normalize:
+                # Case mapping can denormalize (e.g. casefold of U+0130)
+                text = unicodedata.normalize(self.normalize, text)
+        return text
+
+    def _count(self, text, counts):
+        if text:
+            text = self._transform(text)
+            counts.update(split_graphemes(text) if self.graphemes else text)
+
+    def update(self, data):
+        """Count a chunk of str or bytes"""
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+        text = self._pending + data
+        cut = _stable_prefix_end(text)
+        self._pending = text[cut:]
+        self._count(text[:cut], self.counts)
+        return self
+
+    def update_from_file(self, path, chunk_size=CHUNK_SIZE):
+        """Count bytes appended to path since the last call; a truncated file is read from the start"""
+        offset = self._offsets.get(path, 0)
+        if os.path.getsize(path) < offset:
+            offset = 0
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                self.update(chunk)
+                offset += len(chunk)
+        self._offsets[path] = offset
+        return self
+
+    def merge(self, other):
+        """Add the counts of another counter created with the same options"""
+        if other._options() != self._options():
+            raise ValueError("Cannot merge counters with different options")
+        self.counts.update(other.result())
+        return self
+
+    def flush(self):
+        """Count the held-back tail; call at the end of the input"""
+        tail = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        self._count(tail, self.counts)
+        return self.result()
+
+    def result(self):
+        """Counts so far, including the held-back tail (without consuming it)"""
+        counts = Counter(self.counts)
+        self._count(self._pending, counts)
+        if not self.include_spaces:
+            counts.pop(" ", None)
+        return counts
+
+
+def split_utf8(mm, parts):
+    """
+    Split a buffer into about equal (start, end) slices on UTF-8 character boundaries
+
+    A boundary never falls on a continuation byte (0b10xxxxxx), so no character is split.
+    """
+    size = len(mm)
+    bounds = [0]
+    for i in range(1, parts):
+        position = max(size * i // parts, bounds[-1])
+        while position < size and (mm[position] & 0xC0) == 0x80:
+            position += 1
+        bounds.append(position)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _count_slice(path, start, end, include_spaces, ignore_case):
+    """
+    Count one memory-mapped slice of a UTF-8 file (runs in a worker process)
+
+    Bytes are counted with a vectorized histogram and multi-byte characters are
+    decoded to code points with NumPy; invalid UTF-8 falls back to decode + Counter.
+
+    Returns:
+        list of (char, count) in order of first occurrence within the slice
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if np is not None:
+            view = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+            try:
+                entries = _histogram_counts(view, mm, start, end)
+            finally:
+                del view  # release the buffer export before the mmap closes
+            if entries is not None:
+                return _fold_counts(entries, include_spaces, ignore_case)
+        text = mm[start:end].decode("utf-8", errors="replace")
+    return list(count_text(text, include_spaces, ignore_case).items())
+
+
+def _histogram_counts(view, mm, start, end):
+    """
+    Count characters of a UTF-8 byte view
+
+    Returns:
+        dict of char -> [count, first byte position], or None if the bytes are not valid UTF-8
+    """
+    histogram = np.bincount(view, minlength=256)
+    entries = {}
+    for byte in np.flatnonzero(histogram[:0x80]).tolist():
+        # mmap.find scans at memchr speed and stops at the first hit
+        entries[chr(byte)] = [int(histogram[byte]), mm.find(bytes([byte]), start, end)]
+    if histogram[0x80:].any():
+        decoded = _multibyte_code_points(view, int(histogram[0x80:].sum()))
+        if decoded is None:
+            return None
+        code_points, positions = decoded
+        unique, first, counts = np.unique(code_points, return_index=True, return_counts=True)
+        for code_point, index, count in zip(unique.tolist(), first.tolist(), counts.tolist()):
+            entries[chr(code_point)] = [count, start + int(positions[index])]
+    return entries
+
+
+def _multibyte_code_points(view, high_bytes):
+    """
+    Decode the multi-byte UTF-8 sequences of a byte view to code points
+
+    Returns:
+        (code_points, lead byte positions) arrays, or None for invalid UTF-8
+    """
+    size = len(view)
+    continuation = int(np.count_nonzero((view & 0xC0) == 0x80))
+    code_points, positions, expected = [], [], 0
+    for length, mask, prefix, minimum in ((2, 0xE0, 0xC0, 0x80), (3, 0xF0, 0xE0, 0x800), (4, 0xF8, 0xF0, 0x10000)):
+        leads = np.flatnonzero((view & mask) == prefix)
+        if not leads.size:
+            continue
+        if leads[-1] + length > size:
+            return None
+        value = (view[leads] & (0xFF >> (length + 1))).astype(np.uint32)
+        for offset in range(1, length):
+            following = view[leads + offset]
+            if np.any((following & 0xC0) != 0x80):
+                return None
+            value = (value << 6) | (following & 0x3F)
+        # Reject overlong encodings, surrogates and out-of-range code points
+        if np.any(value < minimum) or np.any((value >= 0xD800) & (value <= 0xDFFF)) or np.any(value > 0x10FFFF):
+            return None
+        code_points.append(value)
+        positions.append(leads)
+        expected += leads.size * (length - 1)
+    if continuation != expected or high_bytes != continuation + sum(p.size for p in positions):
+        return None
+    return np.concatenate(code_points), np.concatenate(positions)
+
+
+def _fold_counts(entries, include_spaces, ignore_case):
+    """Apply the case/space options to histogram entries and order them by first occurrence"""
+    result = {}
+    for char, (count, position) in entries.items():
+        for folded in (char.lower() if ignore_case else char):
+            entry = result.setdefault(folded, [0, position])
+            entry[0] += count
+            entry[1] = min(entry[1], position)
+    if not include_spaces:
+        result.pop(" ", None)
+    return [(char, count) for char, (count, _) in sorted(result.items(), key=lambda item: item[1][1])]
+
+
+def count_file_parallel(path, include_spaces=False, ignore_case=True, workers=None):
+    """
+    Count characters of a UTF-8 file with a process pool over memory-mapped slices
+
+    Args:
+        path: File to count
+        include_spaces: Count the space character
+        ignore_case: Count upper and lower case as the same character
+        workers: Number of processes (default: CPU count)
+
+    Returns:
+        Counter of character -> count, in order of first occurrence
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    counts = Counter()
+    if size == 0:
+        return counts
+    parts = max(1, min(workers, size // MIN_SLICE_SIZE))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        slices = split_utf8(mm, parts)
+
+    if len(slices) == 1:
+        partials = [_count_slice(path, *slices[0], include_spaces, ignore_case)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(slices)) as pool:
+            futures = [pool.submit(_count_slice, path, start, end, include_spaces, ignore_case)
+                       for start, end in slices]
+            partials = [future.result() for future in futures]
+
+    # Merging in slice order keeps first-occurrence order across the file
+    for partial in partials:
+        counts.update(dict(partial))
+    return counts
+
+
+def format_counts(counts, separator=", "):
+    """Format counts as 'h:1, e:1, l:3' in linear time"""
+    return separator.join(f"{char}:{count}" for char, count in counts.items())
+
+
+def _yes_no(value):
+    value = value.lower()
+    if value not in ("yes", "no"):
+        raise argparse.ArgumentTypeError("expected 'yes' or 'no'")
+    return value == "yes"
+
+
+def main(argv=None):
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="Count character frequency of text, files or stdin")
+    parser.add_argument("files", nargs="*", help="Files to count ('-' for stdin)")
+    parser.add_argument("--text", help="Count this text instead of files")
+    parser.add_argument("--include-spaces", type=_yes_no, default=False, metavar="yes|no",
+                        help="Count spaces. Default: no")
+    parser.add_argument("--ignore-case", type=_yes_no, default=True, metavar="yes|no",
+                        help="Treat upper and lower case as the same character. Default: yes")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Read size in bytes")
+    parser.add_argument("--encoding", default="utf-8", help="Input encoding. Default: utf-8")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Count UTF-8 files memory-mapped across N processes (0: streaming, serial)")
+    parser.add_argument("--casefold", action="store_true", help="Use Unicode case folding instead of lower()")
+    parser.add_argument("--normalize", choices=NORMALIZATION_FORMS, help="Unicode normalization form")
+    parser.add_argument("--graphemes", action="store_true", help="Count grapheme clusters instead of code points")
+    parser.add_argument("--follow", type=float, metavar="SECONDS",
+                        help="Keep counting bytes appended to the files, polling every SECONDS")
+    args = parser.parse_args(argv)
+
+    def new_counter():
+        return CharCounter(args.include_spaces, args.ignore_case, args.casefold, args.normalize,
+                           args.graphemes, args.encoding)
+
+    unicode_mode = args.casefold or args.normalize or args.graphemes
+    if args.text is not None or (not args.files and sys.stdin.isatty()):
+        text = SAMPLE_TEXT if args.text is None else args.text
+        if unicode_mode:
+            counts = new_counter().update(text).flush()
+        else:
+            counts = count_text(text, args.include_spaces, args.ignore_case)
+    elif args.follow:
+        if not args.files or "-" in args.files:
+            parser.error("--follow needs file paths")
+        counter, last = new_counter(), None
+        try:
+            while True:
+                for path in args.files:
+                    counter.update_from_file(path, args.chunk_size)
+                counts = counter.result()
+                if counts != last:
+                    print(format_counts(counts), flush=True)
+                    last = counts
+                time.sleep(args.follow)
+        except KeyboardInterrupt:
+            return 0
+    elif unicode_mode:
+        counter = new_counter()
+        for path in args.files or ["-"]:
+            if path == "-":
+                for chunk in iter(lambda: sys.stdin.buffer.read(args.chunk_size), b""):
+                    counter.update(chunk)
+            else:
+                counter.update_from_file(path, args.chunk_size)
+        counts = counter.flush()
     else:
-        counts[char] += 1
+        counts = Counter()
+        for path in args.files or ["-"]:
+            if args.workers and path != "-":
+                counts.update(count_file_parallel(path, args.include_spaces, args.ignore_case, args.workers))
+            else:
+                counts.update(count_file(path, args.include_spaces, args.ignore_case,
+                                         args.chunk_size, args.encoding))
 
-result = ""
-for char in counts:
-    temp = char + ":" + str(counts[char]) + ", "
-    result = result+temp
+    print(format_counts(counts))
+    return 0
 
-# Remove last comma + space
-if len(result) > 2:
-    result = result[:-2]
 
-print(result)
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
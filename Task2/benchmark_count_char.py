@@ -0,0 +1,120 @@
+"""
+Task2/benchmark_count_char.py - Benchmark CountChar engines on synthetic files
+
+Engines:
+    loop     the original per-character dict loop (streamed, so memory stays flat)
+    counter  count_file: chunked streaming with Counter.update
+    mmap     count_file_parallel: memory-mapped slices, NumPy histograms, process pool
+
+Usage:
+    python Task2/benchmark_count_char.py                          # 1MB, 100MB, 1GB
+    python Task2/benchmark_count_char.py --sizes 1MB 10MB --workers 4 --unicode
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from CountChar import count_file, count_file_parallel, iter_chunks, np  # noqa: E402
+
+UNITS = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+BLOCK_SIZE = 1 << 20
+
+
+def parse_size(value):
+    """Parse '100MB' into bytes"""
+    value = value.upper()
+    for unit, factor in UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[:-len(unit)]) * factor)
+    return int(value)
+
+
+def make_file(directory, size, unicode=False):
+    """Write a synthetic text file of about size bytes by repeating a random 1 MiB block"""
+    alphabet = string.ascii_letters + string.digits + string.punctuation + " " * 10 + "\n"
+    if unicode:
+        alphabet += "éüßøñ€¥—🚀"
+    rng = random.Random(42)
+    block = "".join(rng.choices(alphabet, k=BLOCK_SIZE)).encode("utf-8")[:BLOCK_SIZE]
+    # Drop a character cut in half at the end of the block
+    block = block.decode("utf-8", errors="ignore").encode("utf-8")
+    path = os.path.join(directory, f"synthetic_{size}.txt")
+    with open(path, "wb") as f:
+        written = 0
+        while written < size:
+            part = block[:size - written]
+            f.write(part)
+            written += len(part)
+    return path
+
+
+def count_loop(path, include_spaces=False, ignore_case=True):
+    """The original CountChar algorithm: a Python loop with dict membership checks"""
+    counts = {}
+    with open(path, "rb") as f:
+        for chunk in iter_chunks(f):
+            if ignore_case:
+                chunk = chunk.lower()
+            for char in chunk:
+                if not include_spaces and char == " ":
+                    continue
+                if char not in counts:
+                    counts[char] = 1
+                else:
+                    counts[char] += 1
+    return counts
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CountChar engines")
+    parser.add_argument("--sizes", nargs="+", default=["1MB", "100MB", "1GB"], help="Synthetic file sizes")
+    parser.add_argument("--engines", nargs="+", default=["loop", "counter", "mmap"],
+                        choices=["loop", "counter", "mmap"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes for the mmap engine")
+    parser.add_argument("--max-loop-size", default="100MB", help="Skip the slow loop engine above this size")
+    parser.add_argument("--unicode", action="store_true", help="Mix multi-byte characters into the input")
+    parser.add_argument("--dir", default=None, help="Directory for synthetic files (default: temp dir)")
+    args = parser.parse_args(argv)
+
+    engines = {
+        "loop": lambda path: count_loop(path),
+        "counter": lambda path: count_file(path),
+        "mmap": lambda path: count_file_parallel(path, workers=args.workers),
+    }
+    max_loop_size = parse_size(args.max_loop_size)
+
+    print(f"workers={args.workers} numpy={'yes' if np is not None else 'no'} unicode={args.unicode}")
+    print(f"{'size':>8} {'engine':>8} {'seconds':>9} {'MB/s':>9}")
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for label in args.sizes:
+            size = parse_size(label)
+            path = make_file(directory, size, args.unicode)
+            reference = None
+            for engine in args.engines:
+                if engine == "loop" and size > max_loop_size:
+                    print(f"{label:>8} {engine:>8} {'skipped':>9}")
+                    continue
+                seconds, counts = timed(engines[engine], path)
+                if reference is None:
+                    reference = dict(counts)
+                elif dict(counts) != reference:
+                    print(f"{label:>8} {engine:>8} MISMATCH against first engine")
+                    return 1
+                print(f"{label:>8} {engine:>8} {seconds:>9.3f} {size / 2 ** 20 / seconds:>9.1f}")
+            os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,61 +2,186 @@
 Pytest configuration with custom --browser option
 """
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 import logging
 from datetime import datetime
 import os
+import shutil
+import tempfile
+from src.utils.duration_history import DurationHistory, parse_shard
+from src.utils.health_gate import HealthGate, SharedHealthResult
+from src.utils.resource_monitor import ProcessTreeMonitor, get_driver_pid, find_browser_leftovers, kill_processes
+from src.utils.content_fingerprint import ContentBaselineStore, ContentMonitor
+from src.utils.visual_compare import VisualBaselineStore, VisualComparator
+from src.utils.matrix_loader import MatrixLoader, iter_cases, value_id
+from src.utils.logger import DeferredFileHandler
+from src.drivers.remote_grid import RemoteSessionPool
+from src.utils.command_profiler import CommandProfiler, format_table, summarize, write_records
+from src.utils.page_performance import (PerformanceMonitor, PerformanceStore, budget_violations, run_violations,
+                                        summarize_samples)
+from src.utils.throttling import CHROMIUM_BROWSERS, apply_throttling, resolve_profiles
+from src.utils.session_state import SessionCipher, SessionStateCache, SessionStateStore
+from src.utils.lazy_import import lazy_import
+from src.config.settings import Settings, available_profiles, configure, get_settings, load_settings
+import json
+
+# Selenium, webdriver_manager and allure load when a fixture first needs them,
+# keeping --collect-only and xdist worker startup fast
+allure = lazy_import("allure")
 
 
 # ====================== LOGGING SETUP ======================
 def setup_logging():
-    """Configure logging for tests"""
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"test_{timestamp}.log")
-
+    """Configure logging for tests; the log file is created on the first record"""
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            DeferredFileHandler("logs", "test"),
             logging.StreamHandler()
         ]
     )
-    return logging.getLogger(__name__)
 
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
+duration_history = None
+matrix_loader = None
+health_result = None
+resource_summaries = []
+command_profiles = []
+performance_monitor = None
+performance_samples = {}
 
 
 # ====================== PYTEST HOOKS ======================
 def pytest_addoption(parser):
     """Add custom command-line options"""
+    parser.addoption(
+        "--profile",
+        action="store",
+        default=None,
+        choices=available_profiles(),
+        help="Settings profile from config/profiles (timeouts, browser flags). Default: MB_PROFILE or local"
+    )
     parser.addoption(
         "--browser",
         action="store",
-        default="chrome",
-        help="Browser to use for testing: chrome, firefox, edge. Default: chrome",
+        default=None,
+        help="Browser to use for testing: chrome, firefox, edge. Default: from profile (chrome)",
         choices=["chrome", "firefox", "edge"]
     )
     parser.addoption(
         "--headless",
         action="store_true",
-        default=False,
-        help="Run browser in headless mode"
+        default=None,
+        help="Run browser in headless mode (ci and perf profiles always do)"
     )
     parser.addoption(
         "--slow",
         action="store",
-        default="0",
+        default=None,
         type=float,
         help="Slow down browser actions (seconds). Default: 0"
     )
+    parser.addoption(
+        "--impact-base",
+        action="store",
+        default=None,
+        help="Only run tests affected by changes since this git ref, plus smoke tests"
+    )
+    parser.addoption(
+        "--durations-file",
+        action="store",
+        default=DurationHistory.DEFAULT_FILE,
+        help=f"Per-test duration history file. Default: {DurationHistory.DEFAULT_FILE}"
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="Run only shard i of N (e.g. 2/4), balanced by duration history"
+    )
+    parser.addoption(
+        "--slowest-first",
+        action="store_true",
+        default=False,
+        help="Order tests by descending duration history so slow tests start first"
+    )
+    parser.addoption(
+        "--health-gate",
+        action="store",
+        default="skip",
+        choices=HealthGate.POLICIES,
+        help="Pre-flight site check: abort the session, skip browser tests, or off. Default: skip"
+    )
+    parser.addoption(
+        "--resource-interval",
+        action="store",
+        default=ProcessTreeMonitor.DEFAULT_INTERVAL,
+        type=float,
+        help="Browser process CPU/RSS sampling interval (seconds), 0 disables. Default: 1.0"
+    )
+    parser.addoption(
+        "--content-baselines",
+        action="store",
+        default=ContentBaselineStore.DEFAULT_DIR,
+        help="Directory of page content fingerprints. Default: baselines/content"
+    )
+    parser.addoption(
+        "--update-content-baselines",
+        action="store_true",
+        default=False,
+        help="Overwrite content fingerprints instead of comparing against them"
+    )
+    parser.addoption(
+        "--visual-baselines",
+        action="store",
+        default=VisualBaselineStore.DEFAULT_DIR,
+        help="Directory of content-addressed element screenshots. Default: baselines/visual"
+    )
+    parser.addoption(
+        "--update-visual-baselines",
+        action="store_true",
+        default=False,
+        help="Overwrite element screenshot baselines instead of comparing against them"
+    )
+    parser.addoption(
+        "--matrix-dir",
+        action="store",
+        default=MatrixLoader.DEFAULT_DIR,
+        help="Directory of YAML test matrices used by @pytest.mark.matrix. Default: test_data/matrices"
+    )
+    parser.addoption(
+        "--grid-url",
+        action="store",
+        default=None,
+        help="Run browsers on a Selenium Grid, e.g. http://localhost:4444/wd/hub (overrides MB_GRID__URL)"
+    )
+    parser.addoption(
+        "--grid-prewarm",
+        action="store",
+        type=int,
+        default=None,
+        help="Grid sessions each worker creates in parallel before the first test"
+    )
+    parser.addoption(
+        "--command-profile",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Profile every WebDriver command and write the records as JSON lines to PATH"
+    )
+    parser.addoption(
+        "--page-performance",
+        action="store_true",
+        default=False,
+        help="Measure navigation/paint/resource timings, LCP and CLS of every page load and enforce the budgets"
+    )
+    parser.addoption(
+        "--performance-dir",
+        action="store",
+        default=PerformanceStore.DEFAULT_DIR,
+        help="Directory for per-run page performance samples. Default: reports/performance"
+    )
 
 
 def pytest_configure(config):
@@ -73,44 +198,332 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "navigation: Navigation tests"
     )
+    config.addinivalue_line(
+        "markers", "matrix(name): parametrize the case argument from test_data/matrices/<name>.yaml"
+    )
+    config.addinivalue_line(
+        "markers", "throttle(*profiles): emulate network/CPU profiles (3g, 4g, slow-cpu-4x) in Chromium via CDP"
+    )
+
+    setup_logging()
+
+    # Settings are computed once on the controller and handed to xdist workers as a dict
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None and "settings" in workerinput:
+        configure(Settings.from_dict(workerinput["settings"]))
+    else:
+        try:
+            configure(load_settings(config.getoption("--profile"), {"browser": {
+                "name": config.getoption("--browser"),
+                "headless": config.getoption("--headless"),
+                "slow_mode": config.getoption("--slow"),
+            }, "grid": {
+                "url": config.getoption("--grid-url"),
+                "prewarm": config.getoption("--grid-prewarm"),
+            }}))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+
+    global duration_history, matrix_loader, performance_monitor
+    matrix_loader = MatrixLoader(config.getoption("--matrix-dir"))
+    duration_history = DurationHistory(config.getoption("--durations-file"))
+    if config.getoption("--page-performance"):
+        performance_monitor = PerformanceMonitor(get_settings().budgets)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize 'case' from the test's YAML matrix; a browser axis also drives browser_name"""
+    marker = metafunc.definition.get_closest_marker("matrix")
+    if marker is None:
+        return
+    matrix = matrix_loader.load(marker.args[0])
+    ids, cases = [], []
+    for case_id, case in iter_cases(matrix):
+        ids.append(case_id)
+        cases.append(case)
+
+    if "browser" in matrix["axes"] and "browser_name" in metafunc.fixturenames:
+        default = get_settings().browser.name
+        browsers = [value_id(c["browser"]) if "browser" in c else default for c in cases]
+        metafunc.parametrize(("browser_name", "case"), list(zip(browsers, cases)), ids=ids)
+    else:
+        metafunc.parametrize("case", cases, ids=ids)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """Set up the run's shared health result; the site is probed only when a browser test first needs it"""
+    global health_result
+    config = session.config
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        if workerinput.get("health_dir"):
+            health_result = SharedHealthResult(workerinput["health_dir"])
+        return
+
+    if config.getoption("--health-gate") == "off" or config.option.collectonly:
+        return
+    health_result = SharedHealthResult(tempfile.mkdtemp(prefix="mb-health-"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the settings and health result to each xdist worker instead of recomputing them"""
+    node.workerinput["settings"] = get_settings().to_dict()
+    node.workerinput["health_dir"] = health_result.directory if health_result else None
+
+
+def pytest_runtest_logreport(report):
+    """Record per-test durations and browser resources (on the xdist controller this sees every worker's reports)"""
+    if duration_history is not None and not report.skipped:
+        duration_history.record(report.nodeid, report.duration)
+    if report.when == "teardown":
+        resources = dict(report.user_properties).get("browser_resources")
+        if resources:
+            resource_summaries.append((report.nodeid, resources))
+        commands = dict(report.user_properties).get("webdriver_commands")
+        if commands:
+            command_profiles.append((report.nodeid, commands))
+        for sample in dict(report.user_properties).get("page_performance", []):
+            performance_samples.setdefault(sample["page"], []).append(sample)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """
+    Kill leftover browser processes; on the controller persist duration history, command profiles and
+    page performance once, and fail the run when a page is over its performance budget
+    """
+    kill_processes(find_browser_leftovers())
+    if hasattr(session.config, "workerinput"):
+        return
+    if health_result is not None:
+        shutil.rmtree(health_result.directory, ignore_errors=True)
+    if duration_history is not None:
+        duration_history.save()
+    profile_path = session.config.getoption("--command-profile")
+    if profile_path and command_profiles:
+        write_records(profile_path, command_profiles)
+    if performance_samples:
+        budgets = get_settings().budgets
+        store = PerformanceStore(session.config.getoption("--performance-dir"))
+        store.save_run(datetime.now().strftime("%Y%m%d_%H%M%S"), performance_samples, budgets)
+        # Budgets are percentiles over the whole run's loads of a page, so they can only fail the run
+        over_budget = run_violations(performance_samples, budgets)
+        if over_budget:
+            logger.warning(f"Page performance budget exceeded: {over_budget}")
+            if session.exitstatus == pytest.ExitCode.OK:
+                session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def _format_metric(value, digits):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show page performance, the costliest WebDriver commands and the tests with the largest browser footprint"""
+    if command_profiles:
+        records = [record for _, commands in command_profiles for record in commands]
+        terminalreporter.section(f"webdriver commands ({len(records)} in {len(command_profiles)} tests)")
+        for line in format_table(summarize(records)):
+            terminalreporter.write_line(line)
+    if performance_samples:
+        budgets = get_settings().budgets
+        q = f"p{budgets.percentile:g}"
+        terminalreporter.section(f"page performance ({q} over repeated loads)")
+        terminalreporter.write_line(f"{'loads':>6} {'TTFB ms':>9} {'FCP ms':>9} {'LCP ms':>9} {'CLS':>7}  page")
+        for page, samples in sorted(performance_samples.items()):
+            summary = summarize_samples(samples, budgets.percentile)
+            cells = [_format_metric(summary[metric][q], digits)
+                     for metric, digits in (("ttfb_ms", 0), ("fcp_ms", 0), ("lcp_ms", 0), ("cls", 3))]
+            violations = budget_violations(samples, budgets)
+            if violations:
+                note = f"  OVER BUDGET: {'; '.join(violations)}"
+            elif len(samples) < budgets.min_samples:
+                note = f"  (budgets need {budgets.min_samples} loads)"
+            else:
+                note = ""
+            terminalreporter.write_line(
+                f"{summary['loads']:>6} {cells[0]:>9} {cells[1]:>9} {cells[2]:>9} {cells[3]:>7}  {page}{note}")
+    if not resource_summaries:
+        return
+    terminalreporter.section("browser resources (top 5 by peak RSS)")
+    top = sorted(resource_summaries, key=lambda entry: -entry[1].get("peak_rss_mb", 0))[:5]
+    for node_id, summary in top:
+        terminalreporter.write_line(
+            f"{summary.get('peak_rss_mb', 0):>8.1f} MB  {summary.get('avg_cpu_percent', 0):>6.1f}% CPU  "
+            f"{summary.get('peak_processes', 0):>3} procs  {summary.get('orphans_killed', 0)} orphans  {node_id}"
+        )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Apply impact selection, then duration-based sharding and ordering"""
+    _select_impacted_tests(config, items)
+    _apply_duration_scheduling(config, items)
+
+
+def _deselect(config, items, keep):
+    """Deselect items not in keep, preserving order"""
+    deselected = [item for item in items if item not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item in keep]
+    return deselected
+
+
+def _select_impacted_tests(config, items):
+    """Deselect tests not affected by changes since --impact-base"""
+    base = config.getoption("--impact-base")
+    if not base:
+        return
+
+    from src.utils.impact_analysis import ImpactAnalyzer
+    affected = ImpactAnalyzer(config.rootpath).build().affected_tests(base)
+    if affected is None:
+        logger.info(f"Framework files changed since {base} - running full suite")
+        return
+
+    keep = {item for item in items
+            if item.nodeid.split("[")[0] in affected or item.get_closest_marker("smoke")}
+    deselected = _deselect(config, items, keep)
+    logger.info(f"Impact selection since {base}: {len(items)} selected, {len(deselected)} deselected")
+
+
+def _apply_duration_scheduling(config, items):
+    """LPT sharding (--shard, xdist loadgroup) and slowest-first ordering from duration history"""
+    shard = config.getoption("--shard")
+    if shard:
+        try:
+            index, total = parse_shard(shard)
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+        by_id = {item.nodeid: item for item in items}
+        load, node_ids = duration_history.partition(list(by_id), total)[index - 1]
+        _deselect(config, items, {by_id[node_id] for node_id in node_ids})
+        logger.info(f"Shard {index}/{total}: {len(items)} tests, ~{load:.1f}s expected")
+
+    if config.getoption("--slowest-first"):
+        order = {node_id: i for i, node_id in
+                 enumerate(duration_history.order_slowest_first(item.nodeid for item in items))}
+        items.sort(key=lambda item: order[item.nodeid])
+
+    # Under --dist loadgroup each worker receives one LPT-balanced group
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput and config.getvalue("dist") == "loadgroup":
+        groups = duration_history.partition([item.nodeid for item in items], workerinput["workercount"])
+        group_of = {node_id: f"lpt{i}" for i, (_, node_ids) in enumerate(groups) for node_id in node_ids}
+        for item in items:
+            if not item.get_closest_marker("xdist_group"):
+                item.add_marker(pytest.mark.xdist_group(group_of[item.nodeid]))
 
 
 # ====================== FIXTURES ======================
 @pytest.fixture(scope="session")
 def browser_name(request):
-    """Get browser name from command-line option"""
-    return request.config.getoption("--browser")
+    """Get browser name from settings (--browser, MB_BROWSER__NAME or profile)"""
+    return get_settings().browser.name
 
 
 @pytest.fixture(scope="session")
 def headless(request):
-    """Get headless mode from command-line option"""
-    return request.config.getoption("--headless")
+    """Get headless mode from settings (--headless, MB_BROWSER__HEADLESS or profile)"""
+    return get_settings().browser.headless
 
 
 @pytest.fixture(scope="session")
 def slow_mode(request):
-    """Get slow mode value from command-line option"""
-    return request.config.getoption("--slow")
+    """Get slow mode value from settings (--slow, MB_BROWSER__SLOW_MODE or profile)"""
+    return get_settings().browser.slow_mode
+
+
+@pytest.fixture(scope="session")
+def site_health(request):
+    """
+    Site health, probed when the first browser test of the run needs it (--health-gate)
+
+    One HTTP request and one headless navigation, through the grid when one is configured. The result
+    is shared with every xdist worker; with --health-gate=abort a failed probe ends the session.
+
+    Returns:
+        dict with healthy and reason, or None when the gate is off
+    """
+    if health_result is None:
+        return None
+    from src.constants.locators import HomePageLocators
+    settings = get_settings()
+    gate = HealthGate(settings.urls.home, HomePageLocators.NAV_MENU, remote_url=settings.grid.url)
+    result = health_result.get(lambda: gate.check(settings.browser.name, headless=True), gate.max_duration())
+    if not result["healthy"] and request.config.getoption("--health-gate") == "abort":
+        pytest.exit(f"Site health gate failed: {result['reason']}", returncode=3)
+    return result
+
+
+@pytest.fixture(scope="session")
+def grid_sessions(site_health):
+    """
+    Worker-wide pool of grid sessions, or None when browsers run locally
+
+    Yields:
+        RemoteSessionPool: keep-alive connections and reusable sessions for the grid URL
+    """
+    settings = get_settings()
+    if not settings.grid.url or (site_health and not site_health["healthy"]):
+        yield None
+        return
+
+    pool = RemoteSessionPool(settings.grid.url, settings.grid.max_connections, settings.grid.max_session_uses)
+    pool.prewarm(settings.browser.name, settings.browser.headless, settings.grid.prewarm)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def session_state():
+    """
+    Worker-wide login cache, or None when no test account is configured (MB_AUTH__USERNAME)
+
+    Yields:
+        SessionStateCache: logs in on first use, then restores the encrypted snapshot into each browser
+    """
+    auth = get_settings().auth
+    if not auth.username:
+        yield None
+        return
+
+    from urllib.parse import urlsplit
+    from src.pages.login_page import LoginPage
+    cipher = SessionCipher(auth.secret) if auth.secret else None
+    store = SessionStateStore(auth.state_dir, cipher, auth.session_ttl)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    key = f"{auth.username}@{urlsplit(auth.login_url).hostname}_{worker}"
+    yield SessionStateCache(store, key, lambda driver: LoginPage(driver).login(auth.username, auth.password))
 
 
 @pytest.fixture
-def driver(browser_name, headless, slow_mode):
+def authenticated_driver(driver, session_state):
     """
-    Selenium WebDriver fixture
+    Driver logged in to the test account, restored from the session-state cache before any load()
 
-    Args:
-        browser_name: Browser to use (chrome, firefox, edge)
-        headless: Run in headless mode
-        slow_mode: Delay between actions (seconds)
+    Without a configured account (MB_AUTH__USERNAME / MB_AUTH__PASSWORD) the browser stays anonymous,
+    which the public markets pages allow.
 
     Yields:
-        WebDriver: Configured Selenium WebDriver instance
+        WebDriver: the driver fixture's browser with the account's cookies and web storage
     """
+    if session_state is None:
+        logger.info("No test account configured, running anonymously")
+    else:
+        session_state.restore(driver)
+    yield driver
 
-    logger.info(f"Starting {browser_name} browser")
-    logger.info(f"Headless mode: {headless}")
-    logger.info(f"Slow mode: {slow_mode}s")
+
+def _create_local_driver(browser_name, headless, settings):
+    """Start a local browser configured from the settings profile"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+    from src.drivers.driver_factory import DriverFactory
 
     # Chrome Configuration
     if browser_name.lower() == "chrome":
@@ -120,61 +533,183 @@ def driver(browser_name, headless, slow_mode):
         if headless:
             chrome_options.add_argument("--headless")
 
-        # Common options
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-popup-blocking")
+        # Common options from the settings profile
+        for argument in settings.browser.chrome_arguments:
+            chrome_options.add_argument(argument)
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        DriverFactory.enable_performance_log(chrome_options, "goog")
 
         # Set user agent
-        user_agent = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/120.0.0.0 Safari/537.36")
-        chrome_options.add_argument(f"user-agent={user_agent}")
+        chrome_options.add_argument(f"user-agent={settings.browser.user_agent}")
 
         # Initialize driver with ChromeDriverManager
         service = Service(ChromeDriverManager().install())
-        driver_instance = webdriver.Chrome(service=service, options=chrome_options)
+        return webdriver.Chrome(service=service, options=chrome_options)
 
     # Firefox Configuration
     elif browser_name.lower() == "firefox":
         firefox_options = webdriver.FirefoxOptions()
         if headless:
             firefox_options.add_argument("--headless")
-        driver_instance = webdriver.Firefox(options=firefox_options)
+        return webdriver.Firefox(options=firefox_options)
 
     # Edge Configuration
     elif browser_name.lower() == "edge":
         edge_options = webdriver.EdgeOptions()
         if headless:
             edge_options.add_argument("--headless")
-        driver_instance = webdriver.Edge(options=edge_options)
+        DriverFactory.enable_performance_log(edge_options, "ms")
+        return webdriver.Edge(options=edge_options)
+
+    raise ValueError(f"Unsupported browser: {browser_name}")
+
+
+def _collect_page_performance(request, driver_instance):
+    """Hand the page loads measured during the test to the report; budgets are checked at the end of the run"""
+    if performance_monitor is None:
+        return
+    performance_monitor.detach(driver_instance)
+    request.node.user_properties.append(("page_performance", performance_monitor.take()))
+
+
+def _attach_command_profile(request, profiler):
+    """Hand the test's WebDriver command records to the report and to allure"""
+    if profiler is None:
+        return
+    records = profiler.stop()
+    request.node.user_properties.append(("webdriver_commands", records))
+    allure.attach("\n".join(format_table(summarize(records))), name="WebDriver commands",
+                  attachment_type=allure.attachment_type.TEXT)
+
 
+@pytest.fixture
+def driver(request, browser_name, headless, slow_mode, site_health, grid_sessions):
+    """
+    Selenium WebDriver fixture
+
+    Args:
+        request: Pytest request, used to attach the browser resource summary
+        browser_name: Browser to use (chrome, firefox, edge)
+        headless: Run in headless mode
+        slow_mode: Delay between actions (seconds)
+        site_health: Result of the run's health probe; browser tests are skipped when the site is down
+        grid_sessions: Grid session pool; when set, sessions are borrowed and reset instead of started
+
+    Yields:
+        WebDriver: Configured Selenium WebDriver instance
+    """
+
+    if site_health and not site_health["healthy"]:
+        pytest.skip(f"Site health gate failed: {site_health['reason']}")
+
+    throttle = request.node.get_closest_marker("throttle")
+    throttling = resolve_profiles(throttle.args) if throttle else None
+    if throttling and browser_name.lower() not in CHROMIUM_BROWSERS:
+        pytest.skip(f"Throttling '{throttling.name}' needs Chrome or Edge, not {browser_name}")
+
+    settings = get_settings()
+    logger.info(f"Starting {browser_name} browser (profile: {settings.profile})")
+    logger.info(f"Headless mode: {headless}")
+    logger.info(f"Slow mode: {slow_mode}s")
+
+    if grid_sessions:
+        driver_instance = grid_sessions.acquire(browser_name, headless)
     else:
-        raise ValueError(f"Unsupported browser: {browser_name}")
+        driver_instance = _create_local_driver(browser_name, headless, settings)
 
-    # Set implicit wait
-    driver_instance.implicitly_wait(10)
-    driver_instance.set_page_load_timeout(30)
+    # Set implicit wait and page/script timeouts
+    driver_instance.implicitly_wait(settings.timeouts.implicit)
+    driver_instance.set_page_load_timeout(settings.timeouts.page_load)
+    driver_instance.set_script_timeout(settings.timeouts.script)
 
-    # Set slow mode if specified
+    # Slow mode delays every action, so scripts get that much longer on top of the profile's timeout
     if slow_mode > 0:
         logger.info(f"Enabling slow mode: {slow_mode}s delay")
-        driver_instance.set_script_timeout(slow_mode * 2)
+        driver_instance.set_script_timeout(settings.timeouts.script + slow_mode * 2)
+
+    if throttling:
+        apply_throttling(driver_instance, throttling)
+        request.node.user_properties.append(("throttling", throttling.to_dict()))
+        allure.dynamic.parameter("throttling", throttling.name)
+        allure.dynamic.tag(f"throttle:{throttling.name}")
 
     logger.info(f"{browser_name.capitalize()} driver initialized successfully")
+    profiler = CommandProfiler(driver_instance).start() if request.config.getoption("--command-profile") else None
+    if performance_monitor:
+        performance_monitor.attach(driver_instance)
+
+    if grid_sessions:
+        yield driver_instance
+        _attach_command_profile(request, profiler)
+        _collect_page_performance(request, driver_instance)
+        # The browser process lives on the grid node; reset the session and keep it for the next test
+        grid_sessions.release(driver_instance, browser_name, headless)
+        logger.info(f"{browser_name.capitalize()} grid session released")
+        return
+
+    # Sample CPU/RSS of the driver service + browser process tree
+    interval = request.config.getoption("--resource-interval")
+    driver_pid = get_driver_pid(driver_instance)
+    monitor = ProcessTreeMonitor(driver_pid, interval).start() if interval > 0 and driver_pid else None
 
     yield driver_instance
 
     # Cleanup
+    _attach_command_profile(request, profiler)
+    _collect_page_performance(request, driver_instance)
     logger.info(f"Closing {browser_name} browser")
+    summary = monitor.stop() if monitor else None
     driver_instance.quit()
     logger.info(f"{browser_name.capitalize()} driver closed")
 
+    if monitor:
+        summary["orphans_killed"] = len(monitor.reap())
+        logger.info(f"Browser resources: {summary}")
+        request.node.user_properties.append(("browser_resources", summary))
+        allure.attach(json.dumps(summary, indent=2), name="Browser resources",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture
+def content_check(request, driver):
+    """
+    Fingerprint every page visited through BasePage.navigate_to_url, plus the last page open
+
+    Fails the test at teardown if a page's text drifted from its stored baseline
+
+    Yields:
+        ContentMonitor: call capture(driver) to check pages reached by clicks
+    """
+    store = ContentBaselineStore(request.config.getoption("--content-baselines"))
+    monitor = ContentMonitor(store, request.config.getoption("--update-content-baselines")).attach(driver)
+    yield monitor
+    monitor.detach(driver)
+    rep_call = getattr(request.node, "rep_call", None)
+    if rep_call is not None and rep_call.passed:
+        monitor.capture(driver)
+        monitor.verify()
+
+
+@pytest.fixture
+def visual_check(request, driver):
+    """
+    Element screenshot comparator; fails the test at teardown if any compared element changed
+
+    Yields:
+        VisualComparator: call compare(name, png) for each element
+    """
+    store = VisualBaselineStore(request.config.getoption("--visual-baselines"))
+    update_baselines = request.config.getoption("--update-visual-baselines")
+    if store.is_empty() and not update_baselines:
+        pytest.skip(f"No visual baselines in {store.directory}; record them with --update-visual-baselines")
+    comparator = VisualComparator(store, update_baselines)
+    yield comparator
+    request.node.user_properties.append(("visual_checks", list(comparator.results.values())))
+    rep_call = getattr(request.node, "rep_call", None)
+    if rep_call is not None and rep_call.passed:
+        comparator.verify()
+
 
 @pytest.fixture
 def wait(driver):
@@ -182,9 +717,10 @@ def wait(driver):
     WebDriverWait fixture for explicit waits
 
     Yields:
-        WebDriverWait: Configured wait object with 10s timeout
+        WebDriverWait: Configured wait object with the profile's explicit timeout
     """
-    return WebDriverWait(driver, 10)
+    from selenium.webdriver.support.ui import WebDriverWait
+    return WebDriverWait(driver, get_settings().timeouts.explicit)
 
 
 @pytest.fixture(autouse=True)
@@ -206,6 +742,7 @@ def pytest_runtest_makereport(item, call):
     """Take screenshot on test failure"""
     outcome = yield
     rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
 
     if rep.failed and call.when == "call":
         if hasattr(item, "funcargs") and "driver" in item.funcargs:
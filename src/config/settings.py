@@ -0,0 +1,225 @@
+import dataclasses
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from src.utils.lazy_import import lazy_import
+
+yaml = lazy_import("yaml")
+
+PROFILES_DIR = Path(__file__).resolve().parents[2] / "config" / "profiles"
+ENV_PREFIX = "MB_"
+DEFAULT_PROFILE = "local"
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """All waits in seconds"""
+
+    implicit: float = 10
+    page_load: float = 30
+    script: float = 30
+    explicit: float = 10
+    short: float = 5
+    long: float = 20
+    http: float = 5
+    probe: float = 15
+
+
+@dataclass(frozen=True)
+class BrowserSettings:
+    """Browser selection and launch flags"""
+
+    name: str = "chrome"
+    headless: bool = False
+    slow_mode: float = 0
+    performance_log: bool = False
+    user_agent: str = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                       "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    chrome_arguments: tuple = (
+        "--disable-blink-features=AutomationControlled",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--start-maximized",
+        "--disable-extensions",
+        "--disable-popup-blocking",
+    )
+
+
+@dataclass(frozen=True)
+class GridSettings:
+    """Remote WebDriver grid; an empty url runs browsers locally"""
+
+    url: str = ""
+    max_connections: int = 8
+    prewarm: int = 0
+    max_session_uses: int = 50
+
+
+@dataclass(frozen=True)
+class PerformanceBudgets:
+    """Page-performance budgets, checked on the percentile of repeated loads of a page; 0 disables one"""
+
+    percentile: float = 95
+    # Loads of a page needed before its percentile means anything
+    min_samples: int = 5
+    ttfb_ms: float = 800
+    fcp_ms: float = 1800
+    lcp_ms: float = 2500
+    cls: float = 0.1
+
+
+@dataclass(frozen=True)
+class AuthSettings:
+    """Test account and session-state cache; an empty username disables authenticated tests"""
+
+    login_url: str = ""
+    username: str = ""
+    password: str = ""
+    secret: str = ""
+    session_ttl: float = 3600
+    state_dir: str = ".auth"
+
+
+@dataclass(frozen=True)
+class Urls:
+    """Entry points of the pages under test"""
+
+    home: str = "https://trade.multibank.io/"
+    about: str = "https://trade.multibank.io/about"
+    trading: str = "https://trade.multibank.io/markets"
+    why_multibank: str = "https://multibank.io/about/why-multibank"
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Session configuration: defaults < YAML profile < environment/.env < CLI options"""
+
+    profile: str = DEFAULT_PROFILE
+    timeouts: Timeouts = field(default_factory=Timeouts)
+    browser: BrowserSettings = field(default_factory=BrowserSettings)
+    grid: GridSettings = field(default_factory=GridSettings)
+    budgets: PerformanceBudgets = field(default_factory=PerformanceBudgets)
+    auth: AuthSettings = field(default_factory=AuthSettings)
+    urls: Urls = field(default_factory=Urls)
+
+    def to_dict(self):
+        """Plain dict, e.g. to hand the session's settings to xdist workers"""
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build settings from a nested dict, converting strings from YAML/env to each field's type
+
+        Raises:
+            ValueError: unknown key or value of the wrong type
+        """
+        return _build(cls, data, "")
+
+
+def _build(cls, data, prefix):
+    fields = {f.name: f for f in dataclasses.fields(cls)}
+    unknown = set(data) - set(fields)
+    if unknown:
+        raise ValueError(f"Unknown setting(s): {', '.join(prefix + name for name in sorted(unknown))}")
+    values = {}
+    for name, value in data.items():
+        field_type = fields[name].type
+        if dataclasses.is_dataclass(field_type):
+            if not isinstance(value, dict):
+                raise ValueError(f"Setting {prefix}{name} must be a mapping")
+            values[name] = _build(field_type, value, f"{prefix}{name}.")
+        else:
+            values[name] = _convert(field_type, value, prefix + name)
+    return cls(**values)
+
+
+def _convert(field_type, value, name):
+    try:
+        if field_type is bool and isinstance(value, str):
+            if value.lower() not in ("1", "0", "true", "false", "yes", "no", "on", "off"):
+                raise ValueError(value)
+            return value.lower() in ("1", "true", "yes", "on")
+        if field_type is tuple:
+            return tuple(v.strip() for v in value.split(",") if v.strip()) if isinstance(value, str) else tuple(value)
+        return field_type(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Setting {name} expects {field_type.__name__}, got {value!r}") from None
+
+
+def _merge(base, override):
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _from_environment(environ):
+    """MB_TIMEOUTS__PAGE_LOAD=60 -> {"timeouts": {"page_load": "60"}}"""
+    data = {}
+    for key, value in environ.items():
+        if not key.startswith(ENV_PREFIX) or key == f"{ENV_PREFIX}PROFILE":
+            continue
+        path = key[len(ENV_PREFIX):].lower().split("__")
+        node = data
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = value
+    return data
+
+
+def available_profiles(profiles_dir=PROFILES_DIR):
+    return sorted(p.stem for p in Path(profiles_dir).glob("*.yaml"))
+
+
+def load_settings(profile=None, overrides=None, env_file=".env", profiles_dir=PROFILES_DIR, environ=None):
+    """
+    Merge defaults, the YAML profile, MB_* environment variables (.env included) and CLI overrides
+
+    Args:
+        profile: Profile name; default MB_PROFILE or "local"
+        overrides: Nested dict of CLI values; None values are ignored
+        env_file: .env file loaded into the environment without replacing set variables
+
+    Raises:
+        ValueError: unknown profile or invalid setting
+    """
+    if environ is None:
+        if env_file and os.path.exists(env_file):
+            from dotenv import load_dotenv
+            load_dotenv(env_file, override=False)
+        environ = os.environ
+
+    profile = profile or environ.get(f"{ENV_PREFIX}PROFILE") or DEFAULT_PROFILE
+    profile_file = Path(profiles_dir) / f"{profile}.yaml"
+    if not profile_file.exists():
+        raise ValueError(f"Unknown profile '{profile}', available: {available_profiles(profiles_dir)}")
+
+    data = {"profile": profile}
+    _merge(data, yaml.safe_load(profile_file.read_text(encoding="utf-8")) or {})
+    _merge(data, _from_environment(environ))
+    _merge(data, _drop_none(overrides or {}))
+    return Settings.from_dict(data)
+
+
+def _drop_none(data):
+    return {k: _drop_none(v) if isinstance(v, dict) else v for k, v in data.items() if v is not None}
+
+
+_current = None
+
+
+def configure(settings):
+    """Make settings the session-wide configuration"""
+    global _current
+    _current = settings
+    return settings
+
+
+def get_settings():
+    """Get the session configuration, loading defaults if conftest has not configured one"""
+    if _current is None:
+        configure(load_settings())
+    return _current
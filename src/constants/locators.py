@@ -27,6 +27,7 @@ class HomePageLocators:
     # Marketing Banners
     MARKETING_BANNER = (By.CSS_SELECTOR, ".slick-slide.slick-current img.style_image__kiucM")#(By.XPATH, "//img[contains(@class,'style_image__kiucM')]")
     BANNER_CONTAINER = (By.ID, "banner-container")
+    BANNER_SLIDER = (By.XPATH, "//div[contains(@class,'slick-slider')][.//img[contains(@class,'style_image__kiucM')]]")
 
     # Download Section
     DOWNLOAD_SECTION = (By.XPATH, "//div[contains(@class,'style_app-download-container')]")
@@ -46,6 +47,8 @@ class TradingPageLocators:
     TRADING_PAIRS_LIST = (By.CLASS_NAME, "pairs-list")
     PAIR_ITEM = (By.CLASS_NAME, "pair-item")
     PAIR_SYMBOL = (By.CLASS_NAME, "pair-symbol")
+    PAIR_PRICE = (By.CLASS_NAME, "pair-price")
+    PAIR_CHANGE = (By.CLASS_NAME, "pair-change")
     PAIR_VOLUME = (By.CLASS_NAME, "pair-volume")
     PAIR_PRICE_CHART = (By.CLASS_NAME, "price-chart")
 
@@ -57,6 +60,14 @@ class TradingPageLocators:
     STOCKS_TAB = (By.XPATH, "//button[@data-category='stocks']")
 
 
+class LoginPageLocators:
+    """Locators for Login Page"""
+
+    USERNAME_INPUT = (By.CSS_SELECTOR, "input[name='username'], input[name='email'], input[type='email']")
+    PASSWORD_INPUT = (By.CSS_SELECTOR, "input[type='password']")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+
+
 class AboutPageLocators:
     """Locators for About Us Page"""
 
@@ -1,23 +1,38 @@
 import os
 import sys
 import shutil
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from src.utils.lazy_import import lazy_import
+from src.utils.resource_monitor import get_driver_pid, get_process_tree, kill_processes
+from src.drivers.remote_grid import remote_connection
+from src.utils.throttling import CHROMIUM_BROWSERS, apply_throttling, resolve_profiles
+from src.config.settings import get_settings
+
+# Selenium and the webdriver managers are imported when the first driver is created
+webdriver = lazy_import("selenium.webdriver")
 
 
 class DriverFactory:
     """Factory for creating WebDriver instances"""
 
+    # Drivers created outside the driver fixture keep their historical 5s implicit wait;
+    # a profile can only lower it (perf sets 0). The fixture applies timeouts.implicit itself.
+    IMPLICIT_WAIT = 5
+
+    # Flags factory-made Chrome always had on top of the profile's chrome_arguments
+    CHROME_ARGUMENTS = ("--disable-gpu", "--disable-plugins")
+
     @staticmethod
-    def create_driver(browser="chrome", headless=False, remote_url=None):
+    def chrome_arguments():
+        """Chrome launch flags: the profile's, then the factory's own, without duplicates"""
+        return tuple(dict.fromkeys(get_settings().browser.chrome_arguments + DriverFactory.CHROME_ARGUMENTS))
+
+    @staticmethod
+    def implicit_wait():
+        """Implicit wait for a newly created driver, in seconds"""
+        return min(DriverFactory.IMPLICIT_WAIT, get_settings().timeouts.implicit)
+
+    @staticmethod
+    def create_driver(browser="chrome", headless=False, remote_url=None, connection_pool=None, throttling=()):
         """
         Create and return WebDriver instance
 
@@ -25,30 +40,40 @@ class DriverFactory:
             browser: Browser type (chrome, firefox, edge)
             headless: Run in headless mode
             remote_url: Remote WebDriver URL for grid execution
+            connection_pool: GridConnectionPool to share keep-alive connections to remote_url
+            throttling: Names of network/CPU emulation profiles to apply (Chromium only), e.g. ("3g",)
 
         Returns:
             WebDriver instance
         """
         print(f"Creating {browser} WebDriver instance (headless={headless})")
 
-        if remote_url:
-            return DriverFactory._create_remote_driver(browser, remote_url)
-
         browser_lower = browser.lower() if browser else "chrome"
+        profile = resolve_profiles(throttling) if throttling else None
+        if profile and browser_lower not in CHROMIUM_BROWSERS:
+            raise ValueError(f"Throttling needs a Chromium browser, not {browser}")
 
-        if browser_lower == "chrome":
-            return DriverFactory._create_chrome_driver(headless)
+        if remote_url:
+            driver = DriverFactory._create_remote_driver(browser, remote_url, headless, connection_pool)
+        elif browser_lower == "chrome":
+            driver = DriverFactory._create_chrome_driver(headless)
         elif browser_lower == "firefox":
-            return DriverFactory._create_firefox_driver(headless)
+            driver = DriverFactory._create_firefox_driver(headless)
         elif browser_lower == "edge":
-            return DriverFactory._create_edge_driver(headless)
+            driver = DriverFactory._create_edge_driver(headless)
         else:
             raise ValueError(f"Unsupported browser: {browser}")
 
+        if profile:
+            apply_throttling(driver, profile)
+            print(f"✓ Throttling applied: {profile.name}")
+        return driver
+
     @staticmethod
     def _get_chrome_driver_path():
         """Get ChromeDriver executable path with robust validation (Windows-safe)."""
         try:
+            from webdriver_manager.chrome import ChromeDriverManager
             driver_path = ChromeDriverManager().install()
             if driver_path and os.path.isfile(driver_path):
                 lower = driver_path.lower()
@@ -105,27 +130,22 @@ class DriverFactory:
     @staticmethod
     def _create_chrome_driver(headless=False):
         """Create Chrome WebDriver with better error handling"""
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.chrome.service import Service as ChromeService
         try:
             options = ChromeOptions()
 
-            # Basic options
-            options.add_argument("--start-maximized")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
+            # Launch flags come from the active settings profile plus the factory defaults
+            for argument in DriverFactory.chrome_arguments():
+                options.add_argument(argument)
 
             # Stability options
-            options.add_argument("--disable-blink-features=AutomationControlled")
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
 
-            # Performance options
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-plugins")
-            options.add_argument("--disable-popup-blocking")
-
             if headless:
                 options.add_argument("--headless=new")
+            DriverFactory.enable_performance_log(options, "goog")
 
             # Set download directory
             download_dir = os.path.join(os.getcwd(), "downloads")
@@ -149,7 +169,7 @@ class DriverFactory:
                 service = ChromeService()
 
             driver = webdriver.Chrome(service=service, options=options)
-            driver.implicitly_wait(5)
+            driver.implicitly_wait(DriverFactory.implicit_wait())
 
             print("✓ Chrome WebDriver created successfully")
             return driver
@@ -166,6 +186,8 @@ class DriverFactory:
     @staticmethod
     def _create_firefox_driver(headless=False):
         """Create Firefox WebDriver"""
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium.webdriver.firefox.service import Service as FirefoxService
         try:
             options = FirefoxOptions()
 
@@ -183,13 +205,14 @@ class DriverFactory:
             options.set_preference("browser.download.dir", download_dir)
 
             try:
+                from webdriver_manager.firefox import GeckoDriverManager
                 driver_path = GeckoDriverManager().install()
                 service = FirefoxService(driver_path)
             except Exception:
                 service = FirefoxService()
 
             driver = webdriver.Firefox(service=service, options=options)
-            driver.implicitly_wait(5)
+            driver.implicitly_wait(DriverFactory.implicit_wait())
 
             print("✓ Firefox WebDriver created successfully")
             return driver
@@ -201,6 +224,8 @@ class DriverFactory:
     @staticmethod
     def _create_edge_driver(headless=False):
         """Create Edge WebDriver"""
+        from selenium.webdriver.edge.options import Options as EdgeOptions
+        from selenium.webdriver.edge.service import Service as EdgeService
         try:
             options = EdgeOptions()
 
@@ -210,6 +235,7 @@ class DriverFactory:
 
             if headless:
                 options.add_argument("--headless=new")
+            DriverFactory.enable_performance_log(options, "ms")
 
             # Set download directory
             download_dir = os.path.join(os.getcwd(), "downloads")
@@ -218,13 +244,14 @@ class DriverFactory:
             options.add_experimental_option("prefs", prefs)
 
             try:
+                from webdriver_manager.microsoft import EdgeChromiumDriverManager
                 driver_path = EdgeChromiumDriverManager().install()
                 service = EdgeService(driver_path)
             except Exception:
                 service = EdgeService()
 
             driver = webdriver.Edge(service=service, options=options)
-            driver.implicitly_wait(5)
+            driver.implicitly_wait(DriverFactory.implicit_wait())
 
             print("✓ Edge WebDriver created successfully")
             return driver
@@ -234,21 +261,57 @@ class DriverFactory:
             raise
 
     @staticmethod
-    def _create_remote_driver(browser, remote_url):
+    def enable_performance_log(options, vendor_prefix):
+        """Record DevTools events (e.g. WebSocket frames for WebSocketTap) when browser.performance_log is set"""
+        if get_settings().browser.performance_log:
+            options.set_capability(f"{vendor_prefix}:loggingPrefs", {"performance": "ALL"})
+
+    @staticmethod
+    def remote_options(browser, headless=False):
+        """Browser options for a grid session; Selenium 4 sends them as the session capabilities"""
+        browser_lower = browser.lower() if browser else "chrome"
+        if browser_lower == "chrome":
+            from selenium.webdriver.chrome.options import Options as ChromeOptions
+            options = ChromeOptions()
+            for argument in DriverFactory.chrome_arguments():
+                options.add_argument(argument)
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            if headless:
+                options.add_argument("--headless=new")
+            DriverFactory.enable_performance_log(options, "goog")
+        elif browser_lower == "firefox":
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            options = FirefoxOptions()
+            options.add_argument("--width=1920")
+            options.add_argument("--height=1080")
+            if headless:
+                options.add_argument("--headless")
+        elif browser_lower == "edge":
+            from selenium.webdriver.edge.options import Options as EdgeOptions
+            options = EdgeOptions()
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            if headless:
+                options.add_argument("--headless=new")
+            DriverFactory.enable_performance_log(options, "ms")
+        else:
+            raise ValueError(f"Unsupported browser: {browser}")
+        return options
+
+    @staticmethod
+    def _create_remote_driver(browser, remote_url, headless=False, connection_pool=None):
         """Create Remote WebDriver for Grid"""
         try:
-            capabilities = {
-                "browserName": browser.lower(),
-                "browserVersion": "latest",
-                "platformName": "linux"
-            }
-
-            driver = webdriver.Remote(
-                command_executor=remote_url,
-                desired_capabilities=capabilities
-            )
-
-            driver.implicitly_wait(5)
+            options = DriverFactory.remote_options(browser, headless)
+            capabilities = options.to_capabilities()
+            if connection_pool:
+                executor = connection_pool.connection_for(capabilities)
+            else:
+                executor = remote_connection(remote_url, capabilities)
+
+            driver = webdriver.Remote(command_executor=executor, options=options)
+
+            driver.implicitly_wait(DriverFactory.implicit_wait())
             print(f"✓ Remote WebDriver created: {remote_url}")
             return driver
 
@@ -258,10 +321,15 @@ class DriverFactory:
 
     @staticmethod
     def quit_driver(driver):
-        """Quit WebDriver safely"""
+        """Quit WebDriver safely and kill driver/browser processes that outlive it"""
+        processes = get_process_tree(get_driver_pid(driver)) if driver else []
         try:
             if driver:
                 driver.quit()
                 print("✓ WebDriver closed successfully")
         except Exception as e:
-            print(f"⚠ Error closing WebDriver: {str(e)}")
\ No newline at end of file
+            print(f"⚠ Error closing WebDriver: {str(e)}")
+        finally:
+            killed = kill_processes(processes)
+            if killed:
+                print(f"⚠ Killed {len(killed)} orphaned browser processes")
\ No newline at end of file
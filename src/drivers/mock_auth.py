@@ -0,0 +1,140 @@
+import json
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+SESSION_COOKIE = "mb_session"
+
+LOGIN_FORM = """<!doctype html>
+<html><body>
+<h1>Sign in</h1>{error}
+<form method="post" action="/login">
+  <input name="username" type="email" autocomplete="username">
+  <input name="password" type="password" autocomplete="current-password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+# The real site keeps part of its session client side; so does the stand-in
+LOGGED_IN = """<!doctype html>
+<html><body><script>
+localStorage.setItem("mb_user", {user});
+sessionStorage.setItem("mb_tab_token", {tab_token});
+location.replace("/");
+</script></body></html>"""
+
+HOME = """<!doctype html>
+<html><body>
+<h1 id="welcome">Welcome, {user}</h1>
+<p id="client-state"></p>
+<script>
+document.getElementById("client-state").textContent =
+    localStorage.getItem("mb_user") && sessionStorage.getItem("mb_tab_token") ? "storage restored" : "storage missing";
+</script>
+</body></html>"""
+
+
+class MockAuthServer:
+    """
+    Local stand-in for the site's login: a form, a session cookie and client-side storage
+
+    /login serves and accepts the form, / greets a logged-in user (redirects to /login otherwise),
+    /api/me answers 200 or 401. Counts logins so session-state reuse can be asserted.
+
+    Usage:
+        with MockAuthServer(username="trader@example.test", password="secret") as auth:
+            LoginPage(driver).login(...)  # with MB_AUTH__LOGIN_URL=auth.login_url
+    """
+
+    def __init__(self, username="trader@example.test", password="secret", session_ttl=3600):
+        self.username = username
+        self.password = password
+        self.session_ttl = session_ttl
+        self.sessions = {}
+        self.logins = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self):
+        return f"{self.url}/login"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def user_for(self, cookie_header):
+        """User of a valid session cookie in a Cookie header, else None"""
+        for part in (cookie_header or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                user, expires = self.sessions.get(value, (None, 0))
+                return user if expires > time.time() else None
+        return None
+
+    def handle(self, method, path, headers, body):
+        """Return (status, headers, content type, body) for one request"""
+        user = self.user_for(headers.get("Cookie"))
+        if path == "/login" and method == "POST":
+            form = parse_qs(body.decode("utf-8"))
+            if form.get("username") != [self.username] or form.get("password") != [self.password]:
+                return 401, {}, "text/html", LOGIN_FORM.format(error='<p class="error-message">Invalid credentials</p>')
+            token = secrets.token_urlsafe(16)
+            with self._lock:
+                self.sessions[token] = (self.username, time.time() + self.session_ttl)
+                self.logins += 1
+            cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax; Max-Age={int(self.session_ttl)}"
+            return 200, {"Set-Cookie": cookie}, "text/html", LOGGED_IN.format(
+                user=json.dumps(self.username), tab_token=json.dumps(secrets.token_hex(8)))
+        if path == "/login":
+            return 200, {}, "text/html", LOGIN_FORM.format(error="")
+        if path == "/api/me":
+            if user is None:
+                return 401, {}, "application/json", json.dumps({"error": "not authenticated"})
+            return 200, {}, "application/json", json.dumps({"user": user})
+        if path == "/robots.txt":
+            return 200, {}, "text/plain", "User-agent: *\nDisallow:\n"
+        if path == "/":
+            if user is None:
+                return 302, {"Location": "/login"}, "text/html", ""
+            return 200, {}, "text/html", HOME.format(user=user)
+        return 404, {}, "text/plain", "not found"
+
+
+def _handler_for(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, content_type, text = server.handle(
+                self.command, self.path.split("?")[0], self.headers, body)
+            payload = text.encode("utf-8")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
@@ -0,0 +1,133 @@
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class MockGrid:
+    """
+    Local stand-in for a Selenium Grid speaking enough W3C WebDriver for session lifecycle tests
+
+    Counts TCP connections, sessions and commands so keep-alive and session reuse can be asserted.
+    Every element lookup succeeds; execute_script returns the script_results value whose key
+    occurs in the script (called first if it is callable), else null.
+
+    Usage:
+        with MockGrid(session_delay=0.2) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+    """
+
+    def __init__(self, session_delay=0.0, script_results=None):
+        self.session_delay = session_delay
+        self.script_results = {"document.readyState": "complete", "/* isDisplayed */": True, **(script_results or {})}
+        self.sessions = {}
+        self.connections = 0
+        self.sessions_created = 0
+        self.commands = []
+        self.cdp_commands = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/wd/hub"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, method, path, body):
+        """Return (status, value) for one WebDriver command"""
+        with self._lock:
+            self.commands.append((method, path))
+        if method == "POST" and path == "/session":
+            time.sleep(self.session_delay)
+            session_id = uuid.uuid4().hex
+            capabilities = dict(body.get("capabilities", {}).get("alwaysMatch", {}))
+            with self._lock:
+                self.sessions[session_id] = {"url": "about:blank", "handles": [uuid.uuid4().hex], "cookies": []}
+                self.sessions_created += 1
+            return 200, {"sessionId": session_id, "capabilities": capabilities}
+
+        match = re.match(r"/session/([^/]+)(/.*)?$", path)
+        if not match or match.group(1) not in self.sessions:
+            return 404, {"error": "invalid session id", "message": f"No session for {path}", "stacktrace": ""}
+        session_id, command = match.group(1), match.group(2) or ""
+        session = self.sessions[session_id]
+
+        if method == "DELETE" and command == "":
+            with self._lock:
+                del self.sessions[session_id]
+            return 200, None
+        if command == "/url":
+            if method == "POST":
+                session["url"] = body["url"]
+                return 200, None
+            return 200, session["url"]
+        if command == "/title":
+            return 200, ""
+        if command == "/window/handles":
+            return 200, session["handles"]
+        if command == "/window":
+            return 200, session["handles"][0]
+        if command in ("/element", "/elements") and method == "POST":
+            element = {ELEMENT_KEY: uuid.uuid4().hex}
+            return 200, [element] if command == "/elements" else element
+        if command in ("/execute/sync", "/execute/async"):
+            script = body.get("script", "")
+            value = next((v for key, v in self.script_results.items() if key in script), None)
+            return 200, value() if callable(value) else value
+        if command == "/goog/cdp/execute":
+            with self._lock:
+                self.cdp_commands.append((body["cmd"], body["params"]))
+            return 200, {}
+        if command == "/cookie":
+            if method == "POST":
+                session["cookies"].append(body["cookie"])
+            elif method == "DELETE":
+                session["cookies"] = []
+            return 200, session["cookies"] if method == "GET" else None
+        return 200, None
+
+
+def _handler_for(grid):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            with grid._lock:
+                grid.connections += 1
+
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            body = json.loads(raw) if raw else {}
+            path = self.path[len("/wd/hub"):] if self.path.startswith("/wd/hub") else self.path
+            status, value = grid.handle(self.command, path.rstrip("/"), body)
+            payload = json.dumps({"value": value}).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_DELETE = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
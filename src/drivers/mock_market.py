@@ -0,0 +1,195 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASES = ("BTC", "ETH", "SOL", "XRP", "ADA", "DOGE", "DOT", "LTC", "AVAX", "LINK", "ATOM", "UNI", "XLM", "TRX")
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Markets</title></head><body>
+<section id="spot-trading">
+  <div class="category-tabs">{tabs}</div>
+  <div class="pairs-list">
+{rows}
+  </div>
+</section>
+<script id="pairs-data" type="application/json">{pairs}</script>
+<script>
+const RENDER_DELAY_MS = {render_delay_ms};
+const pairs = JSON.parse(document.getElementById("pairs-data").textContent);
+const list = document.querySelector(".pairs-list");
+const compact = v => v >= 1e9 ? (v / 1e9).toFixed(2) + "B" : v >= 1e6 ? (v / 1e6).toFixed(2) + "M"
+    : v >= 1e3 ? (v / 1e3).toFixed(2) + "K" : v.toFixed(2);
+const cellsOf = p => ["$" + p.price.toFixed(2), (p.change >= 0 ? "+" : "") + p.change.toFixed(2) + "%", compact(p.volume)];
+let rowByIndex = new Map([...list.querySelectorAll(".pair-item")].map(row => [Number(row.dataset.index), row]));
+// A category switch re-renders the list after a simulated fetch, like the real site
+const render = category => {{
+    const rows = pairs.map((p, i) => [p, i]).filter(([p]) => p.category === category).map(([p, i]) => {{
+        const row = document.createElement("div");
+        row.className = "pair-item";
+        row.dataset.index = i;
+        for (const [name, text] of [["symbol", p.symbol], ...["price", "change", "volume"].map((n, k) => [n, cellsOf(p)[k]])]) {{
+            const cell = document.createElement("span");
+            cell.className = "pair-" + name;
+            cell.textContent = text;
+            row.appendChild(cell);
+        }}
+        return [i, row];
+    }});
+    list.replaceChildren(...rows.map(([, row]) => row));
+    rowByIndex = new Map(rows);
+}};
+document.querySelectorAll(".category-tab").forEach(tab => tab.addEventListener("click", () => {{
+    document.querySelectorAll(".category-tab").forEach(t => t.classList.toggle("active", t === tab));
+    setTimeout(() => render(tab.dataset.category), RENDER_DELAY_MS);
+}}));
+window.ticksApplied = 0;
+new EventSource("/ticks").onmessage = event => {{
+    for (const [i, price, change, volume] of JSON.parse(event.data)) {{
+        Object.assign(pairs[i], {{price, change, volume}});
+        const row = rowByIndex.get(i);
+        if (!row) continue;
+        const cells = row.children;
+        [cells[1].textContent, cells[2].textContent, cells[3].textContent] = cellsOf(pairs[i]);
+    }}
+    window.ticksApplied += 1;
+}};
+</script>
+</body></html>"""
+
+
+def compact(value):
+    """1234567 -> '1.23M', formatted like the page's script"""
+    for limit, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if value >= limit:
+            return f"{value / limit:.2f}{suffix}"
+    return f"{value:.2f}"
+
+
+class MockMarketServer:
+    """
+    Local markets page whose pairs list is updated by a stream of synthetic ticks
+
+    Serves / with pairs rows using the TradingPageLocators classes and /ticks as server-sent
+    events: ticks_per_second price/change/volume updates, sent in batches every batch_interval
+    seconds. The page starts with every pair listed; clicking a category tab re-renders the list
+    with that category's pairs after render_delay_ms. Deterministic for a given seed, so extraction
+    throughput and tab switching can be benchmarked offline.
+
+    Usage:
+        with MockMarketServer(pairs=500, ticks_per_second=2000) as market:
+            TradingPage(driver).load(market.url)
+    """
+
+    CATEGORIES = ("crypto", "forex", "metals", "stocks")
+
+    def __init__(self, pairs=200, ticks_per_second=100, batch_interval=0.01, seed=0, render_delay_ms=50):
+        rng = random.Random(seed)
+        self.symbols = [f"{BASES[i % len(BASES)]}{i // len(BASES) or ''}/USDT" for i in range(pairs)]
+        self.categories = [self.CATEGORIES[i % len(self.CATEGORIES)] for i in range(pairs)]
+        self.render_delay_ms = render_delay_ms
+        self.open = [rng.uniform(0.05, 50000) for _ in range(pairs)]
+        self.prices = list(self.open)
+        self.volumes = [rng.uniform(1e4, 5e9) for _ in range(pairs)]
+        self.ticks_per_second = ticks_per_second
+        self.batch_interval = batch_interval
+        self.ticks_sent = 0
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stopping.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def change(self, index):
+        return (self.prices[index] / self.open[index] - 1) * 100
+
+    def render_page(self):
+        with self._lock:
+            rows = "\n".join(
+                f'    <div class="pair-item" data-index="{i}"><span class="pair-symbol">{symbol}</span>'
+                f'<span class="pair-price">${self.prices[i]:.2f}</span>'
+                f'<span class="pair-change">{self.change(i):+.2f}%</span>'
+                f'<span class="pair-volume">{compact(self.volumes[i])}</span></div>'
+                for i, symbol in enumerate(self.symbols))
+            pairs = json.dumps([{"symbol": symbol, "category": self.categories[i], "price": self.prices[i],
+                                 "change": self.change(i), "volume": self.volumes[i]}
+                                for i, symbol in enumerate(self.symbols)])
+        tabs = "".join(f'<button class="category-tab" data-category="{c}">{c.title()}</button>'
+                       for c in self.CATEGORIES)
+        return PAGE.format(tabs=tabs, rows=rows, pairs=pairs.replace("</", "<\\/"),
+                           render_delay_ms=self.render_delay_ms)
+
+    def next_batch(self, count):
+        """Move count random pairs one tick; returns [[index, price, change, volume], ...]"""
+        batch = []
+        with self._lock:
+            for _ in range(count):
+                i = self._rng.randrange(len(self.symbols))
+                self.prices[i] *= 1 + self._rng.gauss(0, 0.002)
+                self.volumes[i] += self._rng.uniform(0, 1e4)
+                batch.append([i, round(self.prices[i], 2), round(self.change(i), 2), round(self.volumes[i], 2)])
+            self.ticks_sent += count
+        return batch
+
+    def stream(self, write):
+        """Write tick batches as server-sent events at the configured rate until the client leaves"""
+        started, sent = time.perf_counter(), 0
+        while not self._stopping.is_set():
+            due = int((time.perf_counter() - started) * self.ticks_per_second) - sent
+            if due > 0:
+                write(f"data: {json.dumps(self.next_batch(due))}\n\n".encode("utf-8"))
+                sent += due
+            time.sleep(self.batch_interval)
+
+
+def _handler_for(market):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if self.path.startswith("/ticks"):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                def write(data):
+                    self.wfile.write(data)
+                    self.wfile.flush()
+                try:
+                    market.stream(write)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                return
+            if self.path.split("?")[0] not in ("/", "/markets"):
+                self.send_error(404)
+                return
+            payload = market.render_page().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
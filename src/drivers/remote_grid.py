@@ -0,0 +1,209 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.lazy_import import lazy_import
+from src.utils.browser_state import clear_browser_state, history_origins, is_chromium, origin_of
+from src.utils.logger import log_debug, log_info, log_warning
+from src.utils.throttling import clear_throttling
+from src.config.settings import get_settings
+
+urllib3 = lazy_import("urllib3")
+
+# browserName -> vendor prefix of the Chromium command set (CDP, network conditions, casting)
+CHROMIUM_VENDOR_PREFIXES = {"chrome": "goog", "MicrosoftEdge": "ms"}
+
+
+def _connection_class(browser):
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+    from selenium.webdriver.firefox.remote_connection import FirefoxRemoteConnection
+    from selenium.webdriver.remote.remote_connection import RemoteConnection
+    from selenium.webdriver.safari.remote_connection import SafariRemoteConnection
+    # get_remote_connection never matches Chromium (its class-level browser_name is None),
+    # which would leave grid sessions without executeCdpCommand
+    if browser in CHROMIUM_VENDOR_PREFIXES:
+        return ChromiumRemoteConnection
+    return next((c for c in (FirefoxRemoteConnection, SafariRemoteConnection) if c.browser_name == browser),
+                RemoteConnection)
+
+
+@functools.lru_cache(maxsize=None)
+def _pooled_class(base):
+    """Subclass of a selenium RemoteConnection class that sends requests through a shared pool"""
+
+    class PooledConnection(base):
+        def __init__(self, *args, pool, **kwargs):
+            self._pool = pool
+            # session id -> origins opened with driver.get(), for RemoteSessionPool's reset
+            self.origins = {}
+            super().__init__(*args, **kwargs)
+
+        def _get_connection_manager(self):
+            return self._pool
+
+        def close(self):
+            # Remote.quit() closes its executor; the shared pool must outlive single sessions
+            pass
+
+        def execute(self, command, params):
+            if command == "get" and isinstance(params, dict):
+                origin = origin_of(params.get("url"))
+                if origin:
+                    self.origins.setdefault(params.get("sessionId"), set()).add(origin)
+            return super().execute(command, params)
+
+    PooledConnection.__name__ = PooledConnection.__qualname__ = f"Pooled{base.__name__}"
+    return PooledConnection
+
+
+def remote_connection(url, capabilities, keep_alive=True, pool=None):
+    """
+    RemoteConnection matching the browser, with the Chromium command set for Chrome and Edge
+
+    With a urllib3 pool, the connection sends its requests through that pool instead of its own.
+    """
+    browser = capabilities.get("browserName")
+    base = _connection_class(browser)
+    kwargs = {"keep_alive": keep_alive}
+    if browser in CHROMIUM_VENDOR_PREFIXES:
+        kwargs.update(vendor_prefix=CHROMIUM_VENDOR_PREFIXES[browser], browser_name=browser)
+    if pool is not None:
+        return _pooled_class(base)(url, pool=pool, **kwargs)
+    return base(url, **kwargs)
+
+
+class GridConnectionPool:
+    """Keep-alive HTTP connections to one grid endpoint, shared by every remote session of a worker"""
+
+    def __init__(self, url, maxsize=8):
+        self.url = url.rstrip("/")
+        timeout = urllib3.Timeout(connect=get_settings().timeouts.http, read=None)
+        self.pool = urllib3.PoolManager(maxsize=maxsize, block=False, timeout=timeout)
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def connection_for(self, capabilities):
+        """
+        Get the RemoteConnection for a browser, backed by the shared pool
+
+        One connection object per browser keeps vendor commands (e.g. Chromium CDP);
+        the session id travels with each command, so sessions can share it.
+        """
+        browser = capabilities.get("browserName")
+        with self._lock:
+            if browser not in self._connections:
+                self._connections[browser] = remote_connection(self.url, capabilities, pool=self.pool)
+            return self._connections[browser]
+
+    def pop_origins(self, session_id):
+        """Origins a session opened with driver.get() since the last call"""
+        with self._lock:
+            connections = list(self._connections.values())
+        return set().union(*(c.origins.pop(session_id, set()) for c in connections))
+
+    def close(self):
+        self.pool.clear()
+
+
+class RemoteSessionPool:
+    """
+    Remote sessions reused across tests: created in parallel, reset on release, quit at the end
+
+    A released Chrome/Edge session gets its throttling and extra windows removed, all cookies
+    cleared and the storage of every origin it opened cleared through CDP, so the next test
+    starts from about:blank without paying for a new grid session. Origins come from the
+    session's driver.get() calls plus the back/forward history of its windows. Other browsers
+    have no way to clear storage of origins they are not on, so their sessions are quit instead.
+    """
+
+    def __init__(self, url, max_connections=8, max_uses=50):
+        self.url = url
+        self.max_uses = max_uses
+        self.connections = GridConnectionPool(url, max_connections)
+        self._idle = {}
+        self._uses = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def _create(self, browser, headless):
+        from src.drivers.driver_factory import DriverFactory
+        driver = DriverFactory.create_driver(browser, headless=headless, remote_url=self.url,
+                                             connection_pool=self.connections)
+        with self._lock:
+            self.created += 1
+            self._uses[driver.session_id] = 0
+        return driver
+
+    def prewarm(self, browser, headless, count):
+        """Create count sessions concurrently and park them as idle"""
+        if count <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="grid-session") as executor:
+            drivers = list(executor.map(lambda _: self._create(browser, headless), range(count)))
+        with self._lock:
+            self._idle.setdefault((browser, headless), []).extend(drivers)
+        log_info(f"Pre-warmed {count} {browser} grid sessions")
+
+    def acquire(self, browser, headless):
+        """Get an idle session for browser/headless, or create one"""
+        with self._lock:
+            idle = self._idle.get((browser, headless))
+            driver = idle.pop() if idle else None
+            if driver is not None:
+                self.reused += 1
+        driver = driver or self._create(browser, headless)
+        with self._lock:
+            self._uses[driver.session_id] += 1
+        return driver
+
+    def release(self, driver, browser, headless):
+        """Reset the session and return it to the pool; quit it if the reset fails or it is worn out"""
+        if self._uses.get(driver.session_id, 0) >= self.max_uses or not self._reset(driver):
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle.setdefault((browser, headless), []).append(driver)
+
+    def _reset(self, driver):
+        origins = self.connections.pop_origins(driver.session_id)
+        if not is_chromium(driver):
+            log_debug(f"Grid session {driver.session_id} cannot have its storage cleared, quitting it")
+            return False
+        try:
+            clear_throttling(driver)
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                origins |= history_origins(driver)
+                origins.add(origin_of(driver.current_url))
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+            # sessionStorage belongs to the tab rather than the origin, so CDP does not reach it
+            driver.execute_script("try { sessionStorage.clear(); } catch (e) {}")
+            driver.get("about:blank")
+            clear_browser_state(driver, origins - {None})
+            driver.implicitly_wait(get_settings().timeouts.implicit)
+            return True
+        except Exception as e:
+            log_warning(f"Grid session {driver.session_id} could not be reset, quitting it: {e}")
+            return False
+
+    def _quit(self, driver):
+        with self._lock:
+            self._uses.pop(driver.session_id, None)
+        try:
+            driver.quit()
+        except Exception as e:
+            log_warning(f"Failed to quit grid session {driver.session_id}: {e}")
+
+    def close(self):
+        """Quit every idle session in parallel and close the connection pool"""
+        with self._lock:
+            drivers = [d for idle in self._idle.values() for d in idle]
+            self._idle.clear()
+        if drivers:
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                list(executor.map(self._quit, drivers))
+        self.connections.close()
+        log_info(f"Grid sessions: {self.created} created, {self.reused} reused")
@@ -1,13 +1,15 @@
 from src.pages.base_page import BasePage
 from src.constants.locators import AboutPageLocators
+from src.utils.dom_audit import DEFAULT_CHECKS
 from src.utils.logger import log_info
+from src.config.settings import get_settings
 import allure
 
 
 class AboutPage(BasePage):
     """About Us Page Object"""
 
-    PAGE_URL = "https://trade.multibank.io/about"
+    AUDIT_CHECKS = {**DEFAULT_CHECKS, "heading-order": {"rule": "heading-order", "main": AboutPageLocators.ABOUT_HEADER}}
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -15,7 +17,7 @@ class AboutPage(BasePage):
     def load(self):
         """Load about page"""
         with allure.step("Navigate to About Page"):
-            self.navigate_to_url(self.PAGE_URL)
+            self.navigate_to_url(get_settings().urls.about)
             self.verify_page_loaded()
 
     def verify_page_loaded(self):
@@ -35,6 +37,11 @@ class AboutPage(BasePage):
         self.verify_element_visible(AboutPageLocators.ABOUT_CONTENT)
         return self
 
+    @allure.step("Verify heading order")
+    def verify_heading_order(self):
+        """Verify the header is the page's only h1 and no heading level is skipped"""
+        return self.verify_accessibility("heading-order")
+
     @allure.step("Get about page title")
     def get_about_page_title(self):
         """Get about page title"""
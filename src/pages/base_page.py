@@ -3,16 +3,27 @@ from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from src.utils.logger import log_info, log_error, log_debug
 from src.utils.wait_helpers import WaitHelper
+from src.utils.lazy_element import LazyElement, ElementCache
+from src.utils.content_fingerprint import ContentMonitor
+from src.utils.dom_audit import DEFAULT_CHECKS, DomAuditor, violations
+from src.utils.page_performance import PerformanceMonitor
+from src.utils.scroll_engine import ScrollEngine
 import allure
 
 
 class BasePage:
     """Base class for all page objects"""
 
+    # Accessibility/DOM checks run by audit_accessibility; pages add scoped checks of their own
+    AUDIT_CHECKS = DEFAULT_CHECKS
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WaitHelper(driver)
+        self.scroller = ScrollEngine(driver, self.wait.timeouts)
         self.actions = ActionChains(driver)
+        self.element_cache = ElementCache.for_driver(driver)
+        self.auditor = DomAuditor(driver)
 
     def get_page_title(self):
         """Get page title"""
@@ -29,14 +40,22 @@ class BasePage:
     def navigate_to_url(self, url):
         """Navigate to specific URL"""
         log_info(f"Navigating to URL: {url}")
+        self.element_cache.invalidate()
         self.driver.get(url)
         self.wait.wait_for_page_load()
+        performance = PerformanceMonitor.for_driver(self.driver)
+        if performance:
+            performance.measure(self.driver)
+        monitor = ContentMonitor.for_driver(self.driver)
+        if monitor:
+            monitor.capture(self.driver)
 
     def click_element(self, locator):
         """Click on element"""
         try:
             element = self.wait.wait_for_element_clickable(locator)
             element.click()
+            self.element_cache.invalidate()
             log_info(f"Clicked element: {locator}")
         except Exception as e:
             log_error(f"Failed to click element {locator}: {str(e)}")
@@ -47,6 +66,7 @@ class BasePage:
         try:
             element = self.wait.wait_for_element_clickable(locator)
             element.click()
+            self.element_cache.invalidate()
             log_info(f"Clicked element: {locator}")
         except Exception as e:
             log_error(f"Failed to click element {locator}: {str(e)}")
@@ -57,6 +77,7 @@ class BasePage:
         try:
             element = self.wait.wait_for_element_visible(locator)
             self.driver.execute_script("arguments[0].click();", element)
+            self.element_cache.invalidate()
             log_info(f"Clicked element with JS: {locator}")
         except Exception as e:
             log_error(f"Failed to click element with JS {locator}: {str(e)}")
@@ -96,20 +117,26 @@ class BasePage:
             log_error(f"Failed to get attribute {attribute} from {locator}: {str(e)}")
             raise
 
-    def is_element_visible(self, locator, timeout=5):
+    def is_element_visible(self, locator, timeout=None):
         """Check if element is visible"""
         return self.wait.element_is_displayed(locator, timeout)
 
-    def is_element_present(self, locator, timeout=5):
+    def is_element_present(self, locator, timeout=None):
         """Check if element is present on page"""
         return self.wait.element_exists(locator, timeout)
 
     def get_elements(self, locator):
-        """Get all elements matching locator"""
+        """Get all elements matching locator as stale-resilient LazyElements"""
+        cached = self.element_cache.get(locator)
+        if cached is not None:
+            log_debug(f"Using {len(cached)} cached elements for: {locator}")
+            return list(cached)
         try:
-            elements = self.wait.wait_for_elements_visible(locator)
+            found = self.wait.wait_for_elements_visible(locator)
+            elements = [LazyElement(self.driver, locator, i, element) for i, element in enumerate(found)]
+            self.element_cache.put(locator, elements)
             log_info(f"Found {len(elements)} elements matching: {locator}")
-            return elements
+            return list(elements)
         except Exception as e:
             log_error(f"Failed to get elements {locator}: {str(e)}")
             raise
@@ -125,12 +152,12 @@ class BasePage:
             log_error(f"Failed to get element count for {locator}: {str(e)}")
             return 0
 
-    def scroll_to_element(self, locator):
-        """Scroll to element"""
+    def scroll_to_element(self, locator, timeout=None):
+        """Scroll in viewport steps until element is in view, letting lazy content render on the way"""
         try:
-            element = self.wait.wait_for_element_visible(locator)
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            element = self.scroller.scroll_to(locator, timeout)
             log_info(f"Scrolled to element: {locator}")
+            return element
         except Exception as e:
             log_error(f"Failed to scroll to element {locator}: {str(e)}")
             raise
@@ -167,17 +194,20 @@ class BasePage:
     def switch_to_new_window(self):
         """Switch to newly opened window"""
         main_window = self.driver.current_window_handle
+        self.element_cache.invalidate()
         self.driver.switch_to.window(self.driver.window_handles[-1])
         log_info("Switched to new window")
         return main_window
 
     def switch_to_window(self, window_handle):
         """Switch to specific window"""
+        self.element_cache.invalidate()
         self.driver.switch_to.window(window_handle)
         log_info(f"Switched to window: {window_handle}")
 
     def close_current_window(self):
         """Close current window"""
+        self.element_cache.invalidate()
         self.driver.close()
         log_info("Closed current window")
 
@@ -196,22 +226,43 @@ class BasePage:
         except Exception as e:
             log_error(f"Failed to take screenshot: {str(e)}")
 
+    def get_element_screenshot(self, locator):
+        """Get PNG bytes of a single visible element"""
+        element = self.wait.wait_for_element_visible(locator)
+        return element.screenshot_as_png
+
     def refresh_page(self):
         """Refresh current page"""
+        self.element_cache.invalidate()
         self.driver.refresh()
         self.wait.wait_for_page_load()
         log_info("Page refreshed")
 
     def go_back(self):
         """Navigate back"""
+        self.element_cache.invalidate()
         self.driver.back()
         log_info("Navigated back")
 
     def go_forward(self):
         """Navigate forward"""
+        self.element_cache.invalidate()
         self.driver.forward()
         log_info("Navigated forward")
 
+    @allure.step("Audit page accessibility")
+    def audit_accessibility(self):
+        """Evaluate AUDIT_CHECKS in one script call; unchanged pages reuse their cached findings"""
+        return self.auditor.audit(self.AUDIT_CHECKS)
+
+    def verify_accessibility(self, *checks):
+        """Verify the named AUDIT_CHECKS (all by default) found nothing"""
+        report = self.audit_accessibility()
+        failing = violations(report, checks)
+        assert not failing, f"Accessibility checks failed on {report['url']}: {failing}"
+        log_info(f"Accessibility checks passed: {', '.join(checks or report['findings'])}")
+        return report
+
     @allure.step("Verify element text: {text}")
     def verify_element_text(self, locator, expected_text):
         """Verify element contains expected text"""
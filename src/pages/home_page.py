@@ -1,21 +1,30 @@
+import json
 from src.pages.base_page import BasePage
 from src.constants.locators import HomePageLocators
+from src.utils.carousel import SlickCarousel
+from src.utils.dom_audit import DEFAULT_CHECKS
 from src.utils.logger import log_info
+from src.config.settings import get_settings
 import allure
 
 
 class HomePage(BasePage):
     """Home Page Object for MultiBank Trading Platform"""
 
-    PAGE_URL = "https://trade.multibank.io/"
+    AUDIT_CHECKS = {
+        **DEFAULT_CHECKS,
+        "banner-alt": {"rule": "img-alt", "scope": HomePageLocators.BANNER_SLIDER, "require_text": True},
+        "footer-link-name": {"rule": "link-name", "scope": HomePageLocators.FOOTER},
+    }
 
     def __init__(self, driver):
         super().__init__(driver)
+        self.carousel = SlickCarousel(driver, HomePageLocators.BANNER_SLIDER, self.wait.timeouts)
 
     def load(self):
         """Load home page"""
         with allure.step("Navigate to Home Page"):
-            self.navigate_to_url(self.PAGE_URL)
+            self.navigate_to_url(get_settings().urls.home)
             self.verify_page_loaded()
 
     def verify_page_loaded(self):
@@ -133,16 +142,41 @@ class HomePage(BasePage):
     # Marketing Banner Methods
     @allure.step("Verify marketing banners appear at bottom")
     def verify_marketing_banners_visible(self):
-        """Verify marketing banners are visible"""
-        self.scroll_to_bottom()
+        """Verify every banner slide has an image that loads, showing lazy slides programmatically"""
+        self.scroll_to_element(HomePageLocators.MARKETING_BANNER)
         self.verify_element_visible(HomePageLocators.MARKETING_BANNER)
-        log_info("Marketing banners are visible at bottom")
+        slides = self.carousel.slides()
+        pending = [slide["index"] for slide in slides if slide["state"] == "pending" or not slide["src"]]
+        if pending:
+            try:
+                loaded = {slide["index"]: slide for slide in (self.carousel.go_to(index) for index in pending)}
+            finally:
+                self.carousel.release()
+            slides = [loaded.get(slide["index"], slide) for slide in slides]
+        allure.attach(json.dumps(slides, indent=2), name="marketing_banner_slides",
+                      attachment_type=allure.attachment_type.JSON)
+        broken = [slide["index"] for slide in slides if slide["state"] != "loaded"]
+        assert slides, "No marketing banner slides found"
+        assert not broken, f"Marketing banner slides without a loaded image: {broken}"
+        log_info(f"{len(slides)} marketing banners are visible at bottom")
+        return self
+
+    @allure.step("Compare marketing banner slides with visual baselines")
+    def verify_marketing_banners_match_baseline(self, visual):
+        """Screenshot every banner slide, switched to directly instead of waiting on autoplay, and compare it"""
+        self.scroll_to_element(HomePageLocators.MARKETING_BANNER)
+        count = 0
+        for slide in self.carousel.visit_all():
+            png = self.get_element_screenshot(HomePageLocators.MARKETING_BANNER)
+            visual.compare(f"marketing_banner_{slide['index']}", png)
+            count += 1
+        log_info(f"Compared {count} marketing banner slides")
         return self
 
     @allure.step("Get marketing banners count")
     def get_marketing_banners_count(self):
-        """Get count of marketing banners"""
-        count = self.get_elements_count(HomePageLocators.MARKETING_BANNER)
+        """Get count of marketing banner slides, clones excluded"""
+        count = len(self.carousel.slides())
         return count
 
     # Download Section Methods
@@ -184,10 +218,22 @@ class HomePage(BasePage):
         return original_window
 
     # General Methods
+    @allure.step("Verify marketing banners have alt text")
+    def verify_banner_images_have_alt(self):
+        """Verify every banner slide image has a non-empty alt"""
+        self.scroll_to_element(HomePageLocators.BANNER_SLIDER)
+        return self.verify_accessibility("banner-alt")
+
+    @allure.step("Verify footer links have accessible names")
+    def verify_footer_links_named(self):
+        """Verify every footer link has an accessible name"""
+        self.scroll_to_element(HomePageLocators.FOOTER)
+        return self.verify_accessibility("footer-link-name")
+
     @allure.step("Verify footer exists")
     def verify_footer_exists(self):
         """Verify footer exists"""
-        self.scroll_to_bottom()
+        self.scroll_to_element(HomePageLocators.FOOTER)
         self.verify_element_present(HomePageLocators.FOOTER)
         return self
 
@@ -0,0 +1,35 @@
+from src.pages.base_page import BasePage
+from src.constants.locators import LoginPageLocators
+from src.utils.logger import log_info
+from src.config.settings import get_settings
+import allure
+
+
+class LoginPage(BasePage):
+    """Login Page Object; tests get its session through SessionStateCache instead of logging in themselves"""
+
+    def __init__(self, driver):
+        super().__init__(driver)
+
+    def load(self):
+        """Load login page"""
+        with allure.step("Navigate to Login Page"):
+            self.navigate_to_url(get_settings().auth.login_url)
+            self.verify_page_loaded()
+
+    def verify_page_loaded(self):
+        """Verify login page is loaded"""
+        self.verify_element_present(LoginPageLocators.PASSWORD_INPUT)
+        log_info("Login page loaded successfully")
+
+    @allure.step("Log in as {username}")
+    def login(self, username, password):
+        """Submit the login form and wait until the site navigates away from it"""
+        self.load()
+        login_url = self.get_page_url()
+        self.input_text(LoginPageLocators.USERNAME_INPUT, username)
+        self.input_text(LoginPageLocators.PASSWORD_INPUT, password)
+        self.click_element(LoginPageLocators.SUBMIT_BUTTON)
+        self.wait.wait_for_url_changes(login_url)
+        log_info(f"Logged in as {username}")
+        return self
@@ -0,0 +1,193 @@
+import json
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from src.pages.base_page import BasePage
+from src.constants.locators import TradingPageLocators
+from src.utils.market_table import EXTRACT_SCRIPT, MarketTable
+from src.utils.price_capture import PriceCapture
+from src.utils.scroll_engine import to_css_selector, to_js_locator
+from src.utils.tab_switch import SWITCH_SCRIPT, summarize_switches
+from src.utils.logger import log_info
+from src.config.settings import get_settings
+import allure
+
+# In-page extraction looks rows and cells up with querySelector, so it takes the locators as CSS
+PAIR_ROW = to_css_selector(TradingPageLocators.PAIR_ITEM)
+PAIRS_LIST = to_css_selector(TradingPageLocators.TRADING_PAIRS_LIST)
+PAIR_COLUMNS = {
+    "symbol": to_css_selector(TradingPageLocators.PAIR_SYMBOL),
+    "price": to_css_selector(TradingPageLocators.PAIR_PRICE),
+    "change": to_css_selector(TradingPageLocators.PAIR_CHANGE),
+    "volume": to_css_selector(TradingPageLocators.PAIR_VOLUME),
+}
+CATEGORY_TABS = {
+    "crypto": TradingPageLocators.CRYPTOCURRENCY_TAB,
+    "forex": TradingPageLocators.FOREX_TAB,
+    "metals": TradingPageLocators.METALS_TAB,
+    "stocks": TradingPageLocators.STOCKS_TAB,
+}
+
+
+class TradingPage(BasePage):
+    """Spot Trading Page Object; the pairs list is read as a MarketTable in a single script call"""
+
+    # Quiet period after the last re-render mutation before a tab switch counts as done
+    SWITCH_SETTLE_MS = 150
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.tab_switches = []
+
+    def load(self, url=None):
+        """Load trading page (url: e.g. a local MockMarketServer instead of the configured site)"""
+        with allure.step("Navigate to Trading Page"):
+            self.navigate_to_url(url or get_settings().urls.trading)
+            self.verify_page_loaded()
+
+    def verify_page_loaded(self):
+        """Verify trading page is loaded"""
+        self.verify_element_present(TradingPageLocators.TRADING_PAIRS_LIST)
+        log_info("Trading page loaded successfully")
+
+    def read_pairs(self):
+        """Snapshot of the whole pairs list: symbol, price, change and volume of every row"""
+        return MarketTable.from_columns(self.driver.execute_script(EXTRACT_SCRIPT, PAIR_ROW, PAIR_COLUMNS))
+
+    @allure.step("Verify spot trading section is visible")
+    def verify_trading_section_visible(self):
+        """Verify spot trading section is visible"""
+        self.verify_element_visible(TradingPageLocators.SPOT_TRADING_SECTION)
+        return self
+
+    @allure.step("Verify trading pairs are displayed")
+    def verify_trading_pairs_displayed(self):
+        """Verify the pairs list has rows"""
+        table = self.read_pairs()
+        assert len(table) > 0, "No trading pairs found"
+        log_info(f"Trading pairs displayed: {len(table)}")
+        return table
+
+    @allure.step("Verify trading pair structure")
+    def verify_trading_pair_structure(self):
+        """Verify every pair has a symbol and a numeric price"""
+        table = self.verify_trading_pairs_displayed()
+        incomplete = table.incomplete()
+        assert not incomplete, f"{len(incomplete)} trading pairs without symbol or price: {incomplete[:10]}"
+        log_info(f"Trading pair structure verified for {len(table)} pairs")
+        return table
+
+    @allure.step("Verify category tabs exist")
+    def verify_category_tabs_exist(self):
+        """Verify category tabs exist"""
+        count = self.get_elements_count(TradingPageLocators.CATEGORY_TAB)
+        assert count > 0, "No category tabs found"
+        log_info(f"Category tabs count: {count}")
+        return self
+
+    @allure.step("Verify prices update")
+    def verify_prices_update(self, timeout=None):
+        """
+        Diff snapshots until some pair moves
+
+        Returns:
+            TableDiff against the first snapshot
+        """
+        timeout = self.wait.timeouts.explicit if timeout is None else timeout
+        first = self.read_pairs()
+        diff = WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+            lambda driver: self.read_pairs().diff(first) or False,
+            message=f"No trading pair price changed within {timeout}s")
+        log_info(f"Prices updated: {diff}")
+        return diff
+
+    def capture_prices(self):
+        """Start recording every price change of the pairs list in the page"""
+        return PriceCapture(self.driver, PAIRS_LIST, PAIR_ROW, PAIR_COLUMNS["symbol"], PAIR_COLUMNS["price"]).start()
+
+    @allure.step("Verify prices tick for {duration}s")
+    def verify_prices_ticking(self, duration=5, min_ticking=1, max_staleness_ms=None):
+        """
+        Capture price changes for duration seconds and check update rate and staleness per symbol
+
+        Args:
+            min_ticking: Symbols that must update at least once
+            max_staleness_ms: Optional limit on the time since each ticking symbol's last update
+
+        Returns:
+            dict of symbol -> metrics (updates, rate_per_s, max_gap_ms, staleness_ms, last_price)
+        """
+        capture = self.capture_prices()
+        capture.collect(duration)
+        capture.stop()
+        metrics = capture.metrics()
+        allure.attach(json.dumps(metrics, indent=2), name="price_update_metrics",
+                      attachment_type=allure.attachment_type.JSON)
+        ticking = {symbol: m for symbol, m in metrics.items() if m["updates"]}
+        assert len(ticking) >= min_ticking, \
+            f"Only {len(ticking)} of {len(metrics)} symbols updated in {duration}s (expected {min_ticking})"
+        if max_staleness_ms is not None:
+            stale = sorted(symbol for symbol, m in ticking.items() if m["staleness_ms"] > max_staleness_ms)
+            assert not stale, f"Prices stale for more than {max_staleness_ms} ms: {stale[:10]}"
+        log_info(f"{len(ticking)}/{len(metrics)} symbols ticking, "
+                 f"{sum(m['updates'] for m in metrics.values())} updates in {duration}s")
+        return metrics
+
+    def switch_category(self, category, timeout=None):
+        """
+        Click a category tab and wait for the pairs list to re-render, timed in the page
+
+        A tab that is already selected is not clicked: its current list is returned with no
+        timings (first_change_ms and render_ms are None) and no switch is recorded.
+
+        Returns:
+            (MarketTable of the new list, timing dict: tab, first_change_ms, render_ms, rows)
+
+        Raises:
+            NoSuchElementException: tab or pairs list not in the page
+            TimeoutException: list did not re-render after clicking an unselected tab
+        """
+        timeout = self.wait.timeouts.explicit if timeout is None else timeout
+        result = self.driver.execute_async_script(
+            SWITCH_SCRIPT, *to_js_locator(CATEGORY_TABS[category]), PAIRS_LIST, PAIR_ROW, PAIR_COLUMNS,
+            self.SWITCH_SETTLE_MS, timeout * 1000)
+        if "error" in result:
+            raise NoSuchElementException(f"Category switch to '{category}': {result['error']}")
+        table = MarketTable.from_columns(result["table"])
+        if result.get("selected"):
+            log_info(f"'{category}' already selected: {len(table)} pairs listed")
+            return table, {"tab": category, "first_change_ms": None, "render_ms": None, "rows": len(table)}
+        if not result["changed"]:
+            raise TimeoutException(f"Pairs list did not re-render within {timeout}s after selecting '{category}'")
+        timing = {"tab": category, "first_change_ms": result["first_change_ms"], "render_ms": result["render_ms"],
+                  "rows": len(table)}
+        self.tab_switches.append(timing)
+        log_info(f"Switched to '{category}': {len(table)} pairs rendered in {timing['render_ms']:.0f} ms")
+        return table, timing
+
+    @allure.step("Verify category tabs filter the pairs list")
+    def verify_category_tabs_filter_list(self, categories=tuple(CATEGORY_TABS)):
+        """Every tab shows a non-empty list, different from the other tabs' lists"""
+        tables = {category: self.switch_category(category)[0] for category in categories}
+        empty = [category for category, table in tables.items() if len(table) == 0]
+        assert not empty, f"Category tabs with no pairs: {empty}"
+        lists = {category: tuple(table.symbols.tolist()) for category, table in tables.items()}
+        duplicates = [category for category in lists if list(lists.values()).count(lists[category]) > 1]
+        assert not duplicates, f"Category tabs showing identical lists: {duplicates}"
+        return tables
+
+    @allure.step("Benchmark category tab switching")
+    def benchmark_category_tabs(self, rounds=3, categories=tuple(CATEGORY_TABS)):
+        """
+        Cycle through the tabs rounds times (needs at least two categories) and summarize the latency per tab
+
+        Returns:
+            dict of tab -> switches, median_ms, p95_ms, max_ms, rows
+        """
+        start = len(self.tab_switches)
+        for _ in range(rounds):
+            for category in categories:
+                self.switch_category(category)
+        summary = summarize_switches(self.tab_switches[start:])
+        allure.attach(json.dumps(summary, indent=2), name="category_tab_switch_latency",
+                      attachment_type=allure.attachment_type.JSON)
+        return summary
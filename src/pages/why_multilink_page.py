@@ -1,21 +1,20 @@
 from src.pages.base_page import BasePage
 from src.constants.locators import WhyMultilinkPageLocators
 from src.utils.logger import log_info
+from src.config.settings import get_settings
 import allure
 
 
 class WhyMultilinkPage(BasePage):
     """Why MultiLink Page Object"""
 
-    PAGE_URL = "https://multibank.io/about/why-multibank"
-
     def __init__(self, driver):
         super().__init__(driver)
 
     def load(self):
         """Load why multilink page"""
         with allure.step("Navigate to Why MultiLink Page"):
-            self.navigate_to_url(self.PAGE_URL)
+            self.navigate_to_url(get_settings().urls.why_multibank)
             self.verify_page_loaded()
 
     def verify_page_loaded(self):
@@ -118,10 +117,8 @@ class WhyMultilinkPage(BasePage):
 
     @allure.step("Scroll through page content")
     def scroll_through_content(self):
-        """Scroll through page content"""
-        self.scroll_down(500)
-        self.scroll_down(500)
-        self.scroll_to_bottom()
+        """Scroll through page content in viewport steps, waiting for lazy sections to render"""
+        self.scroller.scroll_through()
         log_info("Scrolled through page content")
         return self
 
@@ -0,0 +1,51 @@
+from urllib.parse import urlsplit
+from src.utils.logger import log_debug
+from src.utils.throttling import CHROMIUM_BROWSERS
+
+# browserName reported by local EdgeDriver sessions; grid sessions report MicrosoftEdge
+_CHROMIUM_CAPABILITY_NAMES = CHROMIUM_BROWSERS + ("msedge",)
+
+
+def origin_of(url):
+    """scheme://host[:port] of an http(s) URL, else None (about:blank, data: and friends have no storage)"""
+    parts = urlsplit(url or "")
+    if parts.scheme in ("http", "https") and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+
+def is_chromium(driver):
+    """True when the session speaks CDP (Chrome or Edge, local or on a grid)"""
+    return driver.capabilities.get("browserName") in _CHROMIUM_CAPABILITY_NAMES
+
+
+def _cdp(driver, cmd, params):
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+
+def history_origins(driver):
+    """Origins in the current tab's back/forward history, including pages reached by clicks"""
+    history = _cdp(driver, "Page.getNavigationHistory", {}) or {}
+    return {origin for origin in (origin_of(entry.get("url")) for entry in history.get("entries", [])) if origin}
+
+
+def clear_browser_state(driver, origins, http_cache=False):
+    """
+    Clear cookies of every site and all storage of the given origins through CDP (Chromium only)
+
+    Cookies are cleared browser-wide; local/session storage, IndexedDB, service workers and
+    cache storage are per origin, so every origin the session opened has to be listed.
+
+    Args:
+        driver: Chromium WebDriver, local or remote
+        origins: Origins (scheme://host[:port]) whose storage to clear
+        http_cache: Also drop the HTTP cache, for cold-cache page loads
+
+    Check is_chromium first: other browsers reject the CDP commands.
+    """
+    _cdp(driver, "Network.clearBrowserCookies", {})
+    if http_cache:
+        _cdp(driver, "Network.clearBrowserCache", {})
+    for origin in sorted(origins):
+        _cdp(driver, "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    log_debug(f"Cleared cookies{', HTTP cache' if http_cache else ''} and storage of {len(origins)} origins")
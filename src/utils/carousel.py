@@ -0,0 +1,153 @@
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from src.utils.logger import log_debug, log_info
+from src.utils.scroll_engine import to_js_locator
+from src.config.settings import get_settings
+
+# Shared by both scripts: resolve the slider root and describe one slide without touching the carousel
+_SLIDE_HELPERS = """
+const [by, value] = arguments;
+const root = by === "xpath"
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+const realSlides = () => root ? [...root.querySelectorAll(".slick-slide:not(.slick-cloned)")] : [];
+const loadState = img => !img ? "missing"
+    : !img.complete ? "pending"
+    : img.naturalWidth > 0 ? "loaded" : "broken";
+const describe = (slide, position) => {
+    const img = slide.querySelector("img");
+    const rect = (img || slide).getBoundingClientRect();
+    return {
+        index: slide.hasAttribute("data-index") ? Number(slide.getAttribute("data-index")) : position,
+        current: slide.classList.contains("slick-current"),
+        src: img ? img.currentSrc || img.src || img.getAttribute("data-lazy") || "" : "",
+        alt: img ? img.getAttribute("alt") : null,
+        width: Math.round(rect.width),
+        height: Math.round(rect.height),
+        natural_width: img ? img.naturalWidth : 0,
+        natural_height: img ? img.naturalHeight : 0,
+        state: loadState(img),
+    };
+};
+"""
+
+SLIDES_SCRIPT = "/* slickSlides */" + _SLIDE_HELPERS + """
+return root ? realSlides().map(describe) : null;
+"""
+
+# Pause autoplay, switch without animation and resolve once the slide is current and its image decoded.
+# jQuery slick has an API for both; react-slick pauses on hover and is driven through its dots.
+# Resolves null without a slider and {timed_out, current} when the slide is not ready in time.
+GO_TO_SCRIPT = "/* slickGoTo */" + _SLIDE_HELPERS + """
+const [, , index, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+if (!root) return done(null);
+if (!document.getElementById("mb-carousel-freeze")) {
+    const style = document.createElement("style");
+    style.id = "mb-carousel-freeze";
+    style.textContent = ".slick-track, .slick-slide { transition: none !important; }";
+    document.head.appendChild(style);
+}
+const $ = window.jQuery;
+const jquerySlick = $ && $.fn && $.fn.slick && $(root).hasClass("slick-initialized");
+if (jquerySlick) {
+    $(root).slick("slickPause");
+    $(root).slick("slickGoTo", index, true);
+} else {
+    root.dispatchEvent(new MouseEvent("mouseover", {bubbles: true, relatedTarget: document.body}));
+    const dot = root.querySelectorAll(".slick-dots li button")[index]
+        || (root.parentElement && root.parentElement.querySelectorAll(".slick-dots li button")[index]);
+    if (dot) dot.click();
+}
+const poll = () => {
+    const slides = realSlides();
+    const position = slides.findIndex(s => s.classList.contains("slick-current"));
+    const slide = slides[position];
+    const ready = slide && describe(slide, position).index === index;
+    const img = ready && slide.querySelector("img");
+    if (ready && (!img || loadState(img) !== "pending")) {
+        const finish = () => done(describe(slide, position));
+        return img && img.decode ? img.decode().then(finish, finish) : finish();
+    }
+    if (performance.now() - started > timeoutMs) {
+        return done({timed_out: true, current: slide ? describe(slide, position) : null});
+    }
+    setTimeout(poll, 25);
+};
+poll();
+"""
+
+RELEASE_SCRIPT = """
+/* slickRelease */
+const style = document.getElementById("mb-carousel-freeze");
+if (style) style.remove();
+const [by, value] = arguments;
+const root = by === "xpath"
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+if (!root) return;
+if (window.jQuery && window.jQuery(root).hasClass("slick-initialized")) window.jQuery(root).slick("slickPlay");
+else root.dispatchEvent(new MouseEvent("mouseout", {bubbles: true, relatedTarget: document.body}));
+"""
+
+
+class SlickCarousel:
+    """
+    Reads and drives a slick (jQuery or react-slick) slider in-page instead of waiting on its autoplay
+
+    slides() describes every real slide (clones skipped) in one call; go_to() shows a slide in one
+    async call, so visiting N slides costs N short round trips rather than N autoplay intervals.
+    """
+
+    def __init__(self, driver, root_locator, timeouts=None):
+        self.driver = driver
+        self.root = to_js_locator(root_locator)
+        self.root_locator = root_locator
+        self.timeouts = timeouts or get_settings().timeouts
+
+    def slides(self):
+        """
+        Metadata of every slide: index, current, src, alt, rendered and natural size, load state
+
+        Raises:
+            NoSuchElementException: slider root not in the page
+        """
+        slides = self.driver.execute_script(SLIDES_SCRIPT, *self.root)
+        if slides is None:
+            raise NoSuchElementException(f"Carousel not found: {self.root_locator}")
+        log_debug(f"Carousel {self.root_locator}: {len(slides)} slides")
+        return slides
+
+    def go_to(self, index, timeout=None):
+        """
+        Pause autoplay and show slide index without animation
+
+        Returns:
+            metadata of the slide once it is current and its image has loaded
+
+        Raises:
+            NoSuchElementException: slider root not in the page
+            TimeoutException: slide did not become current in time
+        """
+        timeout = self.timeouts.explicit if timeout is None else timeout
+        slide = self.driver.execute_async_script(GO_TO_SCRIPT, *self.root, index, timeout * 1000)
+        if slide is None:
+            raise NoSuchElementException(f"Carousel not found: {self.root_locator}")
+        if slide.get("timed_out"):
+            current = slide["current"]
+            state = f"current {current['index']}, image {current['state']}" if current else "no current slide"
+            raise TimeoutException(f"Carousel slide {index} not shown within {timeout}s ({state})")
+        return slide
+
+    def visit_all(self, timeout=None):
+        """Show every slide in turn, yielding its metadata while it is current; autoplay resumes afterwards"""
+        try:
+            for slide in self.slides():
+                yield self.go_to(slide["index"], timeout)
+        finally:
+            self.release()
+
+    def release(self):
+        """Restore transitions and autoplay"""
+        self.driver.execute_script(RELEASE_SCRIPT, *self.root)
+        log_info(f"Carousel released: {self.root_locator}")
@@ -0,0 +1,146 @@
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from src.utils.logger import log_debug
+
+PAGE_MODULE_PREFIX = "src.pages."
+NO_PAGE_METHOD = "(test code)"
+
+
+def _payload_size(value):
+    try:
+        return len(json.dumps(value, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+def page_method(frame):
+    """
+    Name the outermost page-object method on the call stack, e.g. "HomePage.verify_navigation_items_exist"
+
+    Commands issued from BasePage helpers are attributed to the page method that called them,
+    so polls inside waits count against the step that needed them.
+    """
+    name = NO_PAGE_METHOD
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(PAGE_MODULE_PREFIX):
+            owner = frame.f_locals.get("self")
+            name = f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None else frame.f_code.co_name
+        frame = frame.f_back
+    return name
+
+
+class _ProfilingExecutor:
+    """Stands in for driver.command_executor and times every command passed through it"""
+
+    def __init__(self, executor, records):
+        self._executor = executor
+        self._records = records
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        response = self._executor.execute(command, params)
+        duration_ms = (time.perf_counter() - start) * 1000
+        self._records.append({
+            "command": command,
+            "method": page_method(sys._getframe(1)),
+            "duration_ms": round(duration_ms, 3),
+            "request_bytes": _payload_size(params),
+            "response_bytes": _payload_size(response.get("value") if isinstance(response, dict) else response),
+        })
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+
+class CommandProfiler:
+    """
+    Record every WebDriver command a driver sends: name, duration, payload sizes and page-object method
+
+    Wraps only this driver's command executor, so grid sessions sharing a connection are not affected.
+
+    Usage:
+        profiler = CommandProfiler(driver).start()
+        ...
+        records = profiler.stop()
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.records = []
+        self._wrapper = None
+
+    def start(self):
+        self._wrapper = _ProfilingExecutor(self.driver.command_executor, self.records)
+        self.driver.command_executor = self._wrapper
+        return self
+
+    def stop(self):
+        """
+        Remove the profiling layer and return the records
+
+        Only this profiler's layer is unlinked: wrappers added on top of it since start()
+        (e.g. the element cache's) stay in place.
+        """
+        if self._wrapper is not None:
+            if self.driver.command_executor is self._wrapper:
+                self.driver.command_executor = self._wrapper._executor
+            else:
+                layer = self.driver.command_executor
+                while layer is not None:
+                    inner = vars(layer).get("_executor")
+                    if inner is self._wrapper:
+                        layer._executor = self._wrapper._executor
+                        break
+                    layer = inner
+            self._wrapper = None
+        log_debug(f"Profiled {len(self.records)} WebDriver commands")
+        return self.records
+
+
+def summarize(records):
+    """
+    Aggregate records per (page-object method, command)
+
+    Returns:
+        list of dicts sorted by total time, slowest first
+    """
+    groups = defaultdict(list)
+    for record in records:
+        groups[(record["method"], record["command"])].append(record)
+    rows = []
+    for (method, command), group in groups.items():
+        durations = sorted(r["duration_ms"] for r in group)
+        rows.append({
+            "method": method,
+            "command": command,
+            "calls": len(group),
+            "total_ms": round(sum(durations), 3),
+            "mean_ms": round(sum(durations) / len(durations), 3),
+            "max_ms": durations[-1],
+            "bytes": sum(r["request_bytes"] + r["response_bytes"] for r in group),
+        })
+    return sorted(rows, key=lambda row: -row["total_ms"])
+
+
+def format_table(rows, limit=20):
+    """Render summarize() rows as fixed-width lines"""
+    lines = [f"{'calls':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'bytes':>9}  method / command"]
+    for row in rows[:limit]:
+        lines.append(f"{row['calls']:>6} {row['total_ms']:>10.1f} {row['mean_ms']:>9.2f} {row['max_ms']:>9.2f} "
+                     f"{row['bytes']:>9}  {row['method']} / {row['command']}")
+    return lines
+
+
+def write_records(path, records_by_test):
+    """Write one JSON line per command, tagged with its test node id"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for node_id, records in records_by_test:
+            for record in records:
+                f.write(json.dumps({"test": node_id, **record}) + "\n")
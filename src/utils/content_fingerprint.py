@@ -0,0 +1,176 @@
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from weakref import WeakKeyDictionary
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_info, log_warning
+from src.utils.url_keys import page_key
+
+allure = lazy_import("allure")
+
+_SCRIPT_STYLE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>", re.S | re.I)
+_TAG = re.compile(r"<[^>]+>")
+_ENTITY = re.compile(r"&[a-zA-Z]+;|&#\d+;")
+_TOKEN = re.compile(r"\w{3,}")
+# Typical UTF-8-read-as-Latin-1 sequences plus the replacement character
+_GARBAGE = re.compile("�|Ã[\x80-\xbf]|â€")
+
+
+def visible_text(page_source):
+    """Strip scripts, styles and tags from page source, leaving the rendered text"""
+    text = _SCRIPT_STYLE.sub(" ", page_source)
+    text = _TAG.sub(" ", text)
+    return _ENTITY.sub(" ", text)
+
+
+class ContentFingerprint:
+    """Compact character/token frequency fingerprint of a page's visible text"""
+
+    TOP_CHARS = 64
+    TOP_TOKENS = 32
+
+    def __init__(self, chars, tokens, total, garbage):
+        self.chars = chars
+        self.tokens = tokens
+        self.total = total
+        self.garbage = garbage
+
+    @classmethod
+    def from_page_source(cls, page_source, chunk_size=1 << 16):
+        """Fingerprint page source, streaming its text through the CountChar engine"""
+        from Task2.CountChar import CharCounter
+        text = visible_text(page_source)
+        counter = CharCounter(include_spaces=False, ignore_case=False, normalize="NFC")
+        for start in range(0, len(text), chunk_size):
+            counter.update(text[start:start + chunk_size])
+        counts = counter.flush()
+        for whitespace in "\n\r\t\xa0":
+            counts.pop(whitespace, None)
+
+        total = sum(counts.values())
+        chars = {char: round(count / total, 5) for char, count in counts.most_common(cls.TOP_CHARS)} if total else {}
+        tokens = dict(Counter(_TOKEN.findall(text.lower())).most_common(cls.TOP_TOKENS))
+        return cls(chars, tokens, total, len(_GARBAGE.findall(text)))
+
+    def distance(self, other):
+        """
+        Compare two fingerprints
+
+        Returns:
+            dict with char_distance (total variation, 0..1), token_distance
+            (1 - weighted Jaccard, 0..1), size_ratio and garbage_delta
+        """
+        keys = set(self.chars) | set(other.chars)
+        char_distance = 0.5 * sum(abs(self.chars.get(k, 0.0) - other.chars.get(k, 0.0)) for k in keys)
+        # Mass outside the top-K buckets counts as one "other" bucket
+        char_distance += 0.5 * abs((1 - sum(self.chars.values())) - (1 - sum(other.chars.values())))
+
+        keys = set(self.tokens) | set(other.tokens)
+        overlap = sum(min(self.tokens.get(k, 0), other.tokens.get(k, 0)) for k in keys)
+        union = sum(max(self.tokens.get(k, 0), other.tokens.get(k, 0)) for k in keys)
+        return {
+            "char_distance": round(min(char_distance, 1.0), 4),
+            "token_distance": round(1 - overlap / union, 4) if union else 0.0,
+            "size_ratio": round(self.total / other.total, 3) if other.total else None,
+            "garbage_delta": self.garbage - other.garbage,
+        }
+
+    def to_dict(self):
+        return {"chars": self.chars, "tokens": self.tokens, "total": self.total, "garbage": self.garbage}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["chars"], data["tokens"], data["total"], data["garbage"])
+
+
+class ContentBaselineStore:
+    """Stores one fingerprint per page (host + path) as JSON"""
+
+    DEFAULT_DIR = "baselines/content"
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = Path(directory)
+
+    def path_for(self, url):
+        return self.directory / f"{page_key(url)}.json"
+
+    def load(self, url):
+        path = self.path_for(url)
+        if not path.exists():
+            return None
+        return ContentFingerprint.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, url, fingerprint):
+        path = self.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(fingerprint.to_dict(), ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+class ContentMonitor:
+    """Fingerprints every page visited by a driver and compares it with the stored baseline"""
+
+    MAX_CHAR_DISTANCE = 0.15
+    MAX_TOKEN_DISTANCE = 0.5
+    MIN_SIZE_RATIO = 0.5
+
+    _monitors = WeakKeyDictionary()
+
+    def __init__(self, store, update_baselines=False):
+        self.store = store
+        self.update_baselines = update_baselines
+        self.results = {}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the monitor attached to driver, or None"""
+        return cls._monitors.get(driver)
+
+    def attach(self, driver):
+        self._monitors[driver] = self
+        return self
+
+    def detach(self, driver):
+        self._monitors.pop(driver, None)
+
+    def capture(self, driver):
+        """Fingerprint the current page (once per URL) and compare it with its baseline"""
+        url = driver.current_url
+        if url in self.results:
+            return self.results[url]
+        fingerprint = ContentFingerprint.from_page_source(driver.page_source)
+        baseline = None if self.update_baselines else self.store.load(url)
+
+        if baseline is None:
+            self.store.save(url, fingerprint)
+            # A page without a committed baseline fails once, so new baselines are reviewed, not trusted
+            problems = [] if self.update_baselines else [
+                f"no baseline: recorded {self.store.path_for(url)}, commit it and re-run"]
+            result = {"url": url, "status": "baseline saved", "problems": problems}
+            log_info(f"Content baseline saved for {url}")
+        else:
+            metrics = fingerprint.distance(baseline)
+            problems = self._problems(metrics)
+            result = {"url": url, "status": "changed" if problems else "ok", "problems": problems, **metrics}
+            (log_warning if problems else log_info)(f"Content check {url}: {result}")
+        self.results[url] = result
+        allure.attach(json.dumps(result, indent=2, ensure_ascii=False), name=f"Content fingerprint: {url}",
+                      attachment_type=allure.attachment_type.JSON)
+        return result
+
+    def _problems(self, metrics):
+        problems = []
+        if metrics["char_distance"] > self.MAX_CHAR_DISTANCE:
+            problems.append(f"character distribution moved {metrics['char_distance']:.3f} > {self.MAX_CHAR_DISTANCE}")
+        if metrics["token_distance"] > self.MAX_TOKEN_DISTANCE:
+            problems.append(f"top tokens moved {metrics['token_distance']:.3f} > {self.MAX_TOKEN_DISTANCE}")
+        if metrics["size_ratio"] is not None and metrics["size_ratio"] < self.MIN_SIZE_RATIO:
+            problems.append(f"text shrank to {metrics['size_ratio']:.0%} of baseline")
+        if metrics["garbage_delta"] > 0:
+            problems.append(f"{metrics['garbage_delta']} new encoding-garbage sequences")
+        return problems
+
+    def verify(self):
+        """Assert no visited page drifted from its baseline"""
+        changed = {url: r["problems"] for url, r in self.results.items() if r["problems"]}
+        assert not changed, f"Content regression on {len(changed)} page(s): {changed}"
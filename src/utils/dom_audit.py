@@ -0,0 +1,253 @@
+import json
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_debug, log_info, log_warning
+from src.utils.scroll_engine import to_js_locator
+
+allure = lazy_import("allure")
+
+# Installed once per page load as window.__mbAudit. run() hashes the DOM first and returns early
+# when the hash is one Python already has findings for; otherwise every check is evaluated in one
+# pass over the elements of its scope, and only counts plus a few sample selectors come back.
+ENGINE = """
+if (!window.__mbAudit) window.__mbAudit = (() => {
+    const text = el => (el.textContent || "").replace(/\\s+/g, " ").trim();
+    const attr = (el, name) => (el.getAttribute(name) || "").trim();
+    let hiddenMemo = new WeakMap();
+    const hidden = el => {
+        if (!el || el.nodeType !== 1) return false;
+        if (hiddenMemo.has(el)) return hiddenMemo.get(el);
+        const value = el.hasAttribute("hidden") || el.getAttribute("aria-hidden") === "true" || hidden(el.parentElement);
+        hiddenMemo.set(el, value);
+        return value;
+    };
+    const nameOf = el => {
+        const labelledBy = attr(el, "aria-labelledby").split(/\\s+/).filter(Boolean)
+            .map(id => document.getElementById(id)).filter(Boolean).map(text).join(" ").trim();
+        if (labelledBy) return labelledBy;
+        const name = attr(el, "aria-label") || text(el);
+        if (name) return name;
+        const alt = [...el.querySelectorAll("img")].map(img => attr(img, "alt")).find(Boolean);
+        return alt || attr(el, "title") || attr(el, "value");
+    };
+    const path = el => {
+        const parts = [];
+        for (let node = el; node && node.nodeType === 1 && parts.length < 4; node = node.parentElement) {
+            const tag = node.tagName.toLowerCase();
+            if (node.id) { parts.unshift(tag + "#" + node.id); break; }
+            const classes = attr(node, "class").split(/\\s+/).filter(Boolean).slice(0, 2);
+            const siblings = node.parentElement ? [...node.parentElement.children].filter(c => c.tagName === node.tagName) : [];
+            const nth = siblings.length > 1 ? ":nth-of-type(" + (siblings.indexOf(node) + 1) + ")" : "";
+            parts.unshift(tag + classes.map(c => "." + c).join("") + nth);
+        }
+        return parts.join(" > ");
+    };
+    const find = ([by, value]) => by === "xpath"
+        ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(value);
+    const levelOf = el => {
+        const match = /^H([1-6])$/.exec(el.tagName);
+        if (match) return Number(match[1]);
+        return el.getAttribute("role") === "heading" ? Number(el.getAttribute("aria-level")) || 2 : 0;
+    };
+
+    // Each rule: visit(el) per element in scope, then done() for whole-scope findings
+    const RULES = {
+        "img-alt": (report, options) => ({visit: el => {
+            if (el.tagName !== "IMG" || hidden(el)) return;
+            if (!el.hasAttribute("alt")) report(el, "missing alt");
+            else if (options.require_text && !attr(el, "alt")) report(el, "empty alt");
+        }}),
+        "link-name": report => ({visit: el => {
+            if (el.tagName === "A" && el.hasAttribute("href") && !hidden(el) && !nameOf(el)) report(el, "link has no name");
+        }}),
+        "button-name": report => ({visit: el => {
+            const button = el.tagName === "BUTTON" || el.getAttribute("role") === "button";
+            if (button && !hidden(el) && !nameOf(el)) report(el, "button has no name");
+        }}),
+        "duplicate-id": report => {
+            const ids = new Map();
+            return {
+                visit: el => { if (el.id) ids.set(el.id, (ids.get(el.id) || 0) + 1); },
+                done: () => ids.forEach((count, id) => { if (count > 1) report(null, count + " elements", "#" + id); }),
+            };
+        },
+        "heading-order": (report, options) => {
+            const headings = [];
+            return {
+                visit: el => { const level = levelOf(el); if (level && !hidden(el)) headings.push([el, level]); },
+                done: () => {
+                    const h1 = headings.filter(([, level]) => level === 1);
+                    if (!h1.length) report(null, "no h1", "h1");
+                    if (h1.length > 1) h1.slice(1).forEach(([el]) => report(el, h1.length + " h1 headings"));
+                    if (options.main) {
+                        const main = find(options.main);
+                        if (!main) report(null, "main heading not found", options.main[1]);
+                        else if (levelOf(main) !== 1) report(main, "main heading is not an h1");
+                    }
+                    headings.forEach(([el, level], i) => {
+                        if (!text(el) && !attr(el, "aria-label")) report(el, "empty heading");
+                        const previous = i ? headings[i - 1][1] : level;
+                        if (level > previous + 1) report(el, "h" + previous + " -> h" + level + " skips a level");
+                    });
+                },
+            };
+        },
+        "html-lang": report => ({done: () => {
+            if (!attr(document.documentElement, "lang")) report(document.documentElement, "html has no lang");
+        }}),
+    };
+
+    const hash = () => {
+        const source = document.documentElement.outerHTML;
+        let h = 0x811c9dc5;
+        for (let i = 0; i < source.length; i++) h = Math.imul(h ^ source.charCodeAt(i), 0x01000193);
+        return (h >>> 0).toString(16).padStart(8, "0") + "-" + source.length.toString(16);
+    };
+
+    const run = (checks, known, maxSamples) => {
+        const started = performance.now();
+        hiddenMemo = new WeakMap();
+        const domHash = hash();
+        if (known.includes(domHash)) return {dom_hash: domHash, cached: true, audit_ms: performance.now() - started};
+        const findings = {}, byScope = new Map();
+        for (const [name, check] of Object.entries(checks)) {
+            const result = findings[name] = {rule: check.rule, count: 0, samples: []};
+            const rule = RULES[check.rule];
+            if (!rule) { result.error = "unknown rule"; continue; }
+            const root = check.scope ? find(check.scope) : document.documentElement;
+            if (!root) { result.error = "scope not found"; continue; }
+            const report = (el, detail, selector) => {
+                if (result.count++ < maxSamples) result.samples.push([selector || path(el), detail]);
+            };
+            if (!byScope.has(root)) byScope.set(root, []);
+            byScope.get(root).push(rule(report, check));
+        }
+        let elements = 0;
+        byScope.forEach((visitors, root) => {
+            const walk = visitors.filter(v => v.visit);
+            if (walk.length) {
+                const all = [root, ...root.querySelectorAll("*")];
+                elements += all.length;
+                for (const el of all) for (const v of walk) v.visit(el);
+            }
+            visitors.forEach(v => v.done && v.done());
+        });
+        return {dom_hash: domHash, cached: false, findings: findings, elements: elements,
+                audit_ms: performance.now() - started};
+    };
+    return {run: run, rules: Object.keys(RULES)};
+})();
+"""
+
+RUN_SCRIPT = """
+/* domAudit */
+return window.__mbAudit ? window.__mbAudit.run(...arguments) : null;
+"""
+
+INSTALL_SCRIPT = "/* domAuditInstall */" + ENGINE + "return window.__mbAudit.run(...arguments);"
+
+DEFAULT_CHECKS = {
+    "img-alt": {"rule": "img-alt"},
+    "link-name": {"rule": "link-name"},
+    "button-name": {"rule": "button-name"},
+    "heading-order": {"rule": "heading-order"},
+    "html-lang": {"rule": "html-lang"},
+    "duplicate-id": {"rule": "duplicate-id"},
+}
+
+
+def violations(report, checks=None):
+    """
+    Failing checks of an audit report
+
+    Returns:
+        dict of check name -> samples ([selector, detail], ...) or the check's error
+    """
+    failing = {}
+    for name, result in report["findings"].items():
+        if checks and name not in checks:
+            continue
+        if result.get("error"):
+            failing[name] = result["error"]
+        elif result["count"]:
+            failing[name] = result["samples"]
+    return failing
+
+
+class AuditCache:
+    """Audit findings per (page URL, checks, DOM hash); shared by every auditor in the process"""
+
+    def __init__(self):
+        self._entries = {}
+
+    def findings_for(self, url, checks_key):
+        """dict of DOM hash -> findings already computed for this page and set of checks"""
+        return self._entries.setdefault((url, checks_key), {})
+
+    def clear(self):
+        self._entries.clear()
+
+
+AUDIT_CACHE = AuditCache()
+
+
+class DomAuditor:
+    """
+    Accessibility/DOM checks evaluated in the page by one injected rule engine
+
+    Checks map a name to a rule (img-alt, link-name, button-name, heading-order, html-lang,
+    duplicate-id) with an optional scope locator and rule options (img-alt: require_text;
+    heading-order: main, the locator of the page's h1). An audit is one script call; the engine
+    is injected only when the page does not have it yet, and a page whose URL and DOM hash were
+    audited before in this run returns the cached findings without evaluating the rules again.
+    """
+
+    MAX_SAMPLES = 5
+
+    def __init__(self, driver, cache=AUDIT_CACHE, max_samples=MAX_SAMPLES):
+        self.driver = driver
+        self.cache = cache
+        self.max_samples = max_samples
+        self.installs = 0
+
+    @staticmethod
+    def to_js_checks(checks):
+        """Checks with their scope/main locators translated for in-page lookup"""
+        return {name: {key: list(to_js_locator(value)) if key in ("scope", "main") else value
+                       for key, value in check.items()}
+                for name, check in checks.items()}
+
+    def audit(self, checks=None):
+        """
+        Run the checks on the current page
+
+        Returns:
+            dict with url, dom_hash, cached, audit_ms and findings
+            (check name -> rule, count, samples [[selector, detail], ...], error if not evaluated)
+        """
+        js_checks = self.to_js_checks(checks or DEFAULT_CHECKS)
+        url = self.driver.current_url
+        known = self.cache.findings_for(url, json.dumps(js_checks, sort_keys=True))
+        arguments = (js_checks, list(known), self.max_samples)
+        result = self.driver.execute_script(RUN_SCRIPT, *arguments)
+        if result is None:
+            result = self.driver.execute_script(INSTALL_SCRIPT, *arguments)
+            self.installs += 1
+            log_debug(f"Audit engine injected into {url}")
+
+        if result["cached"]:
+            findings = known[result["dom_hash"]]
+        else:
+            findings = known[result["dom_hash"]] = result["findings"]
+        report = {"url": url, "dom_hash": result["dom_hash"], "cached": result["cached"],
+                  "audit_ms": round(result["audit_ms"], 2), "findings": findings}
+        failing = violations(report)
+        if result["cached"]:
+            log_debug(f"Audit of {url} unchanged since DOM hash {result['dom_hash']}, using cached findings")
+        else:
+            (log_warning if failing else log_info)(
+                f"Audited {url}: {result['elements']} elements in {report['audit_ms']} ms, "
+                f"failing checks: {sorted(failing) or 'none'}")
+            allure.attach(json.dumps(report, indent=2, ensure_ascii=False), name=f"DOM audit: {url}",
+                          attachment_type=allure.attachment_type.JSON)
+        return report
@@ -0,0 +1,161 @@
+import heapq
+import json
+import os
+import statistics
+import sys
+
+
+class DurationHistory:
+    """Persisted per-test duration history, smoothed with an exponential moving average"""
+
+    DEFAULT_FILE = os.path.join(".pytest_cache", "test_durations.json")
+    DEFAULT_ESTIMATE = 10.0  # seconds, used before any history exists
+    SMOOTHING = 0.3
+
+    def __init__(self, path=DEFAULT_FILE):
+        self.path = path
+        self.durations = {}
+        self._session = {}
+        self.load()
+
+    @staticmethod
+    def normalize(node_id):
+        """Strip the xdist '@group' suffix so history survives --dist loadgroup"""
+        return node_id.split("@")[0]
+
+    def load(self):
+        """Load history from file"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.durations = json.load(f)
+        except (OSError, ValueError):
+            self.durations = {}
+        return self
+
+    def save(self):
+        """Merge this session's durations into the history file"""
+        if not self._session:
+            return
+        for node_id, seconds in self._session.items():
+            previous = self.durations.get(node_id)
+            if previous is None:
+                self.durations[node_id] = round(seconds, 3)
+            else:
+                self.durations[node_id] = round(previous + self.SMOOTHING * (seconds - previous), 3)
+        self._session = {}
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self.durations.items())), f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def record(self, node_id, seconds):
+        """Add a phase duration (setup/call/teardown) for a test in this session"""
+        node_id = self.normalize(node_id)
+        self._session[node_id] = self._session.get(node_id, 0.0) + seconds
+
+    def fallback(self):
+        """Expected duration of a test without history: the median of known ones"""
+        return statistics.median(self.durations.values()) if self.durations else self.DEFAULT_ESTIMATE
+
+    def estimate(self, node_id, fallback=None):
+        """Get expected duration of a test; unknown tests get fallback (default: the median of known ones)"""
+        node_id = self.normalize(node_id)
+        if node_id in self.durations:
+            return self.durations[node_id]
+        return self.fallback() if fallback is None else fallback
+
+    def estimator(self):
+        """estimate() with the fallback computed once, for ordering or sharding a whole suite"""
+        fallback = self.fallback()
+        return lambda node_id: self.estimate(node_id, fallback)
+
+    def order_slowest_first(self, node_ids):
+        """Sort tests by descending expected duration (ties by node id for determinism)"""
+        estimate = self.estimator()
+        return sorted(node_ids, key=lambda node_id: (-estimate(node_id), node_id))
+
+    def partition(self, node_ids, shards):
+        """
+        Longest-processing-time-first partition of tests into shards
+
+        Returns:
+            list of (expected_seconds, [node_ids]) per shard
+        """
+        return lpt_partition(node_ids, self.estimator(), shards)
+
+
+def lpt_partition(node_ids, estimate, shards):
+    """Greedy LPT: assign each test, slowest first, to the least loaded shard"""
+    heap = [(0.0, index) for index in range(shards)]
+    buckets = [[] for _ in range(shards)]
+    loads = [0.0] * shards
+    for node_id in sorted(node_ids, key=lambda n: (-estimate(n), n)):
+        load, index = heapq.heappop(heap)
+        buckets[index].append(node_id)
+        loads[index] = load + estimate(node_id)
+        heapq.heappush(heap, (loads[index], index))
+    return list(zip(loads, buckets))
+
+
+def simulate(durations, workers, overhead=0.0):
+    """
+    Predict wall-clock time of running durations on workers pulling tests in order
+
+    Args:
+        durations: Test durations in dispatch order
+        workers: Number of parallel workers
+        overhead: Per-test fixed cost (e.g. browser launch) in seconds
+
+    Returns:
+        Predicted makespan in seconds
+    """
+    finish = [0.0] * max(1, workers)
+    for duration in durations:
+        earliest = heapq.heappop(finish)
+        heapq.heappush(finish, earliest + duration + overhead)
+    return max(finish)
+
+
+def parse_shard(value):
+    """Parse '--shard i/N' (1-based) into (index, total)"""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N such as 2/4")
+    if not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {total}")
+    return index, total
+
+
+def main(argv=None):
+    """CLI: predict wall-clock time per worker count from the duration history"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Simulate suite wall-clock time from duration history")
+    parser.add_argument("workers", nargs="*", type=int, default=[1, 2, 4, 8], help="Worker counts to simulate")
+    parser.add_argument("--file", default=DurationHistory.DEFAULT_FILE, help="Duration history file")
+    parser.add_argument("--overhead", type=float, default=0.0, help="Per-test overhead in seconds")
+    args = parser.parse_args(argv)
+
+    history = DurationHistory(args.file)
+    if not history.durations:
+        print(f"No duration history in {args.file}")
+        return 1
+
+    node_ids = sorted(history.durations)
+    collection_order = [history.estimate(n) for n in node_ids]
+    slowest_first = [history.estimate(n) for n in history.order_slowest_first(node_ids)]
+    total = sum(collection_order)
+
+    print(f"{len(node_ids)} tests, {total:.1f}s serial")
+    print(f"{'workers':>8} {'collection':>12} {'slowest-first':>14} {'lower bound':>12}")
+    for workers in args.workers:
+        bound = max(total / workers, max(collection_order))
+        print(f"{workers:>8} {simulate(collection_order, workers, args.overhead):>11.1f}s "
+              f"{simulate(slowest_first, workers, args.overhead):>13.1f}s {bound:>11.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
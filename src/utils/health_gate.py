@@ -0,0 +1,127 @@
+import json
+import os
+import time
+from datetime import datetime
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_info, log_error
+from src.config.settings import get_settings
+
+requests = lazy_import("requests")
+
+
+class HealthGate:
+    """Pre-flight check that the target site is reachable and renders before running UI tests"""
+
+    POLICIES = ("abort", "skip", "off")
+    LAUNCH_ALLOWANCE = 30  # seconds for starting the probe browser
+
+    def __init__(self, url, locator, timeouts=None, remote_url=None):
+        """
+        Args:
+            url: Page to probe
+            locator: Element that must be present once the page has rendered
+            timeouts: Timeouts to use (http, probe page load, short element wait); default from settings
+            remote_url: Grid URL to probe through; local browser when None
+        """
+        self.url = url
+        self.locator = locator
+        self.timeouts = timeouts or get_settings().timeouts
+        self.remote_url = remote_url
+
+    def check(self, browser="chrome", headless=True):
+        """
+        Probe the site: one HTTP request, then one browser navigation and locator check
+
+        Returns:
+            dict with healthy, reason, elapsed and checked_at (JSON-serializable for xdist workers)
+        """
+        start = time.monotonic()
+        reason = self._check_http() or self._check_browser(browser, headless)
+        result = {
+            "healthy": reason is None,
+            "reason": reason or "ok",
+            "elapsed": round(time.monotonic() - start, 2),
+            "checked_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        if result["healthy"]:
+            log_info(f"Health gate passed for {self.url} in {result['elapsed']}s")
+        else:
+            log_error(f"Health gate failed for {self.url} in {result['elapsed']}s: {reason}")
+        return result
+
+    def max_duration(self):
+        """Longest a check can take: HTTP request, browser launch, page load and element wait"""
+        return self.timeouts.http + self.LAUNCH_ALLOWANCE + self.timeouts.probe + self.timeouts.short
+
+    def _check_http(self):
+        """Fail fast on DNS/network/server errors without launching a browser"""
+        try:
+            response = requests.get(self.url, timeout=self.timeouts.http)
+        except requests.RequestException as e:
+            return f"HTTP request failed: {e.__class__.__name__}: {e}"
+        if response.status_code >= 500:
+            return f"HTTP {response.status_code} from {self.url}"
+        return None
+
+    def _check_browser(self, browser, headless):
+        """Single navigation and presence check of the rendered page"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from src.drivers.driver_factory import DriverFactory
+        driver = None
+        try:
+            driver = DriverFactory.create_driver(browser, headless=headless, remote_url=self.remote_url)
+            driver.implicitly_wait(0)
+            driver.set_page_load_timeout(self.timeouts.probe)
+            driver.get(self.url)
+            WebDriverWait(driver, self.timeouts.short).until(EC.presence_of_element_located(self.locator))
+            return None
+        except Exception as e:
+            message = str(e).strip().splitlines()
+            return f"Browser probe failed: {e.__class__.__name__}: {message[0] if message else ''}"
+        finally:
+            DriverFactory.quit_driver(driver)
+
+
+class SharedHealthResult:
+    """
+    Health result of one run, computed by the first process that needs it
+
+    xdist workers share the directory created by the controller: the first worker to run a browser
+    test takes the lock file and probes, the others wait for its result file instead of probing.
+    """
+
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._result = None
+
+    def get(self, probe, timeout):
+        """
+        Args:
+            probe: Callable returning the health result
+            timeout: Longest wait for another process's probe before probing here
+
+        Returns:
+            The run's health result
+        """
+        if self._result is not None:
+            return self._result
+        result_path = os.path.join(self.directory, "health.json")
+        try:
+            os.close(os.open(os.path.join(self.directory, "health.lock"), os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if os.path.exists(result_path):
+                    with open(result_path, encoding="utf-8") as f:
+                        self._result = json.load(f)
+                    return self._result
+                time.sleep(self.POLL_INTERVAL)
+        self._result = probe()
+        tmp_path = f"{result_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._result, f)
+        os.replace(tmp_path, result_path)
+        return self._result
@@ -0,0 +1,282 @@
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+
+class ImpactAnalyzer:
+    """
+    Static test-impact analysis: maps tests -> page-object methods -> locators/constants
+    and selects the tests affected by a git diff.
+    """
+
+    # Python sources whose symbols are mapped; a change in any other tracked
+    # Python or config file selects the whole suite
+    MAPPED_DIRS = ("tests", "src/pages", "src/constants")
+    GLOBAL_FILES = ("conftest.py", "pytest.ini", "requirements.txt")
+    IGNORED_PATTERNS = ("*.md", ".idea/*", "allure-report/*", "allure-results/*",
+                        "logs/*", "screenshots/*", "downloads/*", "requests.jsonl")
+    CACHE_FILE = os.path.join(".pytest_cache", "test_impact_map.json")
+
+    def __init__(self, root=".", cache_file=CACHE_FILE):
+        self.root = Path(root).resolve()
+        self.cache_file = self.root / cache_file
+        self.summaries = {}
+        self._cache_dirty = False
+
+    # ====================== MAPPING ======================
+    def build(self):
+        """Scan mapped sources, reusing cached summaries for unchanged files"""
+        cached = self._load_cache()
+        self.summaries = {}
+        for rel_path in self._mapped_files():
+            source = (self.root / rel_path).read_bytes()
+            digest = hashlib.sha1(source).hexdigest()
+            entry = cached.get(rel_path)
+            if entry is None or entry["hash"] != digest:
+                entry = {"hash": digest, "summary": self._summarize(source.decode("utf-8"))}
+                self._cache_dirty = True
+            self.summaries[rel_path] = entry
+        if set(cached) != set(self.summaries):
+            self._cache_dirty = True
+        self._save_cache()
+        self._index()
+        return self
+
+    def _mapped_files(self):
+        for mapped_dir in self.MAPPED_DIRS:
+            for path in sorted((self.root / mapped_dir).rglob("*.py")):
+                yield path.relative_to(self.root).as_posix()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        if not self._cache_dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump(self.summaries, f)
+        self._cache_dirty = False
+
+    @staticmethod
+    def _summarize(source):
+        """Summarize a module: symbol line ranges, class bases and raw references"""
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return {"classes": {}, "symbols": {}, "unparsed": True}
+        classes, symbols = {}, {}
+
+        def add_function(name, node, owner=None):
+            start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            var_types, refs = {}, []
+            for sub in ast.walk(node):
+                if (isinstance(sub, ast.Assign) and len(sub.targets) == 1
+                        and isinstance(sub.targets[0], ast.Name)
+                        and isinstance(sub.value, ast.Call) and isinstance(sub.value.func, ast.Name)):
+                    var_types[sub.targets[0].id] = sub.value.func.id
+                elif isinstance(sub, ast.Attribute) and isinstance(sub.value, ast.Name):
+                    refs.append([sub.value.id, sub.attr])
+                elif isinstance(sub, ast.Call) and isinstance(sub.func, ast.Name):
+                    refs.append([sub.func.id, "__init__"])
+            symbols[name] = {"lines": [start, node.end_lineno], "owner": owner,
+                             "var_types": var_types, "refs": refs}
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes[node.name] = [b.id for b in node.bases if isinstance(b, ast.Name)]
+                for item in node.body:
+                    qualified = None
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        add_function(f"{node.name}.{item.name}", item, owner=node.name)
+                        continue
+                    if isinstance(item, ast.Assign) and isinstance(item.targets[0], ast.Name):
+                        qualified = f"{node.name}.{item.targets[0].id}"
+                    elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                        qualified = f"{node.name}.{item.target.id}"
+                    if qualified:
+                        symbols[qualified] = {"lines": [item.lineno, item.end_lineno], "owner": node.name,
+                                              "var_types": {}, "refs": []}
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                add_function(node.name, node)
+        return {"classes": classes, "symbols": symbols}
+
+    def _index(self):
+        """Build class hierarchy, symbol table and test list from summaries"""
+        self.bases, self.symbol_file, self.tests = {}, {}, {}
+        for rel_path, entry in self.summaries.items():
+            summary = entry["summary"]
+            self.bases.update(summary["classes"])
+            for name in summary["symbols"]:
+                self.symbol_file[name] = rel_path
+            if not rel_path.startswith("tests/"):
+                continue
+            for name, symbol in summary["symbols"].items():
+                owner, _, func = name.rpartition(".")
+                if not func.startswith("test_") or (owner and not owner.startswith("Test")):
+                    continue
+                node_id = f"{rel_path}::{owner}::{func}" if owner else f"{rel_path}::{func}"
+                self.tests[node_id] = name
+        self._deps_memo = {}
+
+    def _resolve(self, cls, attr):
+        """Resolve Class.attr to the class in the hierarchy that defines it"""
+        seen = set()
+        queue = [cls]
+        while queue:
+            current = queue.pop(0)
+            if current in seen:
+                continue
+            seen.add(current)
+            if f"{current}.{attr}" in self.symbol_file:
+                return f"{current}.{attr}"
+            queue.extend(self.bases.get(current, []))
+        return f"{cls}.{attr}"
+
+    def _direct_deps(self, name):
+        symbol = self.summaries[self.symbol_file[name]]["summary"]["symbols"][name]
+        deps = set()
+        for base, attr in symbol["refs"]:
+            if base == "self" and symbol["owner"]:
+                cls = symbol["owner"]
+            elif base in symbol["var_types"]:
+                cls = symbol["var_types"][base]
+            else:
+                cls = base
+            if cls in self.bases:
+                deps.add(self._resolve(cls, attr))
+        return deps
+
+    def dependencies(self, name):
+        """Transitive closure of symbols reachable from name (including name)"""
+        if name in self._deps_memo:
+            return self._deps_memo[name]
+        closure, stack = set(), [name]
+        while stack:
+            current = stack.pop()
+            if current in closure or current not in self.symbol_file:
+                continue
+            closure.add(current)
+            stack.extend(self._direct_deps(current) - closure)
+        self._deps_memo[name] = closure
+        return closure
+
+    # ====================== DIFF ======================
+    def changed_lines(self, base):
+        """Map changed file -> set of changed lines (None means the whole file)"""
+        diff = self._git("diff", "-U0", "--no-color", "--no-renames", base, "--")
+        changes, current = {}, None
+        for line in diff.splitlines():
+            if line.startswith("--- "):
+                old_path = line[6:] if line.startswith("--- a/") else None
+            elif line.startswith("+++ "):
+                if line.startswith("+++ b/"):
+                    current = line[6:]
+                    changes.setdefault(current, set())
+                else:
+                    current = None
+                    changes[old_path] = None
+            elif line.startswith("@@") and current and changes[current] is not None:
+                match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", line)
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                # Pure deletions mark the lines around the deletion point
+                changes[current].update(range(start, start + count) if count else (start, start + 1))
+        for path in self._git("ls-files", "--others", "--exclude-standard").splitlines():
+            changes[path] = None
+        return changes
+
+    def _git(self, *args):
+        result = subprocess.run(["git", *args], cwd=self.root, capture_output=True,
+                                text=True, check=True)
+        return result.stdout
+
+    def changed_symbols(self, changes):
+        """
+        Translate changed lines into changed symbols
+
+        Returns:
+            (set of changed symbols, set of fully changed test files, bool run_all)
+        """
+        symbols, whole_test_files, run_all = set(), set(), False
+        for path, lines in changes.items():
+            if any(fnmatch.fnmatch(path, pattern) for pattern in self.IGNORED_PATTERNS):
+                continue
+            entry = self.summaries.get(path)
+            if entry is None:
+                # Unmapped source (conftest, utils, drivers, config, test matrices) or deleted module
+                if path in self.GLOBAL_FILES or path.endswith(".py") or path.startswith(("src/", "test_data/", "config/")):
+                    run_all = True
+                continue
+            if entry["summary"].get("unparsed"):
+                run_all = True
+                continue
+            file_symbols = entry["summary"]["symbols"]
+            if lines is None:
+                symbols.update(file_symbols)
+                if path.startswith("tests/"):
+                    whole_test_files.add(path)
+                continue
+            for line in lines:
+                hits = [name for name, s in file_symbols.items() if s["lines"][0] <= line <= s["lines"][1]]
+                if hits:
+                    symbols.update(hits)
+                elif path.startswith("tests/"):
+                    whole_test_files.add(path)
+                else:
+                    # Module-level change (imports, helpers) affects every symbol in the file
+                    symbols.update(file_symbols)
+        return symbols, whole_test_files, run_all
+
+    # ====================== SELECTION ======================
+    def affected_tests(self, base):
+        """
+        Get node ids of tests affected by changes since base
+
+        Returns:
+            set of node ids, or None when the whole suite must run
+        """
+        if not self.summaries:
+            self.build()
+        symbols, whole_test_files, run_all = self.changed_symbols(self.changed_lines(base))
+        if run_all:
+            return None
+        return {node_id for node_id, name in self.tests.items()
+                if node_id.split("::")[0] in whole_test_files or self.dependencies(name) & symbols}
+
+    def explain(self, node_id):
+        """Get the page-object methods and locators a test depends on"""
+        return sorted(self.dependencies(self.tests[node_id]))
+
+
+def main(argv=None):
+    """CLI: print tests affected by changes since a git ref"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Select tests affected by changes since a git ref")
+    parser.add_argument("--base", default="origin/main", help="Git ref to diff against")
+    parser.add_argument("--explain", metavar="NODEID", help="Show dependencies of one test")
+    args = parser.parse_args(argv)
+
+    analyzer = ImpactAnalyzer().build()
+    if args.explain:
+        print("\n".join(analyzer.explain(args.explain)))
+        return 0
+    affected = analyzer.affected_tests(args.base)
+    if affected is None:
+        print("# framework files changed - run the whole suite")
+        affected = analyzer.tests
+    print("\n".join(sorted(affected)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
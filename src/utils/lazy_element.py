@@ -0,0 +1,166 @@
+from weakref import WeakKeyDictionary
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from src.utils.logger import log_debug
+
+# Commands that only read the page; every other command (clicks, keys, scripts, navigation,
+# window switches) may change the DOM and drops the element cache
+READ_ONLY_COMMANDS = frozenset({
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+    Command.GET_ELEMENT_TEXT, Command.GET_ELEMENT_TAG_NAME, Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_ATTRIBUTE, Command.GET_ELEMENT_PROPERTY, Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_ELEMENT_ARIA_ROLE, Command.GET_ELEMENT_ARIA_LABEL, Command.IS_ELEMENT_SELECTED,
+    Command.IS_ELEMENT_ENABLED, Command.GET_CURRENT_URL, Command.GET_TITLE, Command.GET_PAGE_SOURCE,
+    Command.SCREENSHOT, Command.ELEMENT_SCREENSHOT, Command.W3C_GET_WINDOW_HANDLES, Command.GET_WINDOW_RECT,
+    Command.GET_ALL_COOKIES, Command.GET_COOKIE, Command.GET_LOG, Command.GET_AVAILABLE_LOG_TYPES,
+})
+# Selenium's own read-only atoms, sent as scripts by WebElement.get_attribute and is_displayed
+READ_ONLY_SCRIPTS = ("/* getAttribute */", "/* isDisplayed */")
+
+
+class LazyElement(WebElement):
+    """WebElement proxy that remembers its locator and index and re-resolves when stale"""
+
+    MAX_RETRIES = 2
+
+    def __init__(self, context, locator, index=0, element=None):
+        """
+        Args:
+            context: WebDriver or parent element the locator is searched from
+            locator: (By, value) tuple used to find the element
+            index: Position of the element among the locator matches
+            element: Already resolved WebElement (resolved lazily if omitted)
+        """
+        driver = context.parent if isinstance(context, WebElement) else context
+        super().__init__(driver, element.id if element is not None else None)
+        self._context = context
+        self.locator = tuple(locator)
+        self.index = index
+
+    def __repr__(self):
+        return f"<LazyElement locator={self.locator} index={self.index} id={self._id}>"
+
+    def __hash__(self):
+        return hash((self.locator, self.index, self.id))
+
+    @property
+    def id(self):
+        """Internal element id, resolved on first use"""
+        if self._id is None:
+            self._resolve()
+        return self._id
+
+    def _resolve(self):
+        """Find the element again from its context, locator and index"""
+        elements = self._context.find_elements(*self.locator)
+        if self.index >= len(elements):
+            raise NoSuchElementException(
+                f"Element {self.locator}[{self.index}] no longer present ({len(elements)} matches)"
+            )
+        self._id = elements[self.index].id
+        log_debug(f"Resolved element {self.locator}[{self.index}]")
+
+    def _with_retry(self, func, *args, **kwargs):
+        """Call func, re-resolving the element on StaleElementReferenceException"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            if self._id is None:
+                self._resolve()
+            try:
+                return func(*args, **kwargs)
+            except StaleElementReferenceException:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                log_debug(f"Stale element, re-resolving: {self.locator}[{self.index}]")
+                self._id = None
+
+    def _execute(self, command, params=None):
+        return self._with_retry(super()._execute, command, params)
+
+    # WebElement implements these through driver.execute_script, outside _execute
+    def get_attribute(self, name):
+        return self._with_retry(super().get_attribute, name)
+
+    def is_displayed(self):
+        return self._with_retry(super().is_displayed)
+
+    def find_element(self, by=By.ID, value=None):
+        """Find child element, returned as a LazyElement scoped to this element"""
+        element = super().find_element(by, value)
+        return LazyElement(self, (by, value), 0, element)
+
+    def find_elements(self, by=By.ID, value=None):
+        """Find child elements, returned as LazyElements scoped to this element"""
+        elements = super().find_elements(by, value)
+        return [LazyElement(self, (by, value), i, element) for i, element in enumerate(elements)]
+
+
+class _InvalidatingExecutor:
+    """Stands in for driver.command_executor and drops the element cache before page-changing commands"""
+
+    def __init__(self, executor, cache):
+        self._executor = executor
+        self._cache = cache
+
+    def execute(self, command, params):
+        script = str((params or {}).get("script", ""))
+        if command not in READ_ONLY_COMMANDS and not script.startswith(READ_ONLY_SCRIPTS):
+            self._cache.invalidate()
+        return self._executor.execute(command, params)
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+
+class ElementCache:
+    """
+    Per-driver cache of resolved element proxies
+
+    Valid only while the page is untouched: the driver's command executor is wrapped so that any
+    command other than a read (a click on any element, a script, navigation) invalidates it,
+    whichever helper or raw WebElement sends it.
+    """
+
+    _caches = WeakKeyDictionary()
+
+    def __init__(self):
+        self._elements = {}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the cache shared by all page objects using this driver"""
+        cache = cls._caches.get(driver)
+        if cache is None:
+            cache = cls._caches[driver] = cls()
+        executor = getattr(driver, "command_executor", None)
+        # Re-wrap when something replaced the executor since, e.g. a profiler restoring its own
+        if executor is not None and not cache._wraps(executor):
+            driver.command_executor = _InvalidatingExecutor(executor, cache)
+        return cache
+
+    def _wraps(self, executor):
+        """True when this cache's invalidating layer is somewhere in the executor chain"""
+        layer = executor
+        while layer is not None:
+            if isinstance(layer, _InvalidatingExecutor) and layer._cache is self:
+                return True
+            layer = vars(layer).get("_executor")
+        return False
+
+    def get(self, locator):
+        """Get cached elements for locator, or None"""
+        return self._elements.get(tuple(locator))
+
+    def put(self, locator, elements):
+        """Store elements for locator"""
+        self._elements[tuple(locator)] = elements
+
+    def invalidate(self):
+        """Drop all cached elements"""
+        if self._elements:
+            log_debug(f"Element cache invalidated ({len(self._elements)} locators)")
+        self._elements.clear()
+
+    def __len__(self):
+        return len(self._elements)
@@ -0,0 +1,26 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Import a module on first attribute access instead of now
+
+    Keeps heavy dependencies (selenium, numpy, requests, ...) out of conftest and
+    xdist worker startup until a test actually uses them. Missing modules still
+    fail immediately, so optional-dependency checks keep working.
+
+    Raises:
+        ModuleNotFoundError: module is not installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
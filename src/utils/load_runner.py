@@ -0,0 +1,326 @@
+import contextlib
+import json
+import math
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from src.utils.browser_state import clear_browser_state, history_origins, is_chromium, origin_of
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_info
+from src.utils.page_performance import METRICS, PerformanceMonitor, PerformanceStore
+from src.utils.throttling import THROTTLING_PROFILES, apply_throttling, clear_throttling, resolve_profiles
+from src.config.settings import get_settings
+
+np = lazy_import("numpy")
+
+CACHE_MODES = ("cold", "warm")
+
+
+def describe(values, confidence=0.95, resamples=2000, seed=0):
+    """
+    Median, p95 and a bootstrap confidence interval of the median
+
+    Returns:
+        dict, or None when there are no values
+    """
+    values = np.asarray([v for v in values if v is not None], dtype=float)
+    if values.size == 0:
+        return None
+    rng = np.random.default_rng(seed)
+    medians = np.median(rng.choice(values, size=(resamples, values.size)), axis=1)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(medians, [tail, 100 - tail])
+    return {
+        "n": int(values.size),
+        "median": float(np.median(values)),
+        "p95": float(np.percentile(values, 95)),
+        "ci": [float(low), float(high)],
+    }
+
+
+def _rank(values):
+    """1-based ranks, ties get their average rank"""
+    ranks = np.empty(values.size)
+    ranks[np.argsort(values, kind="mergesort")] = np.arange(1, values.size + 1)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    return (np.bincount(inverse, weights=ranks) / counts)[inverse]
+
+
+def mann_whitney(current, baseline):
+    """
+    Two-sided Mann-Whitney U test (normal approximation with tie and continuity correction)
+
+    Distribution-free, so skewed load times with slow outliers do not need a log transform.
+
+    Returns:
+        p-value, or None if either sample is empty
+    """
+    a = np.asarray([v for v in current if v is not None], dtype=float)
+    b = np.asarray([v for v in baseline if v is not None], dtype=float)
+    if a.size == 0 or b.size == 0:
+        return None
+    combined = np.concatenate([a, b])
+    n = combined.size
+    u = _rank(combined)[:a.size].sum() - a.size * (a.size + 1) / 2
+    mean = a.size * b.size / 2
+    _, counts = np.unique(combined, return_counts=True)
+    ties = float((counts ** 3 - counts).sum())
+    variance = a.size * b.size / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+
+def holm(p_values):
+    """
+    Holm-Bonferroni adjusted p-values, so several metrics can be tested at one familywise alpha
+
+    Args:
+        p_values: dict of name -> p-value
+
+    Returns:
+        dict of name -> adjusted p-value
+    """
+    ordered = sorted(p_values.items(), key=lambda item: item[1])
+    adjusted, running = {}, 0.0
+    for i, (name, p_value) in enumerate(ordered):
+        running = max(running, min(1.0, (len(ordered) - i) * p_value))
+        adjusted[name] = running
+    return adjusted
+
+
+class LoadReport:
+    """Timing samples of repeated loads of one page, with summaries and a baseline comparison"""
+
+    def __init__(self, page, cache, samples):
+        self.page = page
+        self.cache = cache
+        self.samples = samples
+
+    @property
+    def key(self):
+        throttling = {s.get("throttling") for s in self.samples} - {None}
+        return "_".join([self.page, self.cache, *sorted(throttling)])
+
+    def values(self, metric):
+        return [s.get(metric) for s in self.samples]
+
+    def summary(self):
+        return {metric: describe(self.values(metric)) for metric in METRICS}
+
+    def compare(self, baseline_samples, alpha=0.05):
+        """
+        Compare each metric with the baseline's samples
+
+        A metric regressed when its median grew and the difference is significant at alpha after
+        Holm's correction over all compared metrics, so a rerun of an unchanged page is flagged
+        with probability at most alpha rather than once per metric.
+        """
+        result = {}
+        for metric in METRICS:
+            current = describe(self.values(metric))
+            baseline = describe([s.get(metric) for s in baseline_samples])
+            if current is None or baseline is None:
+                continue
+            change = current["median"] - baseline["median"]
+            result[metric] = {
+                "baseline_median": baseline["median"],
+                "median": current["median"],
+                "change_pct": change / baseline["median"] * 100 if baseline["median"] else None,
+                "p_value": mann_whitney(self.values(metric), [s.get(metric) for s in baseline_samples]),
+                "grew": change > 0,
+            }
+        adjusted = holm({metric: row["p_value"] for metric, row in result.items()})
+        for metric, row in result.items():
+            row["p_adjusted"] = adjusted[metric]
+            row["regressed"] = row.pop("grew") and adjusted[metric] < alpha
+        return result
+
+
+class LoadBaselineStore:
+    """Samples of a reference run per page, cache mode and throttling: baselines/performance/<key>.json"""
+
+    DEFAULT_DIR = "baselines/performance"
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = Path(directory)
+
+    def load(self, key):
+        path = self.directory / f"{key}.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))["samples"]
+
+    def save(self, key, samples):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"key": key, "samples": samples}, indent=2), encoding="utf-8")
+        tmp.replace(path)
+        log_info(f"Load baseline saved: {path}")
+
+
+class LoadRunner:
+    """
+    Load a page object K times in each of M browsers and collect the timing distributions
+
+    cold: cookies, storage and the HTTP cache are cleared before every load (Chrome/Edge only).
+    warm: one unmeasured load primes the cache, then K loads are measured.
+    Browsers run concurrently, one thread each.
+    """
+
+    def __init__(self, page_class, loads=10, cache="cold", budgets=None, throttling=()):
+        if cache not in CACHE_MODES:
+            raise ValueError(f"cache must be one of {CACHE_MODES}, got {cache!r}")
+        self.page_class = page_class
+        self.loads = loads
+        self.cache = cache
+        self.budgets = budgets or get_settings().budgets
+        self.throttling = resolve_profiles(throttling) if throttling else None
+
+    def run(self, drivers, page_name=None):
+        with ThreadPoolExecutor(max_workers=len(drivers), thread_name_prefix="load-runner") as executor:
+            batches = list(executor.map(self._run_one, drivers, range(len(drivers))))
+        samples = [sample for batch in batches for sample in batch]
+        page_name = page_name or self.page_class.__name__
+        log_info(f"{page_name}: {len(samples)} {self.cache} loads in {len(drivers)} browser(s)")
+        return LoadReport(page_name, self.cache, samples)
+
+    def _run_one(self, driver, index):
+        if self.cache == "cold" and not is_chromium(driver):
+            raise ValueError(f"Cold loads need a Chromium browser, not {driver.capabilities.get('browserName')}")
+        page = self.page_class(driver)
+        if self.throttling:
+            apply_throttling(driver, self.throttling)
+        if self.cache == "warm":
+            page.load()
+        monitor = PerformanceMonitor(self.budgets).attach(driver)
+        try:
+            for _ in range(self.loads):
+                if self.cache == "cold":
+                    self._make_cold(driver)
+                page.load()
+        finally:
+            monitor.detach(driver)
+            clear_throttling(driver)
+        browser = driver.capabilities.get("browserName", "unknown")
+        samples = [sample for page_samples in monitor.samples.values() for sample in page_samples]
+        for sample in samples:
+            sample.update({"browser": browser, "session": index})
+        return samples
+
+    @staticmethod
+    def _make_cold(driver):
+        """Clear all cookies, the HTTP cache and the storage of every origin this tab has been on, via CDP"""
+        origins = history_origins(driver) | {origin_of(driver.current_url)}
+        driver.get("about:blank")
+        clear_browser_state(driver, origins - {None}, http_cache=True)
+
+
+def format_report(report, comparison=None):
+    """Render a LoadReport (and its baseline comparison) as fixed-width lines"""
+    lines = [f"{report.key} ({len(report.samples)} loads)",
+             f"{'metric':<22} {'n':>4} {'median':>10} {'p95':>10} {'95% CI of median':>22}"]
+    for metric, stats in report.summary().items():
+        if stats is None:
+            continue
+        ci = f"[{stats['ci'][0]:.1f}, {stats['ci'][1]:.1f}]"
+        lines.append(f"{metric:<22} {stats['n']:>4} {stats['median']:>10.1f} {stats['p95']:>10.1f} {ci:>22}")
+    if comparison:
+        lines.append(f"{'vs baseline':<22} {'median':>10} {'change':>9} {'p (Holm)':>9}")
+        for metric, row in comparison.items():
+            change = f"{row['change_pct']:+.1f}%" if row["change_pct"] is not None else "-"
+            flag = "  REGRESSION" if row["regressed"] else ""
+            lines.append(f"{metric:<22} {row['median']:>10.1f} {change:>9} {row['p_adjusted']:>9.4f}{flag}")
+    return lines
+
+
+def synthetic_timings(scale=1.0, seed=None):
+    """
+    Timing-entries generator for a MockGrid, so the runner can be validated offline
+
+    Log-normal timings multiplied by scale, e.g. scale=1.3 to rehearse a 30% regression.
+    """
+    rng = np.random.default_rng(seed)
+    lock = threading.Lock()
+
+    def entries():
+        with lock:
+            ttfb, fcp, lcp = (float(v) * scale for v in rng.lognormal(np.log([120, 600, 1200]), 0.15))
+            cls = float(rng.uniform(0, 0.05))
+        return {
+            "url": "http://offline.test/",
+            "navigation": {"responseStart": ttfb, "domContentLoadedEventEnd": fcp + 50, "loadEventEnd": lcp + 100,
+                           "transferSize": 40000},
+            "paint": [{"name": "first-contentful-paint", "startTime": fcp}],
+            "resources": [],
+            "lcp": lcp,
+            "cls": cls,
+        }
+    return entries
+
+
+def main(argv=None):
+    """CLI: load a page K times in M browsers, summarize and compare against the stored baseline"""
+    import argparse
+    from src.config.settings import configure, load_settings
+    from src.drivers.remote_grid import RemoteSessionPool
+    from src.pages.home_page import HomePage
+    from src.pages.about_page import AboutPage
+    from src.pages.why_multilink_page import WhyMultilinkPage
+    pages = {"home": HomePage, "about": AboutPage, "why_multibank": WhyMultilinkPage}
+
+    parser = argparse.ArgumentParser(description="Repeated-load page performance runner")
+    parser.add_argument("--page", choices=sorted(pages), default="home")
+    parser.add_argument("--loads", type=int, default=10, help="Loads per browser (K)")
+    parser.add_argument("--browsers", type=int, default=1, help="Concurrent browser sessions (M)")
+    parser.add_argument("--cache", choices=CACHE_MODES, default="cold")
+    parser.add_argument("--throttle", action="append", choices=sorted(THROTTLING_PROFILES), default=[],
+                        help="Network/CPU emulation profile, repeatable (Chromium only)")
+    parser.add_argument("--profile", default=None, help="Settings profile")
+    parser.add_argument("--grid-url", default=None, help="Grid to take sessions from (default: settings grid.url)")
+    parser.add_argument("--offline", type=float, metavar="SCALE", default=None,
+                        help="Run against a local mock grid with synthetic timings multiplied by SCALE")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the --offline timings")
+    parser.add_argument("--baseline-dir", default=LoadBaselineStore.DEFAULT_DIR)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level of the baseline comparison")
+    args = parser.parse_args(argv)
+
+    settings = configure(load_settings(args.profile))
+    browser, headless = settings.browser.name, settings.browser.headless
+    with contextlib.ExitStack() as stack:
+        if args.offline is not None:
+            from src.drivers.mock_grid import MockGrid
+            grid_url = stack.enter_context(MockGrid(script_results={
+                "largest-contentful-paint": synthetic_timings(args.offline, args.seed)})).url
+        else:
+            grid_url = args.grid_url or settings.grid.url
+        if not grid_url:
+            parser.error("a grid is required: --grid-url, MB_GRID__URL or --offline")
+
+        sessions = RemoteSessionPool(grid_url, max(args.browsers, settings.grid.max_connections))
+        stack.callback(sessions.close)
+        sessions.prewarm(browser, headless, args.browsers)
+        drivers = [sessions.acquire(browser, headless) for _ in range(args.browsers)]
+        runner = LoadRunner(pages[args.page], args.loads, args.cache, settings.budgets, args.throttle)
+        report = runner.run(drivers, args.page)
+        for driver in drivers:
+            sessions.release(driver, browser, headless)
+
+    run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_load"
+    PerformanceStore().save_run(run_id, {report.key: report.samples}, settings.budgets)
+    store = LoadBaselineStore(args.baseline_dir)
+    baseline = store.load(report.key)
+    comparison = report.compare(baseline, args.alpha) if baseline else None
+    print("\n".join(format_report(report, comparison)))
+    if args.save_baseline or baseline is None:
+        store.save(report.key, report.samples)
+    return 1 if comparison and any(row["regressed"] for row in comparison.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
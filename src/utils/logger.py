@@ -5,6 +5,18 @@ from pathlib import Path
 from datetime import datetime
 
 
+class DeferredFileHandler(logging.FileHandler):
+    """File handler that creates its log directory and file on the first record, not on setup"""
+
+    def __init__(self, log_dir, prefix, **kwargs):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        super().__init__(os.path.join(log_dir, f"{prefix}_{timestamp}.log"), delay=True, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
 class Logger:
     """Centralized logging manager"""
 
@@ -20,14 +32,6 @@ class Logger:
             log_level: Logging level (default: INFO)
             log_dir: Directory to store log files
         """
-        # Create logs directory
-        log_path = Path(log_dir)
-        log_path.mkdir(exist_ok=True)
-
-        # Create log filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        cls._log_file = log_path / f"test_run_{timestamp}.log"
-
         # Create logger
         cls._logger = logging.getLogger(__name__)
         cls._logger.setLevel(log_level)
@@ -37,11 +41,9 @@ class Logger:
 
         # File handler - UTF-8 encoding for cross-platform compatibility
         try:
-            file_handler = logging.FileHandler(
-                cls._log_file,
-                encoding='utf-8',
-                mode='w'
-            )
+            # Log directory and file are created on the first record
+            file_handler = DeferredFileHandler(log_dir, "test_run", encoding='utf-8', mode='w')
+            cls._log_file = Path(file_handler.baseFilename)
             file_handler.setLevel(log_level)
             file_formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
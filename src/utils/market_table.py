@@ -0,0 +1,123 @@
+import time
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+MARKET_DTYPE = [("symbol", "U32"), ("price", "f8"), ("change", "f8"), ("volume", "f8")]
+NUMERIC_COLUMNS = ("price", "change", "volume")
+
+# Column-wise in one pass: textContent avoids the layout innerText forces, numbers are parsed
+# in the page ("$43,210.55", "-1.2%", "3.4B", unicode minus), so only compact arrays cross the wire
+EXTRACT_FUNCTION = """
+const extractTable = (rowSelector, columns) => {
+    const SCALE = {K: 1e3, M: 1e6, B: 1e9, T: 1e12};
+    const num = text => {
+        const m = (text || "").replace(/[\\u2212\\u2013]/g, "-").replace(/[,$\\u20ac\\u00a3\\u00a5\\s]/g, "")
+            .match(/([+-]?\\d*\\.?\\d+(?:e[+-]?\\d+)?)([KMBT])?/i);
+        return m ? parseFloat(m[1]) * (m[2] ? SCALE[m[2].toUpperCase()] : 1) : null;
+    };
+    const rows = document.querySelectorAll(rowSelector);
+    const result = {captured_at: performance.timeOrigin + performance.now()};
+    for (const [name, selector] of Object.entries(columns)) {
+        const values = new Array(rows.length);
+        for (let i = 0; i < rows.length; i++) {
+            const cell = rows[i].querySelector(selector);
+            const text = cell ? cell.textContent.trim() : "";
+            values[i] = name === "symbol" ? text : num(text);
+        }
+        result[name] = values;
+    }
+    return result;
+};
+"""
+
+EXTRACT_SCRIPT = "/* extractTable */" + EXTRACT_FUNCTION + "return extractTable(...arguments);"
+
+
+class TableDiff:
+    """Difference between two MarketTable snapshots, matched by symbol"""
+
+    def __init__(self, added, removed, changed, unchanged, price_moves):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.unchanged = unchanged
+        self.price_moves = price_moves
+
+    @property
+    def changed_fraction(self):
+        total = len(self.changed) + self.unchanged
+        return len(self.changed) / total if total else 0.0
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return (f"TableDiff(added={len(self.added)}, removed={len(self.removed)}, changed={len(self.changed)}, "
+                f"unchanged={self.unchanged})")
+
+
+class MarketTable:
+    """
+    Pairs list as a NumPy structured array (symbol, price, change, volume); missing numbers are NaN
+
+    Built from one extraction call, so a table of thousands of rows costs one round trip.
+    """
+
+    def __init__(self, rows, captured_at=None):
+        self.rows = rows
+        self.captured_at = time.time() * 1000 if captured_at is None else captured_at
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Build from the extraction script's column arrays"""
+        symbols = columns.get("symbol") or []
+        rows = np.zeros(len(symbols), dtype=MARKET_DTYPE)
+        rows["symbol"] = symbols
+        for name in NUMERIC_COLUMNS:
+            values = columns.get(name)
+            rows[name] = np.nan if values is None else [np.nan if v is None else v for v in values]
+        return cls(rows, columns.get("captured_at"))
+
+    @property
+    def symbols(self):
+        return self.rows["symbol"]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, symbol):
+        match = np.flatnonzero(self.rows["symbol"] == symbol)
+        if match.size == 0:
+            raise KeyError(symbol)
+        return self._record(self.rows[match[0]])
+
+    def to_records(self):
+        return [self._record(row) for row in self.rows]
+
+    @staticmethod
+    def _record(row):
+        return {name: (str(row[name]) if name == "symbol" else
+                       None if np.isnan(row[name]) else float(row[name])) for name, _ in MARKET_DTYPE}
+
+    def incomplete(self):
+        """Symbols of rows with an empty symbol or a missing/non-finite price"""
+        bad = (self.rows["symbol"] == "") | ~np.isfinite(self.rows["price"])
+        return self.rows["symbol"][bad].tolist()
+
+    def diff(self, previous):
+        """Compare with an earlier snapshot: added/removed symbols and rows whose numbers moved"""
+        common, new_index, old_index = np.intersect1d(self.symbols, previous.symbols, return_indices=True)
+        current, before = self.rows[new_index], previous.rows[old_index]
+        moved = np.zeros(common.size, dtype=bool)
+        for name in NUMERIC_COLUMNS:
+            a, b = current[name], before[name]
+            moved |= (a != b) & ~(np.isnan(a) & np.isnan(b))
+        price_moves = dict(zip(common[moved].tolist(), (current["price"] - before["price"])[moved].tolist()))
+        return TableDiff(
+            added=np.setdiff1d(self.symbols, previous.symbols).tolist(),
+            removed=np.setdiff1d(previous.symbols, self.symbols).tolist(),
+            changed=common[moved].tolist(),
+            unchanged=int(common.size - moved.sum()),
+            price_moves=price_moves,
+        )
@@ -0,0 +1,133 @@
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_debug
+
+# Only needed when a matrix is not in the hash cache yet
+jsonschema = lazy_import("jsonschema")
+yaml = lazy_import("yaml")
+
+_SCALAR = {"type": ["string", "number", "boolean"]}
+_AXIS_VALUE = {
+    "anyOf": [
+        _SCALAR,
+        {"type": "object", "required": ["id"], "properties": {"id": {"type": "string", "minLength": 1}}},
+    ]
+}
+_CASE_FILTER = {"type": "object", "minProperties": 1, "additionalProperties": _SCALAR}
+
+MATRIX_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["name", "axes"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "axes": {
+            "type": "object",
+            "minProperties": 1,
+            "propertyNames": {"pattern": "^[a-z_][a-z0-9_]*$"},
+            "additionalProperties": {"type": "array", "minItems": 1, "items": _AXIS_VALUE},
+        },
+        "exclude": {"type": "array", "items": _CASE_FILTER},
+        "include": {"type": "array", "items": {"type": "object", "minProperties": 1,
+                                               "additionalProperties": _AXIS_VALUE}},
+    },
+}
+
+
+def value_id(value):
+    """Id of one axis value: the id field of an object, else the scalar itself"""
+    return value["id"] if isinstance(value, dict) else str(value)
+
+
+def _matches(case, condition):
+    return all(axis in case and value_id(case[axis]) == str(value) for axis, value in condition.items())
+
+
+def iter_cases(matrix):
+    """
+    Yield (case_id, case) for the cross product of all axes, minus excludes, plus includes
+
+    Cases are yielded one at a time. pytest_generate_tests still collects all of them,
+    because parametrize takes the full list at collection.
+    """
+    axes = matrix["axes"]
+    names = list(axes)
+    excludes = matrix.get("exclude", [])
+    for values in itertools.product(*(axes[name] for name in names)):
+        case = dict(zip(names, values))
+        if not any(_matches(case, condition) for condition in excludes):
+            yield "-".join(value_id(v) for v in values), case
+    for case in matrix.get("include", []):
+        yield "-".join(value_id(v) for v in case.values()), dict(case)
+
+
+class MatrixLoader:
+    """Loads YAML test matrices, validated by jsonschema and cached by file content and loader version"""
+
+    # Bump when _parse changes what it returns; MATRIX_SCHEMA is part of the cache key already
+    LOADER_VERSION = 1
+    DEFAULT_DIR = "test_data/matrices"
+    CACHE_DIR = ".pytest_cache/test_matrices"
+
+    def __init__(self, directory=DEFAULT_DIR, cache_dir=CACHE_DIR):
+        self.directory = Path(directory)
+        self.cache_dir = Path(cache_dir)
+        self._loaded = {}
+
+    def path_for(self, name):
+        return self.directory / f"{name}.yaml"
+
+    @classmethod
+    def cache_key(cls, content):
+        """Hash of the matrix file together with the schema and loader version that validated it"""
+        digest = hashlib.sha256(f"v{cls.LOADER_VERSION}\n".encode("utf-8"))
+        digest.update(json.dumps(MATRIX_SCHEMA, sort_keys=True).encode("utf-8"))
+        digest.update(content)
+        return digest.hexdigest()
+
+    def load(self, name):
+        """
+        Get the validated matrix called name
+
+        Raises:
+            FileNotFoundError: no such matrix file
+            ValueError: matrix does not match MATRIX_SCHEMA
+        """
+        path = self.path_for(name)
+        content = path.read_bytes()
+        digest = self.cache_key(content)
+        if digest in self._loaded:
+            return self._loaded[digest]
+
+        cache_file = self.cache_dir / f"{digest}.json"
+        if cache_file.exists():
+            matrix = json.loads(cache_file.read_text(encoding="utf-8"))
+            log_debug(f"Matrix {name} loaded from cache {cache_file}")
+        else:
+            matrix = self._parse(path, content)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(matrix), encoding="utf-8")
+            os.replace(tmp, cache_file)
+        self._loaded[digest] = matrix
+        return matrix
+
+    @staticmethod
+    def _parse(path, content):
+        matrix = yaml.safe_load(content)
+        try:
+            jsonschema.validate(matrix, MATRIX_SCHEMA)
+        except jsonschema.ValidationError as e:
+            location = "/".join(str(p) for p in e.absolute_path) or "<root>"
+            raise ValueError(f"Invalid test matrix {path} at {location}: {e.message}") from None
+        unknown = {axis for case in matrix.get("exclude", []) + matrix.get("include", [])
+                   for axis in case} - set(matrix["axes"])
+        if unknown:
+            raise ValueError(f"Invalid test matrix {path}: exclude/include use unknown axes {sorted(unknown)}")
+        return matrix
@@ -0,0 +1,191 @@
+import json
+import math
+from pathlib import Path
+from weakref import WeakKeyDictionary
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_info, log_warning
+from src.utils.throttling import active_throttling
+from src.utils.url_keys import page_key
+
+allure = lazy_import("allure")
+
+# One async round trip: buffered observers deliver LCP and layout shifts on the next task
+COLLECT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const buffered = {"largest-contentful-paint": [], "layout-shift": []};
+const observers = Object.keys(buffered).map(type => {
+    try {
+        const observer = new PerformanceObserver(list => buffered[type].push(...list.getEntries()));
+        observer.observe({type: type, buffered: true});
+        return observer;
+    } catch (e) {
+        return null;
+    }
+});
+setTimeout(() => {
+    observers.forEach(o => o && o.disconnect());
+    const navigation = performance.getEntriesByType("navigation")[0];
+    const lcp = buffered["largest-contentful-paint"].slice(-1)[0];
+    done({
+        url: location.href,
+        navigation: navigation ? navigation.toJSON() : null,
+        paint: performance.getEntriesByType("paint").map(e => ({name: e.name, startTime: e.startTime})),
+        resources: performance.getEntriesByType("resource").map(e => ({
+            name: e.name, initiatorType: e.initiatorType, startTime: e.startTime,
+            duration: e.duration, transferSize: e.transferSize || 0
+        })),
+        lcp: lcp ? lcp.startTime : null,
+        cls: buffered["layout-shift"].filter(e => !e.hadRecentInput).reduce((sum, e) => sum + e.value, 0)
+    });
+}, 50);
+"""
+
+METRICS = ("ttfb_ms", "fcp_ms", "lcp_ms", "cls", "dom_content_loaded_ms", "load_ms", "transfer_bytes")
+BUDGETED_METRICS = ("ttfb_ms", "fcp_ms", "lcp_ms", "cls")
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile (q in 0..100) of the non-None values, or None"""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100
+    low, high = math.floor(position), math.ceil(position)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def page_metrics(entries):
+    """
+    Reduce the raw timing entries of one load to flat metrics
+
+    Times are milliseconds from navigation start; unsupported metrics (e.g. LCP outside Chromium) are None.
+    """
+    navigation = entries.get("navigation") or {}
+    paints = {p["name"]: p["startTime"] for p in entries.get("paint", [])}
+    resources = entries.get("resources", [])
+    slowest = sorted(resources, key=lambda r: -r["duration"])[:5]
+    return {
+        "url": entries.get("url"),
+        "ttfb_ms": navigation.get("responseStart"),
+        "fcp_ms": paints.get("first-contentful-paint"),
+        "lcp_ms": entries.get("lcp"),
+        "cls": entries.get("cls"),
+        "dom_content_loaded_ms": navigation.get("domContentLoadedEventEnd"),
+        "load_ms": navigation.get("loadEventEnd"),
+        "transfer_bytes": navigation.get("transferSize", 0) + sum(r["transferSize"] for r in resources),
+        "resource_count": len(resources),
+        "slowest_resources": [{"name": r["name"], "duration_ms": round(r["duration"], 1)} for r in slowest],
+    }
+
+
+def summarize_samples(samples, q=95):
+    """Median and q-th percentile of each metric over repeated loads"""
+    summary = {"loads": len(samples)}
+    for metric in METRICS:
+        values = [s.get(metric) for s in samples]
+        summary[metric] = {"median": percentile(values, 50), f"p{q:g}": percentile(values, q)}
+    return summary
+
+
+def budget_violations(samples, budgets):
+    """
+    List the budgets whose percentile over samples is exceeded
+
+    Fewer than budgets.min_samples loads say nothing about a percentile, so none apply to them.
+    """
+    violations = []
+    if len(samples) < budgets.min_samples:
+        return violations
+    for metric in BUDGETED_METRICS:
+        limit = getattr(budgets, metric)
+        value = percentile([s.get(metric) for s in samples], budgets.percentile)
+        if limit and value is not None and value > limit:
+            violations.append(f"{metric} p{budgets.percentile:g} {value:.4g} > {limit:g}")
+    return violations
+
+
+def run_violations(samples_by_page, budgets):
+    """{page: violations} of the pages over budget across a whole run"""
+    violations = {page: budget_violations(samples, budgets) for page, samples in samples_by_page.items()}
+    return {page: v for page, v in violations.items() if v}
+
+
+class PerformanceStore:
+    """Samples and summaries of one run, one JSON file per page: reports/performance/<run_id>/<page>.json"""
+
+    DEFAULT_DIR = "reports/performance"
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = Path(directory)
+
+    def save_run(self, run_id, samples_by_page, budgets):
+        run_dir = self.directory / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        for page, samples in samples_by_page.items():
+            data = {
+                "page": page,
+                "summary": summarize_samples(samples, budgets.percentile),
+                "violations": budget_violations(samples, budgets),
+                "samples": samples,
+            }
+            (run_dir / f"{page}.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
+        log_info(f"Page performance for {len(samples_by_page)} page(s) saved to {run_dir}")
+        return run_dir
+
+    def load_run(self, run_id):
+        """Get {page: samples} of a stored run"""
+        return {path.stem: json.loads(path.read_text(encoding="utf-8"))["samples"]
+                for path in sorted((self.directory / run_id).glob("*.json"))}
+
+
+class PerformanceMonitor:
+    """
+    Measures every page load of the drivers it is attached to
+
+    The driver fixture takes each test's samples into the test report; budgets are then checked
+    once, at the end of the run, over every load of a page by every worker.
+    """
+
+    _monitors = WeakKeyDictionary()
+
+    def __init__(self, budgets):
+        self.budgets = budgets
+        self.samples = {}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the monitor attached to driver, or None"""
+        return cls._monitors.get(driver)
+
+    def attach(self, driver):
+        self._monitors[driver] = self
+        return self
+
+    def detach(self, driver):
+        self._monitors.pop(driver, None)
+
+    def measure(self, driver):
+        """Collect timing entries of the current page in one script call and record its metrics"""
+        try:
+            metrics = page_metrics(driver.execute_async_script(COLLECT_SCRIPT))
+        except Exception as e:
+            log_warning(f"Page performance not collected for {driver.current_url}: {e}")
+            return None
+        page = page_key(metrics["url"])
+        # Throttled loads get their own distribution, e.g. "trade_multibank_io@3g"
+        throttling = active_throttling(driver)
+        if throttling:
+            page = f"{page}@{throttling.name}"
+        metrics["page"] = page
+        metrics["throttling"] = throttling.name if throttling else None
+        self.samples.setdefault(page, []).append(metrics)
+        log_info(f"Page performance {page}: TTFB {metrics['ttfb_ms']} ms, LCP {metrics['lcp_ms']} ms, CLS {metrics['cls']}")
+        allure.attach(json.dumps(metrics, indent=2), name=f"Page performance: {page}",
+                      attachment_type=allure.attachment_type.JSON)
+        return metrics
+
+    def take(self):
+        """Samples measured since the last call, flattened in page order"""
+        samples = [sample for page_samples in self.samples.values() for sample in page_samples]
+        self.samples = {}
+        return samples
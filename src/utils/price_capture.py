@@ -0,0 +1,219 @@
+import json
+import time
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_debug, log_info, log_warning
+
+np = lazy_import("numpy")
+
+# Installed once per page: a MutationObserver on the list records every price text change into a
+# fixed-size ring buffer (oldest entries are overwritten and counted as dropped). Timestamps are
+# page epoch milliseconds, so staleness is measured on the browser's clock, not Python's.
+INSTALL_SCRIPT = """
+/* priceCaptureInstall */
+const [rootSelector, rowSelector, symbolSelector, priceSelector, capacity] = arguments;
+const previous = window.__mbPriceCapture;
+if (previous) previous.observer.disconnect();
+const root = document.querySelector(rootSelector);
+if (!root) return null;
+const now = () => performance.timeOrigin + performance.now();
+const num = text => {
+    const m = (text || "").replace(/[\\u2212\\u2013]/g, "-").replace(/[,$\\u20ac\\u00a3\\u00a5\\s]/g, "")
+        .match(/[+-]?\\d*\\.?\\d+(?:e[+-]?\\d+)?/i);
+    return m ? parseFloat(m[0]) : NaN;
+};
+const capture = {
+    symbols: new Array(capacity), prices: new Float64Array(capacity), times: new Float64Array(capacity),
+    start: 0, size: 0, dropped: 0, last: new Map(), rowSymbols: new WeakMap(), startedAt: now(),
+};
+const symbolOf = row => {
+    let symbol = capture.rowSymbols.get(row);
+    if (symbol === undefined) {
+        const cell = row.querySelector(symbolSelector);
+        symbol = cell ? cell.textContent.trim() : "";
+        capture.rowSymbols.set(row, symbol);
+    }
+    return symbol;
+};
+const record = (row, t) => {
+    const cell = row.querySelector(priceSelector);
+    const symbol = symbolOf(row);
+    if (!cell || !symbol) return;
+    const text = cell.textContent.trim();
+    if (capture.last.get(symbol) === text) return;
+    capture.last.set(symbol, text);
+    const index = (capture.start + capture.size) % capacity;
+    capture.symbols[index] = symbol;
+    capture.prices[index] = num(text);
+    capture.times[index] = t;
+    if (capture.size === capacity) {
+        capture.start = (capture.start + 1) % capacity;
+        capture.dropped++;
+    } else {
+        capture.size++;
+    }
+};
+root.querySelectorAll(rowSelector).forEach(row => {
+    const cell = row.querySelector(priceSelector);
+    if (cell && symbolOf(row)) capture.last.set(symbolOf(row), cell.textContent.trim());
+});
+capture.observer = new MutationObserver(mutations => {
+    const t = now();
+    const rows = new Set();
+    for (const m of mutations) {
+        const node = m.target.nodeType === 1 ? m.target : m.target.parentElement;
+        const row = node && node.closest(rowSelector);
+        if (row) rows.add(row);
+    }
+    rows.forEach(row => record(row, t));
+});
+capture.observer.observe(root, {childList: true, characterData: true, subtree: true});
+capture.drain = () => {
+    const batch = {symbol: [], price: [], t: [], dropped: capture.dropped, now: now()};
+    for (let i = 0; i < capture.size; i++) {
+        const index = (capture.start + i) % capacity;
+        batch.symbol.push(capture.symbols[index]);
+        batch.price.push(Number.isNaN(capture.prices[index]) ? null : capture.prices[index]);
+        batch.t.push(capture.times[index]);
+    }
+    capture.start = capture.size = capture.dropped = 0;
+    return batch;
+};
+window.__mbPriceCapture = capture;
+return {symbols: [...capture.last.keys()], started_at: capture.startedAt};
+"""
+
+DRAIN_SCRIPT = """
+/* priceCaptureDrain */
+const capture = window.__mbPriceCapture;
+if (!capture) return null;
+const batch = capture.drain();
+if (arguments[0]) { capture.observer.disconnect(); window.__mbPriceCapture = undefined; }
+return batch;
+"""
+
+
+class PriceCapture:
+    """
+    Records every price change of a pairs list in the page and drains the updates in batches
+
+    Nothing is polled per element: the page buffers changes between drains, and each drain is one
+    round trip however many updates it carries. metrics() gives update count, rate, largest gap and
+    staleness per symbol.
+    """
+
+    CAPACITY = 20000
+
+    def __init__(self, driver, root=".pairs-list", row=".pair-item", symbol=".pair-symbol", price=".pair-price",
+                 capacity=CAPACITY):
+        self.driver = driver
+        self.selectors = (root, row, symbol, price)
+        self.capacity = capacity
+        self.started_at = None
+        self.last_drain_at = None
+        self.dropped = 0
+        self.batches = 0
+        self._updates = {}
+        self._symbols = []
+
+    def start(self):
+        """
+        Install the observer; symbols present now are reported by metrics() even if they never update
+
+        Raises:
+            RuntimeError: pairs list not in the page
+        """
+        result = self.driver.execute_script(INSTALL_SCRIPT, *self.selectors, self.capacity)
+        if result is None:
+            raise RuntimeError(f"Price capture: no element matches {self.selectors[0]}")
+        self.started_at = self.last_drain_at = result["started_at"]
+        self._symbols = result["symbols"]
+        log_info(f"Price capture started on {len(self._symbols)} symbols")
+        return self
+
+    def drain(self, stop=False):
+        """Move buffered updates to Python; returns the number of updates in the batch"""
+        batch = self.driver.execute_script(DRAIN_SCRIPT, stop)
+        if batch is None:
+            log_warning("Price capture not installed (page navigated?)")
+            return 0
+        for symbol, price, t in zip(batch["symbol"], batch["price"], batch["t"]):
+            self._updates.setdefault(symbol, []).append((t, price))
+        self.dropped += batch["dropped"]
+        self.batches += 1
+        self.last_drain_at = batch["now"]
+        if batch["dropped"]:
+            log_warning(f"Price capture ring buffer overflowed: {batch['dropped']} updates dropped")
+        log_debug(f"Price capture batch: {len(batch['symbol'])} updates")
+        return len(batch["symbol"])
+
+    def stop(self):
+        """Final drain and observer removal"""
+        self.drain(stop=True)
+        return self
+
+    def collect(self, duration, interval=0.5):
+        """Drain every interval seconds for duration seconds; returns metrics()"""
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+            self.drain()
+        return self.metrics()
+
+    def add_updates(self, updates):
+        """Merge (symbol, epoch_ms, price) updates from another source, e.g. WebSocketTap"""
+        for symbol, t, price in updates:
+            self._updates.setdefault(symbol, []).append((t, price))
+
+    def metrics(self, symbols=None):
+        """
+        Per symbol over the capture window (start to last drain):
+            updates, rate_per_s, max_gap_ms (including the gaps to the window's edges),
+            staleness_ms (time since the last update), last_price
+
+        Returns:
+            dict of symbol -> metrics; symbols without updates have updates 0 and full-window staleness
+        """
+        window_ms = max(self.last_drain_at - self.started_at, 1e-9)
+        result = {}
+        for symbol in symbols or sorted(set(self._updates) | set(self._symbols)):
+            points = sorted(self._updates.get(symbol, []), key=lambda point: point[0])
+            times = np.array([self.started_at] + [t for t, _ in points] + [self.last_drain_at])
+            result[symbol] = {
+                "updates": len(points),
+                "rate_per_s": len(points) / window_ms * 1000,
+                "max_gap_ms": float(np.diff(times).max()),
+                "staleness_ms": self.last_drain_at - (points[-1][0] if points else self.started_at),
+                "last_price": points[-1][1] if points else None,
+            }
+        return result
+
+
+class WebSocketTap:
+    """
+    Price updates from the page's WebSocket frames, read from the Chromium performance log
+
+    Needs browser.performance_log (MB_BROWSER__PERFORMANCE_LOG=true), which turns on the
+    goog/ms:loggingPrefs capability. parse(payload) maps one frame's text to
+    [(symbol, price), ...]; frames it cannot handle should return [].
+    """
+
+    def __init__(self, driver, parse):
+        self.driver = driver
+        self.parse = parse
+        self.frames = 0
+
+    def drain(self):
+        """
+        Returns:
+            list of (symbol, epoch_ms, price) from the frames received since the last drain
+        """
+        updates = []
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") != "Network.webSocketFrameReceived":
+                continue
+            self.frames += 1
+            payload = message["params"]["response"].get("payloadData", "")
+            for symbol, price in self.parse(payload):
+                updates.append((symbol, entry["timestamp"], price))
+        return updates
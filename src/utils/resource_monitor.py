@@ -0,0 +1,144 @@
+import threading
+import time
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_debug, log_info, log_warning
+
+psutil = lazy_import("psutil")
+
+BROWSER_PROCESS_NAMES = ("chromedriver", "chrome", "chromium", "geckodriver", "firefox", "msedgedriver", "msedge")
+
+
+def get_driver_pid(driver):
+    """Get PID of the local driver service process (chromedriver/geckodriver/msedgedriver), or None"""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return getattr(process, "pid", None)
+
+
+def get_process_tree(pid):
+    """Get the process with pid and all its descendants (empty if it already exited)"""
+    if pid is None:
+        return []
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def kill_processes(processes, timeout=3):
+    """
+    Terminate processes that are still alive, then kill those ignoring SIGTERM
+
+    Returns:
+        list of PIDs that had to be terminated
+    """
+    alive = [p for p in processes if _is_running(p)]
+    for process in alive:
+        try:
+            process.terminate()
+        except psutil.Error:
+            pass
+    _, survivors = psutil.wait_procs(alive, timeout=timeout)
+    for process in survivors:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    if alive:
+        log_warning(f"Killed {len(alive)} orphaned browser processes: {[p.pid for p in alive]}")
+    return [p.pid for p in alive]
+
+
+def find_browser_leftovers(names=BROWSER_PROCESS_NAMES):
+    """Get browser/driver processes still running under the current process"""
+    leftovers = []
+    for process in psutil.Process().children(recursive=True):
+        try:
+            if any(name in process.name().lower() for name in names):
+                leftovers.append(process)
+        except psutil.Error:
+            continue
+    return leftovers
+
+
+def _is_running(process):
+    try:
+        return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+class ProcessTreeMonitor:
+    """Samples CPU and RSS of a driver's process tree (driver service + browser) in the background"""
+
+    DEFAULT_INTERVAL = 1.0
+
+    def __init__(self, pid, interval=DEFAULT_INTERVAL):
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self.seen = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._started_at = None
+
+    def start(self):
+        """Start sampling in a daemon thread"""
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name=f"resource-monitor-{self.pid}", daemon=True)
+        self._thread.start()
+        log_debug(f"Resource monitor started for PID {self.pid}")
+        return self
+
+    def stop(self):
+        """Stop sampling and take one final sample"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(self.interval * 2)
+        self.sample()
+        return self.summary()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Take one CPU/RSS sample over the whole process tree"""
+        rss, cpu, count = 0, 0.0, 0
+        for process in get_process_tree(self.pid):
+            # Keep the first Process object per PID: cpu_percent() is measured between calls on it
+            process = self.seen.setdefault(process.pid, process)
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    cpu += process.cpu_percent(None)
+                count += 1
+            except psutil.Error:
+                continue
+        if count:
+            self.samples.append((time.monotonic(), count, rss, cpu))
+
+    def summary(self):
+        """Summarize samples: peak/final RSS in MB, average/peak CPU %, process count"""
+        if not self.samples:
+            return {"pid": self.pid, "samples": 0}
+        rss = [s[2] for s in self.samples]
+        cpu = [s[3] for s in self.samples]
+        return {
+            "pid": self.pid,
+            "samples": len(self.samples),
+            "duration_s": round(self.samples[-1][0] - self._started_at, 1),
+            "peak_processes": max(s[1] for s in self.samples),
+            "peak_rss_mb": round(max(rss) / 2 ** 20, 1),
+            "final_rss_mb": round(rss[-1] / 2 ** 20, 1),
+            "avg_cpu_percent": round(sum(cpu) / len(cpu), 1),
+            "peak_cpu_percent": round(max(cpu), 1),
+        }
+
+    def reap(self, timeout=3):
+        """Kill every process seen in the tree that outlived driver.quit()"""
+        killed = kill_processes(list(self.seen.values()), timeout=timeout)
+        if not killed:
+            log_info(f"All {len(self.seen)} processes of driver PID {self.pid} exited")
+        return killed
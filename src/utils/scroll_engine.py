@@ -0,0 +1,150 @@
+import json
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from src.utils.logger import log_debug, log_info
+from src.config.settings import get_settings
+
+# One async call scrolls the whole way: jump straight to a target already in the DOM, otherwise
+# step one viewport at a time and let lazy content settle (IntersectionObserver/MutationObserver
+# activity) before the next step; resolve as soon as the target intersects the viewport.
+SCROLL_SCRIPT = """
+/* scrollUntil */
+const [by, value, timeoutMs, settleMs, maxStepWaitMs, maxSteps] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+const scroller = document.scrollingElement || document.documentElement;
+let steps = 0, target = null, finished = false;
+let lastActivity = started, stepStarted = started;
+
+const find = () => by === "xpath"
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+const inView = el => {
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && r.bottom > 0 && r.top < innerHeight;
+};
+const finish = found => {
+    if (finished) return;
+    finished = true;
+    io.disconnect();
+    mo.disconnect();
+    done({found: found, element: found ? target : null, steps: steps, scrollY: scroller.scrollTop,
+          scrollHeight: scroller.scrollHeight, elapsedMs: Math.round(performance.now() - started)});
+};
+const io = new IntersectionObserver(entries => {
+    lastActivity = performance.now();
+    if (target && entries.some(e => e.target === target && e.isIntersecting)) finish(true);
+});
+const check = () => {
+    if (!by || target) return;
+    const el = find();
+    if (el) {
+        target = el;
+        el.scrollIntoView({block: "center"});
+        steps++;
+        io.observe(el);
+    }
+};
+const mo = new MutationObserver(() => { lastActivity = performance.now(); check(); });
+
+document.querySelectorAll("img[loading=lazy], iframe[loading=lazy], [data-src], [data-lazy]")
+    .forEach(el => io.observe(el));
+mo.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ["src", "class"]});
+check();
+
+const tick = () => {
+    if (finished) return;
+    const now = performance.now();
+    if (now - started > timeoutMs) return finish(false);
+    if (target) return inView(target) ? finish(true) : setTimeout(tick, 50);
+    const settling = now - lastActivity < settleMs && now - stepStarted < maxStepWaitMs;
+    if (settling) return setTimeout(tick, settleMs / 3);
+    if (scroller.scrollTop + innerHeight >= scroller.scrollHeight - 2 || steps >= maxSteps) return finish(!by);
+    scroller.scrollBy(0, Math.round(innerHeight * 0.9));
+    steps++;
+    lastActivity = stepStarted = performance.now();
+    setTimeout(tick, settleMs / 3);
+};
+tick();
+"""
+
+
+def to_js_locator(locator):
+    """
+    Translate a Selenium locator to ("css" | "xpath", selector) for in-page lookup
+
+    Raises:
+        ValueError: strategy without an in-page equivalent
+    """
+    by, value = locator
+    if by in (By.CSS_SELECTOR, By.XPATH):
+        return ("xpath" if by == By.XPATH else "css"), value
+    if by == By.ID:
+        return "xpath", f"//*[@id={json.dumps(value)}]"
+    if by == By.CLASS_NAME:
+        # Same translation Selenium applies before sending a class-name lookup to the driver
+        return "css", f".{value}"
+    if by == By.NAME:
+        return "xpath", f"//*[@name={json.dumps(value)}]"
+    if by == By.TAG_NAME:
+        return "css", value
+    if by == By.LINK_TEXT:
+        return "xpath", f"//a[normalize-space(.)={json.dumps(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return "xpath", f"//a[contains(., {json.dumps(value)})]"
+    raise ValueError(f"Unsupported locator strategy for scrolling: {by}")
+
+
+def to_css_selector(locator):
+    """
+    CSS selector of a locator, for scripts that look up rows and cells with querySelector
+
+    Raises:
+        ValueError: locator has only an XPath equivalent
+    """
+    kind, selector = to_js_locator(locator)
+    if kind != "css":
+        raise ValueError(f"Locator has no CSS equivalent: {locator}")
+    return selector
+
+
+class ScrollEngine:
+    """Scrolls in viewport steps inside the page, waiting for lazy content instead of polling from Python"""
+
+    SETTLE_MS = 150
+    MAX_STEP_WAIT_MS = 1000
+    MAX_STEPS = 200
+
+    def __init__(self, driver, timeouts=None):
+        self.driver = driver
+        self.timeouts = timeouts or get_settings().timeouts
+
+    def _run(self, locator, timeout):
+        by, value = to_js_locator(locator) if locator else (None, None)
+        timeout = self.timeouts.explicit if timeout is None else timeout
+        return self.driver.execute_async_script(
+            SCROLL_SCRIPT, by, value, timeout * 1000, self.SETTLE_MS, self.MAX_STEP_WAIT_MS, self.MAX_STEPS)
+
+    def scroll_to(self, locator, timeout=None):
+        """
+        Scroll until the element of locator is in the viewport
+
+        Returns:
+            WebElement
+
+        Raises:
+            TimeoutException: page end or timeout reached without finding it
+        """
+        result = self._run(locator, timeout)
+        if not result["found"]:
+            raise TimeoutException(f"Element not reached by scrolling after {result['steps']} steps "
+                                   f"({result['scrollY']}/{result['scrollHeight']}px, {result['elapsedMs']} ms): {locator}")
+        log_debug(f"Scrolled to {locator} in {result['steps']} steps, {result['elapsedMs']} ms")
+        return result["element"]
+
+    def scroll_through(self, timeout=None):
+        """Scroll to the end of the page, letting lazy content render on the way; returns the scroll summary"""
+        result = self._run(None, timeout)
+        log_info(f"Scrolled through page in {result['steps']} steps to {result['scrollY']}/{result['scrollHeight']}px "
+                 f"({result['elapsedMs']} ms)")
+        return result
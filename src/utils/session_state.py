@@ -0,0 +1,168 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import secrets
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_debug, log_info, log_warning
+
+fernet = lazy_import("cryptography.fernet")
+
+CAPTURE_SCRIPT = """
+/* captureStorage */
+const dump = storage => Object.fromEntries(Object.keys(storage).map(key => [key, storage.getItem(key)]));
+return {origin: location.origin, local: dump(localStorage), session: dump(sessionStorage)};
+"""
+
+RESTORE_SCRIPT = """
+/* restoreStorage */
+const [local, session] = arguments;
+Object.entries(local).forEach(([key, value]) => localStorage.setItem(key, value));
+Object.entries(session).forEach(([key, value]) => sessionStorage.setItem(key, value));
+"""
+
+# Small same-origin document to stand on while cookies and storage are written
+RESTORE_PATH = "/robots.txt"
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class SessionCipher:
+    """Fernet (AES-128-CBC with HMAC-SHA256) encryption of session snapshots, keyed by a secret"""
+
+    SALT = b"multibank-session-state"
+
+    def __init__(self, secret):
+        key = hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"), self.SALT, 100_000)
+        self._fernet = fernet.Fernet(base64.urlsafe_b64encode(key))
+
+    @classmethod
+    def from_key_file(cls, path):
+        """Cipher keyed by a random secret kept in path (created with owner-only permissions)"""
+        path = Path(path)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(secrets.token_urlsafe(32))
+        return cls(path.read_text().strip())
+
+    def encrypt(self, data):
+        return self._fernet.encrypt(data)
+
+    def decrypt(self, token):
+        """
+        Raises:
+            ValueError: token was tampered with or written with another key
+        """
+        try:
+            return self._fernet.decrypt(token)
+        except fernet.InvalidToken:
+            raise ValueError("Session state failed authentication") from None
+
+
+class SessionStateStore:
+    """Encrypted snapshots with an expiry, one file per key: <directory>/<key>.session"""
+
+    DEFAULT_DIR = ".auth"
+
+    def __init__(self, directory=DEFAULT_DIR, cipher=None, ttl=3600):
+        self.directory = Path(directory)
+        self.cipher = cipher or SessionCipher.from_key_file(self.directory / ".key")
+        self.ttl = ttl
+
+    def path(self, key):
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.@-]+', '_', key)}.session"
+
+    def load(self, key):
+        """Snapshot stored under key, or None when missing, expired or unreadable"""
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            record = json.loads(self.cipher.decrypt(path.read_bytes()))
+        except ValueError as e:
+            log_warning(f"Discarding session state {path}: {e}")
+            return None
+        if record["expires"] <= time.time():
+            log_info(f"Session state {path} expired")
+            return None
+        return record["snapshot"]
+
+    def save(self, key, snapshot):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        record = {"key": key, "created": now, "expires": now + self.ttl, "snapshot": snapshot}
+        path = self.path(key)
+        tmp = path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.cipher.encrypt(json.dumps(record).encode("utf-8")))
+        tmp.replace(path)
+        log_info(f"Session state saved: {path} (expires in {self.ttl:g}s)")
+
+    def delete(self, key):
+        self.path(key).unlink(missing_ok=True)
+
+
+def capture_session(driver):
+    """Cookies plus localStorage and sessionStorage of the current origin"""
+    snapshot = driver.execute_script(CAPTURE_SCRIPT)
+    snapshot["cookies"] = driver.get_cookies()
+    log_debug(f"Captured session of {snapshot['origin']}: {len(snapshot['cookies'])} cookies, "
+              f"{len(snapshot['local'])} localStorage and {len(snapshot['session'])} sessionStorage keys")
+    return snapshot
+
+
+def restore_session(driver, snapshot):
+    """Write a captured session into the browser; the next page load starts authenticated"""
+    driver.get(snapshot["origin"] + RESTORE_PATH)
+    host = urlsplit(snapshot["origin"]).hostname
+    now = time.time()
+    for cookie in snapshot["cookies"]:
+        domain = cookie.get("domain", host).lstrip(".")
+        if not (host == domain or host.endswith("." + domain)) or cookie.get("expiry", now + 1) <= now:
+            log_debug(f"Cookie {cookie['name']} not restored for {host}")
+            continue
+        driver.add_cookie({k: v for k, v in cookie.items() if k in COOKIE_FIELDS})
+    driver.execute_script(RESTORE_SCRIPT, snapshot["local"], snapshot["session"])
+    log_debug(f"Restored session of {snapshot['origin']}")
+
+
+class SessionStateCache:
+    """
+    Log in once, then hand the session to every browser that needs it
+
+    The snapshot is kept in memory for this process and encrypted on disk until it expires,
+    so later runs of the same worker skip the login too.
+    """
+
+    def __init__(self, store, key, login):
+        self.store = store
+        self.key = key
+        self.login = login
+        self.logins = 0
+        self._snapshot = None
+
+    def snapshot(self, driver):
+        """Valid snapshot, logging in with driver first if none is stored"""
+        if self._snapshot is None:
+            self._snapshot = self.store.load(self.key)
+        if self._snapshot is None:
+            log_info(f"Logging in to create session state '{self.key}'")
+            self.login(driver)
+            self.logins += 1
+            self._snapshot = capture_session(driver)
+            self.store.save(self.key, self._snapshot)
+        return self._snapshot
+
+    def restore(self, driver):
+        restore_session(driver, self.snapshot(driver))
+
+    def invalidate(self):
+        """Forget the snapshot, e.g. after the server ended the session; the next restore logs in again"""
+        self._snapshot = None
+        self.store.delete(self.key)
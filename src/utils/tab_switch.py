@@ -0,0 +1,69 @@
+from src.utils.market_table import EXTRACT_FUNCTION
+from src.utils.page_performance import percentile
+
+# Click a tab and time the list re-render from DOM changes instead of sleeping: the list is
+# re-rendered once the set of row symbols differs from before the click, and done once it has
+# stayed the same for settleMs (price ticks inside rows never count). The new list is extracted
+# in the same call. A tab that is already selected is not clicked; its current list is returned.
+SWITCH_SCRIPT = "/* switchTab */" + EXTRACT_FUNCTION + """
+const [tabBy, tabValue, listSelector, rowSelector, columns, settleMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const tab = tabBy === "xpath"
+    ? document.evaluate(tabValue, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(tabValue);
+const list = document.querySelector(listSelector);
+if (!tab || !list) return done({error: !tab ? "tab not found" : "list not found"});
+// Clicking the selected tab re-renders nothing: report the list as it is instead of waiting
+if (tab.classList.contains("active") || tab.getAttribute("aria-selected") === "true")
+    return done({changed: false, selected: true, table: extractTable(rowSelector, columns)});
+const now = () => performance.now();
+const signature = () => [...list.querySelectorAll(rowSelector)]
+    .map(row => { const cell = row.querySelector(columns.symbol); return cell ? cell.textContent.trim() : ""; })
+    .join("\\n");
+const before = signature();
+let current = before, firstChange = null, lastChange = null, finished = false, settleTimer = null;
+const finish = changed => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(settleTimer);
+    clearTimeout(timeoutTimer);
+    done({changed: changed, first_change_ms: firstChange === null ? null : firstChange - clicked,
+          render_ms: lastChange === null ? null : lastChange - clicked,
+          table: extractTable(rowSelector, columns)});
+};
+const observer = new MutationObserver(mutations => {
+    const structural = mutations.some(m => {
+        const node = m.target.nodeType === 1 ? m.target : m.target.parentElement;
+        return !node || !node.closest(rowSelector) || node.matches(rowSelector) || node.closest(columns.symbol);
+    });
+    if (!structural) return;
+    const next = signature();
+    if (next === current) return;
+    current = next;
+    lastChange = now();
+    if (firstChange === null) firstChange = lastChange;
+    clearTimeout(settleTimer);
+    settleTimer = setTimeout(() => finish(true), settleMs);
+});
+observer.observe(list, {childList: true, characterData: true, subtree: true});
+const clicked = now();
+const timeoutTimer = setTimeout(() => finish(current !== before), timeoutMs);
+tab.click();
+"""
+
+
+def summarize_switches(samples):
+    """Per tab: switch count, median/p95/max re-render latency in ms and the last row count"""
+    summary = {}
+    for tab in dict.fromkeys(sample["tab"] for sample in samples):
+        runs = [sample for sample in samples if sample["tab"] == tab]
+        latencies = [sample["render_ms"] for sample in runs]
+        summary[tab] = {
+            "switches": len(runs),
+            "median_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "max_ms": percentile(latencies, 100),
+            "rows": runs[-1]["rows"],
+        }
+    return summary
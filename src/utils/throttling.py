@@ -0,0 +1,100 @@
+import dataclasses
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+from src.utils.logger import log_info, log_warning
+
+CHROMIUM_BROWSERS = ("chrome", "edge", "MicrosoftEdge")
+
+
+@dataclass(frozen=True)
+class ThrottlingProfile:
+    """Network and CPU emulation; 0 throughput means unthrottled"""
+
+    name: str
+    latency_ms: float = 0
+    download_kbps: float = 0
+    upload_kbps: float = 0
+    cpu_rate: float = 1
+
+    @property
+    def throttles_network(self):
+        return bool(self.latency_ms or self.download_kbps or self.upload_kbps)
+
+    def to_dict(self):
+        return dataclasses.asdict(self)
+
+
+# WebPageTest connectivity presets (round-trip latency, kbit/s) and Lighthouse's mobile CPU slowdown
+THROTTLING_PROFILES = {
+    "3g": ThrottlingProfile("3g", latency_ms=300, download_kbps=1600, upload_kbps=768),
+    "4g": ThrottlingProfile("4g", latency_ms=170, download_kbps=9000, upload_kbps=9000),
+    "slow-cpu-4x": ThrottlingProfile("slow-cpu-4x", cpu_rate=4),
+}
+
+_active = WeakKeyDictionary()
+
+
+def resolve_profiles(names):
+    """
+    Combine named profiles into one, e.g. ("4g", "slow-cpu-4x") for a mid-range phone
+
+    Raises:
+        ValueError: unknown profile name
+    """
+    unknown = [name for name in names if name not in THROTTLING_PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown throttling profile(s) {unknown}, available: {sorted(THROTTLING_PROFILES)}")
+    profiles = [THROTTLING_PROFILES[name] for name in names]
+    return ThrottlingProfile(
+        "+".join(names),
+        latency_ms=max((p.latency_ms for p in profiles), default=0),
+        download_kbps=min((p.download_kbps for p in profiles if p.download_kbps), default=0),
+        upload_kbps=min((p.upload_kbps for p in profiles if p.upload_kbps), default=0),
+        cpu_rate=max((p.cpu_rate for p in profiles), default=1),
+    )
+
+
+def _cdp(driver, cmd, params):
+    # Same command for local ChromeDriver/EdgeDriver and Chromium grid sessions
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+
+def _kbps_to_bytes(kbps):
+    return kbps * 1000 / 8 if kbps else -1
+
+
+def apply_throttling(driver, profile):
+    """Emulate profile's network and CPU in a Chromium browser through CDP"""
+    if profile.throttles_network:
+        _cdp(driver, "Network.enable", {})
+        _cdp(driver, "Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile.latency_ms,
+            "downloadThroughput": _kbps_to_bytes(profile.download_kbps),
+            "uploadThroughput": _kbps_to_bytes(profile.upload_kbps),
+        })
+    if profile.cpu_rate != 1:
+        _cdp(driver, "Emulation.setCPUThrottlingRate", {"rate": profile.cpu_rate})
+    _active[driver] = profile
+    log_info(f"Throttling '{profile.name}' applied: {profile.to_dict()}")
+
+
+def clear_throttling(driver):
+    """Remove emulation applied by apply_throttling, e.g. before a grid session is reused"""
+    profile = _active.pop(driver, None)
+    if profile is None:
+        return
+    try:
+        if profile.throttles_network:
+            _cdp(driver, "Network.emulateNetworkConditions",
+                 {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1})
+        if profile.cpu_rate != 1:
+            _cdp(driver, "Emulation.setCPUThrottlingRate", {"rate": 1})
+    except Exception as e:
+        log_warning(f"Failed to clear throttling '{profile.name}': {e}")
+        raise
+
+
+def active_throttling(driver):
+    """Get the ThrottlingProfile applied to driver, or None"""
+    return _active.get(driver)
@@ -0,0 +1,8 @@
+import re
+from urllib.parse import urlsplit
+
+
+def page_key(url):
+    """File-name-safe key of a page: host + path, e.g. https://trade.multibank.io/markets -> trade_multibank_io_markets"""
+    parts = urlsplit(url)
+    return re.sub(r"[^A-Za-z0-9]+", "_", f"{parts.netloc}{parts.path}").strip("_") or "root"
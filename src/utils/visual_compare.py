@@ -0,0 +1,173 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+from io import BytesIO
+from pathlib import Path
+from src.utils.lazy_import import lazy_import
+from src.utils.logger import log_info, log_warning
+
+np = lazy_import("numpy")
+allure = lazy_import("allure")
+
+
+def decode_png(data):
+    """Decode PNG bytes into an RGBA uint8 array of shape (height, width, 4)"""
+    from PIL import Image
+    return np.asarray(Image.open(BytesIO(data)).convert("RGBA"))
+
+
+def encode_png(image):
+    """Encode an RGBA uint8 array as PNG (used for diff images)"""
+    from PIL import Image
+    buffer = BytesIO()
+    Image.fromarray(image, "RGBA").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def dhash(image, size=8, margin=1.0):
+    """
+    64-bit difference hash: grayscale, area-resize to size x (size + 1), compare neighbours
+
+    A neighbour only counts as brighter above margin gray levels, so flat areas
+    do not flip bits on rendering noise.
+    """
+    gray = image[..., :3].astype(np.float32) @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    # Upscale tiny images so every output cell covers at least one pixel
+    gray = np.repeat(np.repeat(gray, -(-(size + 1) // gray.shape[0]), axis=0), -(-(size + 1) // gray.shape[1]), axis=1)
+    rows = np.linspace(0, gray.shape[0], size + 1).astype(int)
+    cols = np.linspace(0, gray.shape[1], size + 2).astype(int)
+    sums = np.add.reduceat(np.add.reduceat(gray, rows[:-1], axis=0), cols[:-1], axis=1)
+    small = sums / np.outer(np.diff(rows), np.diff(cols))
+    bits = (small[:, 1:] - small[:, :-1] > margin).flatten()
+    return int("".join("1" if bit else "0" for bit in bits), 2)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class VisualBaselineStore:
+    """
+    Content-addressed baseline storage
+
+    objects/<sha256>.png holds each distinct image once; refs/<name>.json points a
+    baseline name at an object and caches its hash and size, so the common path
+    never decodes the baseline image.
+    """
+
+    DEFAULT_DIR = "baselines/visual"
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = Path(directory)
+
+    def _ref_path(self, name):
+        return self.directory / "refs" / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.json"
+
+    def object_path(self, sha256):
+        return self.directory / "objects" / sha256[:2] / f"{sha256}.png"
+
+    def load_ref(self, name):
+        path = self._ref_path(name)
+        return json.loads(path.read_text()) if path.exists() else None
+
+    def is_empty(self):
+        """True until the first baseline is recorded"""
+        return not any((self.directory / "refs").glob("*.json"))
+
+    def load_image(self, ref):
+        return decode_png(self.object_path(ref["sha256"]).read_bytes())
+
+    def save(self, name, png, image):
+        sha256 = hashlib.sha256(png).hexdigest()
+        path = self.object_path(sha256)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(png)
+        ref = {"sha256": sha256, "dhash": f"{dhash(image):016x}",
+               "width": int(image.shape[1]), "height": int(image.shape[0])}
+        ref_path = self._ref_path(name)
+        ref_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = ref_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(ref, indent=1))
+        os.replace(tmp, ref_path)
+        return ref
+
+
+class VisualComparator:
+    """Compares element screenshots with baselines: byte hash, then perceptual hash, then pixel diff"""
+
+    HASH_THRESHOLD = 0
+    PIXEL_TOLERANCE = 16
+    MAX_DIFF_RATIO = 0.001
+
+    def __init__(self, store, update_baselines=False):
+        self.store = store
+        self.update_baselines = update_baselines
+        self.results = {}
+
+    def compare(self, name, png):
+        """
+        Compare PNG bytes with the baseline called name
+
+        Returns:
+            dict with status (baseline saved/identical/similar/ok/changed), method and elapsed_ms
+        """
+        start = time.perf_counter()
+        ref = None if self.update_baselines else self.store.load_ref(name)
+        result = {"name": name}
+
+        if ref is None:
+            self.store.save(name, png, decode_png(png))
+            result.update(status="baseline saved", method="store")
+            # An element without a committed baseline fails once instead of passing on its own screenshot
+            if not self.update_baselines:
+                result["problem"] = f"no baseline: recorded under {self.store.directory}, commit it and re-run"
+        elif hashlib.sha256(png).hexdigest() == ref["sha256"]:
+            result.update(status="identical", method="sha256")
+        else:
+            actual = decode_png(png)
+            distance = hamming(dhash(actual), int(ref["dhash"], 16))
+            result.update(hash_distance=distance)
+            if distance <= self.HASH_THRESHOLD:
+                result.update(status="similar", method="dhash")
+            else:
+                result.update(self._pixel_diff(name, actual, self.store.load_image(ref)), method="pixels")
+
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        (log_warning if result.get("problem") else log_info)(f"Visual check {result}")
+        self.results[name] = result
+        return result
+
+    def _pixel_diff(self, name, actual, expected):
+        if actual.shape != expected.shape:
+            return {"status": "changed",
+                    "problem": f"size {actual.shape[1]}x{actual.shape[0]} != {expected.shape[1]}x{expected.shape[0]}"}
+        mask = np.abs(actual.astype(np.int16) - expected).max(axis=2) > self.PIXEL_TOLERANCE
+        ratio = float(mask.mean())
+        if ratio <= self.MAX_DIFF_RATIO:
+            return {"status": "ok", "diff_ratio": round(ratio, 6)}
+
+        diff = (actual // 3).copy()
+        diff[..., 3] = 255
+        diff[mask] = (255, 0, 0, 255)
+        self._attach_diff(name, expected, actual, diff)
+        return {"status": "changed", "diff_ratio": round(ratio, 6),
+                "problem": f"{ratio:.2%} of pixels differ (max {self.MAX_DIFF_RATIO:.2%})"}
+
+    @staticmethod
+    def _attach_diff(name, expected, actual, diff):
+        """Attach in the format read by the Allure screen-diff plugin"""
+        def data_uri(image):
+            return "data:image/png;base64," + base64.b64encode(encode_png(image)).decode()
+
+        body = json.dumps({"expected": data_uri(expected), "actual": data_uri(actual), "diff": data_uri(diff)})
+        allure.attach(body, name=f"Screen diff: {name}", attachment_type="application/vnd.allure.image.diff",
+                      extension="imagediff")
+
+    def verify(self):
+        """Assert no compared element changed"""
+        changed = {name: r["problem"] for name, r in self.results.items() if r.get("problem")}
+        assert not changed, f"Visual regression on {len(changed)} element(s): {changed}"
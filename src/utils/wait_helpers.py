@@ -2,22 +2,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from src.utils.logger import log_debug, log_error
+from src.config.settings import get_settings
 import time
 
 
 class WaitHelper:
     """Helper class for Selenium waits with custom conditions"""
 
-    DEFAULT_TIMEOUT = 10
-    SHORT_TIMEOUT = 5
-    LONG_TIMEOUT = 20
-
-    def __init__(self, driver):
+    def __init__(self, driver, timeouts=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, self.DEFAULT_TIMEOUT)
+        self.timeouts = timeouts or get_settings().timeouts
+        self.wait = WebDriverWait(driver, self.timeouts.explicit)
 
-    def wait_for_element_visible(self, locator, timeout=DEFAULT_TIMEOUT):
+    def wait_for_element_visible(self, locator, timeout=None):
         """Wait for element to be visible"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for element visible: {locator}")
             element = WebDriverWait(
@@ -31,8 +30,9 @@ class WaitHelper:
             log_error(f"Element not visible within {timeout}s: {locator}")
             raise
 
-    def wait_for_element_clickable(self, locator, timeout=DEFAULT_TIMEOUT):
+    def wait_for_element_clickable(self, locator, timeout=None):
         """Wait for element to be clickable"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for element clickable: {locator}")
             element = WebDriverWait(
@@ -46,8 +46,9 @@ class WaitHelper:
             log_error(f"Element not clickable within {timeout}s: {locator}")
             raise
 
-    def wait_for_elements_visible(self, locator, timeout=DEFAULT_TIMEOUT):
+    def wait_for_elements_visible(self, locator, timeout=None):
         """Wait for multiple elements to be visible"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for elements visible: {locator}")
             elements = WebDriverWait(
@@ -61,8 +62,9 @@ class WaitHelper:
             log_error(f"Elements not visible within {timeout}s: {locator}")
             raise
 
-    def wait_for_element_invisible(self, locator, timeout=DEFAULT_TIMEOUT):
+    def wait_for_element_invisible(self, locator, timeout=None):
         """Wait for element to become invisible"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for element invisible: {locator}")
             WebDriverWait(
@@ -75,8 +77,9 @@ class WaitHelper:
             log_error(f"Element still visible after {timeout}s: {locator}")
             raise
 
-    def wait_for_text_in_element(self, locator, text, timeout=DEFAULT_TIMEOUT):
+    def wait_for_text_in_element(self, locator, text, timeout=None):
         """Wait for specific text in element"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for text '{text}' in element: {locator}")
             WebDriverWait(
@@ -89,8 +92,9 @@ class WaitHelper:
             log_error(f"Text '{text}' not found in {timeout}s: {locator}")
             raise
 
-    def wait_for_url_contains(self, url_substring, timeout=DEFAULT_TIMEOUT):
+    def wait_for_url_contains(self, url_substring, timeout=None):
         """Wait for URL to contain substring"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for URL to contain: {url_substring}")
             WebDriverWait(
@@ -103,8 +107,9 @@ class WaitHelper:
             log_error(f"URL does not contain '{url_substring}' after {timeout}s")
             raise
 
-    def wait_for_url_changes(self, original_url, timeout=DEFAULT_TIMEOUT):
+    def wait_for_url_changes(self, original_url, timeout=None):
         """Wait for URL to change from original"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for URL to change from: {original_url}")
             WebDriverWait(
@@ -117,8 +122,9 @@ class WaitHelper:
             log_error(f"URL did not change within {timeout}s")
             raise
 
-    def wait_for_element_attribute(self, locator, attribute, value, timeout=DEFAULT_TIMEOUT):
+    def wait_for_element_attribute(self, locator, attribute, value, timeout=None):
         """Wait for element attribute to have specific value"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug(f"Waiting for {attribute}='{value}' on: {locator}")
             WebDriverWait(
@@ -131,8 +137,9 @@ class WaitHelper:
             log_error(f"Element attribute not matched within {timeout}s: {locator}")
             raise
 
-    def wait_for_ajax_complete(self, timeout=DEFAULT_TIMEOUT):
+    def wait_for_ajax_complete(self, timeout=None):
         """Wait for jQuery AJAX to complete"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug("Waiting for AJAX to complete...")
             WebDriverWait(
@@ -144,8 +151,9 @@ class WaitHelper:
         except Exception as e:
             log_error(f"AJAX wait failed: {str(e)}")
 
-    def wait_for_page_load(self, timeout=DEFAULT_TIMEOUT):
+    def wait_for_page_load(self, timeout=None):
         """Wait for page to fully load"""
+        timeout = self.timeouts.explicit if timeout is None else timeout
         try:
             log_debug("Waiting for page load...")
             WebDriverWait(
@@ -158,8 +166,9 @@ class WaitHelper:
             log_error(f"Page did not fully load within {timeout}s")
             raise
 
-    def element_exists(self, locator, timeout=SHORT_TIMEOUT):
+    def element_exists(self, locator, timeout=None):
         """Check if element exists without throwing exception"""
+        timeout = self.timeouts.short if timeout is None else timeout
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
@@ -168,8 +177,9 @@ class WaitHelper:
         except TimeoutException:
             return False
 
-    def element_is_displayed(self, locator, timeout=SHORT_TIMEOUT):
+    def element_is_displayed(self, locator, timeout=None):
         """Check if element is displayed"""
+        timeout = self.timeouts.short if timeout is None else timeout
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
@@ -0,0 +1,50 @@
+import pytest
+import allure
+from src.pages.home_page import HomePage
+from src.pages.about_page import AboutPage
+from src.utils.logger import log_info
+
+
+@allure.feature("Accessibility")
+@allure.story("DOM Audit")
+class TestAccessibility:
+    """Test cases for accessibility checks evaluated by the in-page audit engine"""
+
+    @pytest.mark.regression
+    @allure.title("Verify marketing banners have alt text")
+    @allure.description("Verify that every banner slide image has a non-empty alt attribute")
+    def test_banner_images_have_alt(self, driver):
+        """Test that banner images have alt text"""
+        home_page = HomePage(driver)
+        home_page.load()
+
+        with allure.step("Audit banner images"):
+            report = home_page.verify_banner_images_have_alt()
+
+        log_info(f"✓ Banner alt test passed in {report['audit_ms']} ms")
+
+    @pytest.mark.regression
+    @allure.title("Verify footer links have accessible names")
+    @allure.description("Verify that every footer link has text, an aria-label or an image with alt text")
+    def test_footer_links_named(self, driver):
+        """Test that footer links have accessible names"""
+        home_page = HomePage(driver)
+        home_page.load()
+
+        with allure.step("Audit footer links"):
+            report = home_page.verify_footer_links_named()
+
+        log_info(f"✓ Footer link name test passed in {report['audit_ms']} ms")
+
+    @pytest.mark.regression
+    @allure.title("Verify about page heading order")
+    @allure.description("Verify that the about page header is the only h1 and no heading level is skipped")
+    def test_about_heading_order(self, driver):
+        """Test about page heading order"""
+        about_page = AboutPage(driver)
+        about_page.load()
+
+        with allure.step("Audit heading order"):
+            report = about_page.verify_heading_order()
+
+        log_info(f"✓ Heading order test passed in {report['audit_ms']} ms")
@@ -0,0 +1,101 @@
+"""
+tests/test_carousel.py - Slick carousel helper unit tests, offline against a mock grid
+"""
+
+import itertools
+import pytest
+import allure
+from selenium.common.exceptions import TimeoutException
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import ELEMENT_KEY, MockGrid
+from src.pages.home_page import HomePage
+from src.constants.locators import HomePageLocators
+from src.utils.carousel import SlickCarousel
+
+
+def slide(index, state="loaded", current=False):
+    """Slide metadata as returned by the in-page scripts"""
+    return {"index": index, "current": current, "src": f"https://cdn.test/banner_{index}.png" if state != "missing" else "",
+            "alt": f"Banner {index}", "width": 800, "height": 300,
+            "natural_width": 1600 if state == "loaded" else 0, "natural_height": 600 if state == "loaded" else 0,
+            "state": state}
+
+
+def timed_out(current):
+    """go-to result when the slide did not become current in time"""
+    return {"timed_out": True, "current": current}
+
+
+def carousel_grid(slides, shown, released=None):
+    """Mock grid serving slides metadata and shown slides (in order) for every go-to call; counts releases"""
+    shown = iter(shown)
+    released = released if released is not None else []
+    return MockGrid(script_results={
+        "/* slickSlides */": slides,
+        "/* slickGoTo */": lambda: next(shown),
+        "/* slickRelease */": lambda: released.append(True),
+        "/* scrollUntil */": {"found": True, "element": {ELEMENT_KEY: "banner"}, "steps": 1,
+                              "scrollY": 2000, "scrollHeight": 3000, "elapsedMs": 10},
+    })
+
+
+def script_calls(grid, driver, kind):
+    return [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/{kind}")
+
+
+@allure.feature("Framework")
+@allure.story("Carousel")
+class TestCarousel:
+    """Test cases for SlickCarousel and the HomePage banner checks"""
+
+    @pytest.mark.unit
+    def test_visit_all_switches_once_per_slide(self):
+        """Every slide is shown with one async call each, then autoplay is released"""
+        slides = [slide(0, current=True), slide(1, "pending"), slide(2, "pending")]
+        with carousel_grid(slides, [slide(i, current=True) for i in range(3)]) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            carousel = SlickCarousel(driver, HomePageLocators.BANNER_SLIDER)
+            visited = [s["index"] for s in carousel.visit_all()]
+            calls = script_calls(grid, driver, "async"), script_calls(grid, driver, "sync")
+            driver.quit()
+
+        assert visited == [0, 1, 2]
+        assert calls == (3, 2)
+
+    @pytest.mark.unit
+    def test_go_to_times_out_when_slide_not_shown(self):
+        """A slider that stays on another slide raises TimeoutException"""
+        with carousel_grid([slide(0), slide(1)], itertools.repeat(timed_out(slide(0, current=True)))) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            with pytest.raises(TimeoutException, match=r"slide 1 not shown within 1s \(current 0, image loaded\)"):
+                SlickCarousel(driver, HomePageLocators.BANNER_SLIDER).go_to(1, timeout=1)
+            driver.quit()
+
+    @pytest.mark.unit
+    def test_banner_check_releases_carousel_on_timeout(self):
+        """A lazy slide that never shows still resumes autoplay before the TimeoutException propagates"""
+        released = []
+        with carousel_grid([slide(0, current=True), slide(1, "pending")], [timed_out(None)], released) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            with pytest.raises(TimeoutException, match="no current slide"):
+                HomePage(driver).verify_marketing_banners_visible()
+            driver.quit()
+
+        assert released == [True]
+
+    @pytest.mark.unit
+    def test_banner_check_covers_every_slide(self):
+        """Only lazy slides are switched to; one whose image never loads fails the check"""
+        slides = [slide(0, current=True), slide(1), slide(2, "missing")]
+        with carousel_grid(slides, [slide(2)]) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            HomePage(driver).verify_marketing_banners_visible()
+            go_to_calls = script_calls(grid, driver, "async") - 1
+            driver.quit()
+        assert go_to_calls == 1
+
+        with carousel_grid(slides, [slide(2, "broken")]) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            with pytest.raises(AssertionError, match=r"\[2\]"):
+                HomePage(driver).verify_marketing_banners_visible()
+            driver.quit()
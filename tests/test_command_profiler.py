@@ -0,0 +1,68 @@
+"""
+tests/test_command_profiler.py - WebDriver command profiler unit tests against a local mock grid
+"""
+
+import json
+import pytest
+import allure
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.pages.home_page import HomePage
+from src.utils.command_profiler import NO_PAGE_METHOD, CommandProfiler, format_table, summarize, write_records
+
+
+@pytest.fixture
+def grid_driver():
+    with MockGrid() as grid:
+        driver = DriverFactory.create_driver("chrome", headless=True, remote_url=grid.url)
+        yield driver
+        driver.quit()
+
+
+@allure.feature("Framework")
+@allure.story("Command Profiler")
+class TestCommandProfiler:
+    """Test cases for CommandProfiler and its summaries"""
+
+    @pytest.mark.unit
+    def test_commands_are_attributed_to_outermost_page_method(self, grid_driver):
+        """findElement calls made through BasePage helpers count against the calling page method"""
+        profiler = CommandProfiler(grid_driver).start()
+        HomePage(grid_driver).verify_navigation_items_exist()
+        grid_driver.get("https://example.test/")
+        records = profiler.stop()
+
+        rows = {(row["method"], row["command"]): row for row in summarize(records)}
+        assert rows[("HomePage.verify_navigation_items_exist", "findElement")]["calls"] == 6
+        assert rows[(NO_PAGE_METHOD, "get")]["calls"] == 1
+        assert all(r["duration_ms"] > 0 and r["request_bytes"] > 0 for r in records)
+
+    @pytest.mark.unit
+    def test_stop_restores_original_executor(self, grid_driver):
+        """Commands after stop() are no longer recorded"""
+        executor = grid_driver.command_executor
+        profiler = CommandProfiler(grid_driver).start()
+        grid_driver.get("https://example.test/")
+        profiler.stop()
+        grid_driver.get("https://example.test/other")
+
+        assert grid_driver.command_executor is executor
+        assert len(profiler.records) == 1
+
+    @pytest.mark.unit
+    def test_table_and_records_file(self, tmp_path):
+        """Summary rows are sorted by total time and the file holds one line per command"""
+        records = [
+            {"command": "findElement", "method": "HomePage.load", "duration_ms": 5.0, "request_bytes": 40, "response_bytes": 60},
+            {"command": "findElement", "method": "HomePage.load", "duration_ms": 7.0, "request_bytes": 40, "response_bytes": 60},
+            {"command": "get", "method": NO_PAGE_METHOD, "duration_ms": 3.0, "request_bytes": 30, "response_bytes": 4},
+        ]
+        rows = summarize(records)
+        path = tmp_path / "commands.jsonl"
+        write_records(str(path), [("tests/test_x.py::test_a", records)])
+        lines = path.read_text().splitlines()
+
+        assert [(row["command"], row["calls"], row["total_ms"], row["bytes"]) for row in rows] == \
+            [("findElement", 2, 12.0, 200), ("get", 1, 3.0, 34)]
+        assert "HomePage.load / findElement" in format_table(rows)[1]
+        assert len(lines) == 3 and json.loads(lines[0])["test"] == "tests/test_x.py::test_a"
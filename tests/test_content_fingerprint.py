@@ -0,0 +1,77 @@
+"""
+tests/test_content_fingerprint.py - Page content fingerprint unit tests
+"""
+
+import pytest
+import allure
+from src.utils.content_fingerprint import ContentBaselineStore, ContentFingerprint, ContentMonitor, visible_text
+
+PAGE = """<html><head><title>Markets</title><style>body { color: red; }</style>
+<script>var trading = "ignored";</script></head>
+<body><h1>Trade Forex &amp; Crypto</h1><p>Spreads from 0.0 pips on major pairs.</p>
+<p>Trade with confidence on a regulated platform.</p></body></html>"""
+
+
+class FakeDriver:
+    """Driver stand-in exposing only what ContentMonitor reads"""
+
+    def __init__(self, url, page_source):
+        self.current_url = url
+        self.page_source = page_source
+
+
+@allure.feature("Framework")
+@allure.story("Content fingerprint")
+class TestContentFingerprint:
+    """Test cases for ContentFingerprint and ContentMonitor"""
+
+    @pytest.mark.unit
+    def test_visible_text_drops_scripts_styles_and_tags(self):
+        """Only rendered text contributes to the fingerprint"""
+        text = visible_text(PAGE)
+
+        assert "Spreads from" in text
+        assert "ignored" not in text and "color" not in text and "<p>" not in text
+
+    @pytest.mark.unit
+    def test_identical_pages_have_zero_distance(self):
+        """Same source gives the same fingerprint, even when streamed in tiny chunks"""
+        whole = ContentFingerprint.from_page_source(PAGE)
+        chunked = ContentFingerprint.from_page_source(PAGE, chunk_size=7)
+
+        assert whole.to_dict() == chunked.to_dict()
+        assert whole.distance(chunked) == {"char_distance": 0.0, "token_distance": 0.0,
+                                           "size_ratio": 1.0, "garbage_delta": 0}
+
+    @pytest.mark.unit
+    def test_changed_content_and_mojibake_are_flagged(self):
+        """Replaced copy moves the distributions and mojibake is counted"""
+        baseline = ContentFingerprint.from_page_source(PAGE)
+        broken = ContentFingerprint.from_page_source(
+            "<body><h1>Service unavailable</h1><p>Ã©rror â€” please retry later</p></body>")
+        metrics = broken.distance(baseline)
+
+        assert metrics["char_distance"] > ContentMonitor.MAX_CHAR_DISTANCE
+        assert metrics["token_distance"] > ContentMonitor.MAX_TOKEN_DISTANCE
+        assert metrics["garbage_delta"] == 2
+
+    @pytest.mark.unit
+    def test_monitor_saves_then_compares_baseline(self, tmp_path):
+        """First visit stores the baseline and fails once, later visits compare against it"""
+        store = ContentBaselineStore(tmp_path)
+        url = "https://mb.io/en-AE/markets?tab=crypto"
+
+        first = ContentMonitor(store)
+        assert first.capture(FakeDriver(url, PAGE))["status"] == "baseline saved"
+        assert store.path_for(url).name == "mb_io_en_AE_markets.json"
+        with pytest.raises(AssertionError, match="no baseline"):
+            first.verify()
+
+        same = ContentMonitor(store)
+        assert same.capture(FakeDriver(url, PAGE))["status"] == "ok"
+        same.verify()
+
+        changed = ContentMonitor(store)
+        changed.capture(FakeDriver(url, "<body><p>Maintenance</p></body>"))
+        with pytest.raises(AssertionError, match="Content regression"):
+            changed.verify()
@@ -4,7 +4,6 @@ from src.pages.home_page import HomePage
 from src.pages.about_page import AboutPage
 from src.pages.why_multilink_page import WhyMultilinkPage
 from src.utils.logger import log_info
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from src.pages.home_page import HomePage
 
@@ -27,6 +26,19 @@ class TestContentValidation:
         banners_count = home_page.get_marketing_banners_count()
         log_info(f"✓ Marketing banners test passed - Found {banners_count} banners")
 
+    @pytest.mark.regression
+    @allure.title("Verify marketing banner slides match visual baselines")
+    @allure.description("Compare a screenshot of every banner slide with its stored baseline")
+    def test_marketing_banners_visual(self, driver, visual_check):
+        """Test that marketing banner slides have not changed visually"""
+        home_page = HomePage(driver)
+        home_page.load()
+
+        with allure.step("Compare banner slides with baselines"):
+            home_page.verify_marketing_banners_match_baseline(visual_check)
+
+        log_info(f"✓ Marketing banners visual test passed - {len(visual_check.results)} slides compared")
+
     @pytest.mark.regression
     @allure.title("Verify download section is visible")
     @allure.description("Verify that the download section appears and is accessible")
@@ -105,7 +117,7 @@ class TestContentValidation:
     @pytest.mark.regression
     @allure.title("Verify Why why-multibank page renders correctly")
     @allure.description("Verify that Why why-multibank page renders with all expected components")
-    def test_why_multilink_page_renders(self, driver):
+    def test_why_multilink_page_renders(self, driver, wait):
         """Test that Why MultiLink page renders"""
         home_page = HomePage(driver)
         home_page.load()
@@ -114,7 +126,7 @@ class TestContentValidation:
         with allure.step("Click About link Awards Option"):
             home_page.click_about_link("WhyMultiBank")
 
-        WebDriverWait(driver, 10).until(EC.url_changes(initial_url))
+        wait.until(EC.url_changes(initial_url))
 
         current_url = driver.current_url
         assert "why-multibank" in current_url.lower() or "why-multibank" in driver.page_source.lower(), "Should navigate to why-multibank page"
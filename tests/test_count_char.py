@@ -0,0 +1,133 @@
+"""
+tests/test_count_char.py - Task2 character frequency counter unit tests
+"""
+
+import io
+import pytest
+import allure
+from Task2 import CountChar
+from Task2.CountChar import (CharCounter, count_text, count_stream, count_file, count_file_parallel,
+                             format_counts, split_utf8, main)
+
+
+@allure.feature("Task 2")
+@allure.story("Character frequency")
+class TestCountChar:
+    """Test cases for CountChar"""
+
+    @pytest.mark.unit
+    def test_sample_output_is_unchanged(self, capsys):
+        """Default options reproduce the original script's output"""
+        main(["--text", "hello world"])
+        assert capsys.readouterr().out.strip() == "h:1, e:1, l:3, o:2, w:1, r:1, d:1"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("include_spaces, ignore_case, expected", [
+        (False, True, "h:1, e:1, l:3, o:2, w:1, r:1, d:1"),
+        (True, True, "h:1, e:1, l:3, o:2,  :1, w:1, r:1, d:1"),
+        (False, False, "H:1, e:1, l:3, o:2, W:1, r:1, d:1"),
+    ])
+    def test_options(self, include_spaces, ignore_case, expected):
+        """include_spaces and ignore_case behave as in the original script"""
+        assert format_counts(count_text("Hello World", include_spaces, ignore_case)) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+    def test_stream_matches_text_for_any_chunk_size(self, chunk_size):
+        """Multi-byte characters split across chunks are counted once"""
+        text = "Grüße aus Dubai — €100, ¥200 🚀 " * 50
+        counts = count_stream(io.BytesIO(text.encode("utf-8")), chunk_size=chunk_size)
+        assert counts == count_text(text)
+
+    @pytest.mark.unit
+    def test_count_file(self, tmp_path):
+        """Files are counted in chunks"""
+        path = tmp_path / "page.html"
+        path.write_text("<div>AAA aaa</div>", encoding="utf-8")
+        counts = count_file(str(path), chunk_size=4)
+        assert counts["a"] == 6 and counts["d"] == 2 and " " not in counts
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("ignore_case", [True, False])
+    def test_parallel_matches_streaming(self, tmp_path, monkeypatch, ignore_case):
+        """mmap/process-pool engine gives the same counts and order as streaming"""
+        monkeypatch.setattr(CountChar, "MIN_SLICE_SIZE", 64)
+        path = tmp_path / "mixed.txt"
+        path.write_text("Grüße aus DUBAI — €100, ¥200 🚀 İstanbul\n" * 40, encoding="utf-8")
+
+        parallel = count_file_parallel(str(path), ignore_case=ignore_case, workers=3)
+        streaming = count_file(str(path), ignore_case=ignore_case)
+        assert list(parallel.items()) == list(streaming.items())
+
+    @pytest.mark.unit
+    def test_parallel_handles_invalid_utf8(self, tmp_path):
+        """Invalid UTF-8 falls back to the decoder's replacement character"""
+        path = tmp_path / "garbage.bin"
+        path.write_bytes(b"abc\xff\xc0\x80def\xe2\x82")
+        assert count_file_parallel(str(path), workers=1) == count_file(str(path))
+
+    @pytest.mark.unit
+    def test_split_never_cuts_a_character(self):
+        """Slice boundaries fall on UTF-8 character starts"""
+        data = "€🚀é".encode("utf-8") * 100
+        slices = split_utf8(data, 7)
+        assert slices[0][0] == 0 and slices[-1][1] == len(data)
+        for start, end in slices:
+            data[start:end].decode("utf-8")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_regex", [True, False])
+    @pytest.mark.parametrize("chunk_size", [1, 3, 5])
+    def test_incremental_graphemes_are_chunk_independent(self, monkeypatch, use_regex, chunk_size):
+        """Clusters split across update() calls are counted as one grapheme"""
+        if not use_regex:
+            monkeypatch.setattr(CountChar, "regex", None)
+        text = "é 👨‍👩‍👧 🇦🇪🇺🇸 Ä\r\n" * 3
+        data = text.encode("utf-8")
+
+        counter = CharCounter(graphemes=True, ignore_case=False)
+        for i in range(0, len(data), chunk_size):
+            counter.update(data[i:i + chunk_size])
+        counts = counter.flush()
+
+        assert counts["é"] == 3
+        assert counts["👨‍👩‍👧"] == 3
+        assert counts["🇦🇪"] == 3 and counts["🇺🇸"] == 3
+        assert counts["\r\n"] == 3
+
+    @pytest.mark.unit
+    def test_casefold_and_normalization(self):
+        """casefold folds ß; NFC/NFKC merge equivalent forms"""
+        assert CharCounter(casefold=True).update("Straße").flush()["s"] == 3
+        assert CharCounter().update("Straße").flush()["ß"] == 1
+
+        composed = CharCounter(normalize="NFC").update("é").update("é").flush()
+        assert composed == {"é": 2}
+        assert CharCounter(normalize="NFKC", ignore_case=False).update("ﬁ①").flush() == {"f": 1, "i": 1, "1": 1}
+
+    @pytest.mark.unit
+    def test_merge_combines_counters(self):
+        """merge() adds counts; options must match"""
+        left = CharCounter().update("abc ab")
+        right = CharCounter().update("cc")
+        assert left.merge(right).flush() == {"a": 2, "b": 2, "c": 3}
+
+        with pytest.raises(ValueError):
+            left.merge(CharCounter(casefold=True))
+
+    @pytest.mark.unit
+    def test_tailing_reads_only_new_bytes(self, tmp_path):
+        """update_from_file continues from the previous offset"""
+        path = tmp_path / "app.log"
+        path.write_text("aaa", encoding="utf-8")
+        counter = CharCounter().update_from_file(str(path))
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("bb")
+        counter.update_from_file(str(path), chunk_size=1)
+
+        assert counter.result() == {"a": 3, "b": 2}
+        assert counter._offsets[str(path)] == 5
+
+        path.write_text("c", encoding="utf-8")  # rotated
+        assert counter.update_from_file(str(path)).result() == {"a": 3, "b": 2, "c": 1}
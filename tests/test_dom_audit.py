@@ -0,0 +1,99 @@
+"""
+tests/test_dom_audit.py - In-page accessibility/DOM audit engine and findings cache unit tests
+"""
+
+import itertools
+import pytest
+import allure
+from src.constants.locators import AboutPageLocators, HomePageLocators
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.pages.about_page import AboutPage
+from src.pages.home_page import HomePage
+from src.utils.dom_audit import AuditCache, DomAuditor, violations
+
+
+def audit_result(dom_hash="0000abcd-10", findings=None, cached=False):
+    """Result of the audit script"""
+    if cached:
+        return {"dom_hash": dom_hash, "cached": True, "audit_ms": 0.1}
+    return {"dom_hash": dom_hash, "cached": False, "elements": 120, "audit_ms": 4.2,
+            "findings": findings or {"img-alt": {"rule": "img-alt", "count": 0, "samples": []}}}
+
+
+def execute_calls(grid, driver):
+    return [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/sync")
+
+
+@allure.feature("Framework")
+@allure.story("DOM Audit")
+class TestDomAudit:
+    """Test cases for DomAuditor, AuditCache and the page objects' accessibility checks"""
+
+    @pytest.mark.unit
+    def test_engine_injected_once_per_page(self):
+        """The first audit injects the engine and evaluates in the same call; later audits skip injection"""
+        installed = iter([audit_result()])
+        runs = iter([None, audit_result("0000abcd-11")])
+        with MockGrid(script_results={"/* domAudit */": lambda: next(runs),
+                                      "/* domAuditInstall */": lambda: next(installed)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            auditor = DomAuditor(driver, cache=AuditCache())
+            first = auditor.audit()
+            calls = execute_calls(grid, driver)
+            second = auditor.audit()
+            driver.quit()
+
+        assert calls == 2 and auditor.installs == 1
+        assert not first["cached"] and not second["cached"]
+        assert execute_calls(grid, driver) == 3
+
+    @pytest.mark.unit
+    def test_unchanged_dom_reuses_cached_findings(self):
+        """Same URL and DOM hash: the rules are not evaluated again and the findings come from the cache"""
+        findings = {"link-name": {"rule": "link-name", "count": 2, "samples": [["footer > a", "link has no name"]]}}
+        results = iter([audit_result(findings=findings), audit_result(cached=True)])
+        cache = AuditCache()
+        with MockGrid(script_results={"/* domAudit */": lambda: next(results)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            first = DomAuditor(driver, cache=cache).audit()
+            second = DomAuditor(driver, cache=cache).audit()
+            driver.quit()
+
+        assert second["cached"] and second["findings"] == first["findings"] == findings
+        assert violations(second) == {"link-name": [["footer > a", "link has no name"]]}
+
+    @pytest.mark.unit
+    def test_checks_translate_locators_and_report_errors(self):
+        """Scope and main locators become in-page lookups; checks that could not run count as failing"""
+        js_checks = DomAuditor.to_js_checks(HomePage.AUDIT_CHECKS)
+        about = DomAuditor.to_js_checks(AboutPage.AUDIT_CHECKS)
+        report = {"findings": {
+            "banner-alt": {"rule": "img-alt", "count": 0, "samples": [], "error": "scope not found"},
+            "img-alt": {"rule": "img-alt", "count": 1, "samples": [["img", "missing alt"]]},
+            "html-lang": {"rule": "html-lang", "count": 0, "samples": []},
+        }}
+
+        assert js_checks["banner-alt"] == {"rule": "img-alt", "scope": ["xpath", HomePageLocators.BANNER_SLIDER[1]],
+                                           "require_text": True}
+        assert js_checks["footer-link-name"]["scope"] == ["css", "footer"]
+        assert about["heading-order"]["main"] == ["css", AboutPageLocators.ABOUT_HEADER[1]]
+        assert violations(report) == {"banner-alt": "scope not found", "img-alt": [["img", "missing alt"]]}
+        assert violations(report, ("html-lang",)) == {}
+
+    @pytest.mark.unit
+    def test_page_verification_fails_on_findings(self):
+        """verify_accessibility asserts only the requested checks"""
+        findings = {"heading-order": {"rule": "heading-order", "count": 1, "samples": [["h4", "h2 -> h4 skips a level"]]},
+                    "html-lang": {"rule": "html-lang", "count": 0, "samples": []}}
+        hashes = (f"0000abcd-{n}" for n in itertools.count())
+        with MockGrid(script_results={"/* domAudit */": lambda: audit_result(next(hashes), findings)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            page = AboutPage(driver)
+            page.auditor.cache = AuditCache()
+            report = page.verify_accessibility("html-lang")
+            with pytest.raises(AssertionError, match="skips a level"):
+                page.verify_heading_order()
+            driver.quit()
+
+        assert report["findings"]["html-lang"]["count"] == 0
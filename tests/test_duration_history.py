@@ -0,0 +1,74 @@
+"""
+tests/test_duration_history.py - Duration history, LPT sharding and simulation unit tests
+"""
+
+import statistics
+import pytest
+import allure
+from src.utils.duration_history import DurationHistory, lpt_partition, simulate, parse_shard
+
+
+@allure.feature("Framework")
+@allure.story("Duration-aware scheduling")
+class TestDurationHistory:
+    """Test cases for duration history and scheduling"""
+
+    @pytest.mark.unit
+    def test_history_is_persisted_and_smoothed(self, tmp_path):
+        """Durations are summed per test, saved and smoothed across runs"""
+        path = str(tmp_path / "durations.json")
+        history = DurationHistory(path)
+        history.record("tests/a.py::test_a@lpt0", 1.0)
+        history.record("tests/a.py::test_a", 9.0)
+        history.save()
+        assert DurationHistory(path).durations == {"tests/a.py::test_a": 10.0}
+
+        history.record("tests/a.py::test_a", 20.0)
+        history.save()
+        assert DurationHistory(path).estimate("tests/a.py::test_a") == pytest.approx(13.0)
+
+    @pytest.mark.unit
+    def test_unknown_tests_use_median(self, tmp_path):
+        """Tests without history are estimated from the median"""
+        history = DurationHistory(str(tmp_path / "missing.json"))
+        assert history.estimate("new") == DurationHistory.DEFAULT_ESTIMATE
+        history.durations = {"a": 1.0, "b": 3.0, "c": 50.0}
+        assert history.estimate("new") == 3.0
+
+    @pytest.mark.unit
+    def test_median_computed_once_per_pass(self, tmp_path, monkeypatch):
+        """Ordering or sharding many unknown tests computes the fallback median once"""
+        calls = []
+        monkeypatch.setattr(statistics, "median", lambda values: calls.append(1) or 2.0)
+        history = DurationHistory(str(tmp_path / "missing.json"))
+        history.durations = {f"known{i}": float(i) for i in range(100)}
+        node_ids = [f"new{i}" for i in range(500)] + list(history.durations)
+
+        history.order_slowest_first(node_ids)
+        history.partition(node_ids, 4)
+
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_lpt_partition_balances_load(self):
+        """LPT puts the slowest tests on different shards"""
+        durations = {"a": 10, "b": 6, "c": 4, "d": 1}
+        shards = lpt_partition(durations, durations.get, 2)
+
+        assert sorted(load for load, _ in shards) == [10, 11]
+        assert ["b", "c"] in [node_ids for _, node_ids in shards]
+        assert sorted(n for _, node_ids in shards for n in node_ids) == sorted(durations)
+
+    @pytest.mark.unit
+    def test_simulate_slowest_first_beats_naive_order(self):
+        """Dispatching slow tests first shortens the predicted makespan"""
+        durations = [1, 1, 1, 1, 10]
+        assert simulate(durations, 2) == 12
+        assert simulate(sorted(durations, reverse=True), 2) == 10
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("value", ["0/2", "3/2", "a/b", "2"])
+    def test_invalid_shard_is_rejected(self, value):
+        """Shard spec must be i/N with 1 <= i <= N"""
+        with pytest.raises(ValueError):
+            parse_shard(value)
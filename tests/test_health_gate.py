@@ -0,0 +1,37 @@
+"""
+tests/test_health_gate.py - Site health gate and shared per-run result unit tests
+"""
+
+import pytest
+import allure
+from selenium.webdriver.common.by import By
+from src.drivers.mock_grid import MockGrid
+from src.utils.health_gate import HealthGate, SharedHealthResult
+
+
+@allure.feature("Framework")
+@allure.story("Site Health Gate")
+class TestHealthGate:
+    """Test cases for HealthGate and SharedHealthResult"""
+
+    @pytest.mark.unit
+    def test_probe_runs_through_the_grid(self):
+        """With a remote URL the browser probe opens a grid session instead of a local browser"""
+        with MockGrid() as grid:
+            site = grid.url.replace("/wd/hub", "/")
+            result = HealthGate(site, (By.TAG_NAME, "nav"), remote_url=grid.url).check("chrome")
+
+        assert result["healthy"], result["reason"]
+        assert grid.sessions_created == 1 and not grid.sessions
+
+    @pytest.mark.unit
+    def test_result_shared_between_processes(self, tmp_path):
+        """The first caller probes; later callers on the same run directory read its result"""
+        probes = []
+        probe = lambda: probes.append(1) or {"healthy": False, "reason": "HTTP 503"}
+
+        first = SharedHealthResult(str(tmp_path)).get(probe, timeout=1)
+        second = SharedHealthResult(str(tmp_path)).get(probe, timeout=1)
+
+        assert first == second == {"healthy": False, "reason": "HTTP 503"}
+        assert len(probes) == 1
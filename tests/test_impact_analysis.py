@@ -0,0 +1,75 @@
+"""
+tests/test_impact_analysis.py - Test-impact selection unit tests
+"""
+
+import pytest
+import allure
+from src.utils.impact_analysis import ImpactAnalyzer
+
+WHY_MULTILINK_TEST = "tests/test_content_validation.py::TestContentValidation::test_why_multilink_page_renders"
+PAGE_TITLE_TEST = "tests/test_navigation.py::TestNavigation::test_page_title"
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    return ImpactAnalyzer(cache_file=tmp_path / "impact.json").build()
+
+
+def locator_line(analyzer, name):
+    return analyzer.summaries["src/constants/locators.py"]["summary"]["symbols"][name]["lines"][0]
+
+
+@allure.feature("Framework")
+@allure.story("Test-impact selection")
+class TestImpactAnalysis:
+    """Test cases for ImpactAnalyzer"""
+
+    @pytest.mark.unit
+    def test_maps_test_to_page_methods_and_locators(self, analyzer):
+        """Test dependencies follow page-object methods down to locators"""
+        deps = analyzer.explain(WHY_MULTILINK_TEST)
+
+        assert "HomePage.click_about_link" in deps
+        assert "HomePageLocators.NAV_WHYMULTIBANK" in deps
+        assert "BasePage.click_element" in deps
+
+    @pytest.mark.unit
+    def test_locator_change_selects_only_dependent_tests(self, analyzer):
+        """Changing one locator selects the tests reaching it"""
+        line = locator_line(analyzer, "HomePageLocators.NAV_WHYMULTIBANK")
+        symbols, whole_files, run_all = analyzer.changed_symbols({"src/constants/locators.py": {line}})
+
+        affected = {t for t, name in analyzer.tests.items() if analyzer.dependencies(name) & symbols}
+        assert not run_all and not whole_files
+        assert WHY_MULTILINK_TEST in affected
+        assert PAGE_TITLE_TEST not in affected
+
+    @pytest.mark.unit
+    def test_framework_change_runs_everything(self, analyzer):
+        """Unmapped framework files select the whole suite"""
+        _, _, run_all = analyzer.changed_symbols({"conftest.py": {10}, "README.md": None})
+        assert run_all
+
+    @pytest.mark.unit
+    def test_count_char_change_runs_everything(self, analyzer):
+        """CountChar is a library used by content fingerprints, not a standalone script to ignore"""
+        _, _, run_all = analyzer.changed_symbols({"Task2/CountChar.py": None})
+        assert run_all
+
+    @pytest.mark.unit
+    def test_docs_change_selects_nothing(self, analyzer):
+        """Ignored files do not select any test"""
+        symbols, whole_files, run_all = analyzer.changed_symbols({"README.md": None})
+        assert not symbols and not whole_files and not run_all
+
+    @pytest.mark.unit
+    def test_mapping_is_cached_per_file(self, tmp_path):
+        """Rebuild reuses cached summaries for unchanged files"""
+        cache_file = tmp_path / "impact.json"
+        ImpactAnalyzer(cache_file=cache_file).build()
+        assert cache_file.exists()
+
+        rebuilt = ImpactAnalyzer(cache_file=cache_file)
+        rebuilt._summarize = None  # would fail if any file were re-parsed
+        rebuilt.build()
+        assert WHY_MULTILINK_TEST in rebuilt.tests
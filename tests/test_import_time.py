@@ -0,0 +1,59 @@
+"""
+tests/test_import_time.py - Import-time budget for conftest (paid by --collect-only and every xdist worker)
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+import allure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Backstop for gross regressions only (a cold import takes ~25ms); the heavy-module check is the real gate
+CONFTEST_BUDGET_MS = 1000
+HEAVY_MODULES = ("selenium", "webdriver_manager", "numpy", "requests", "jsonschema", "yaml", "psutil", "PIL")
+
+
+def import_conftest():
+    """Import conftest in a fresh interpreter after pytest, so only conftest's own cost is measured"""
+    # lazy_import() registers placeholders of type _LazyModule; only executed modules count
+    code = ("import sys, pytest, conftest; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} "
+            "if m in sys.modules and type(sys.modules[m]).__name__ != '_LazyModule'))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    line = next(l for l in result.stderr.splitlines() if l.rstrip().endswith("| conftest"))
+    cumulative_us = int(line.split("|")[1])
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return cumulative_us / 1000, loaded
+
+
+@allure.feature("Framework")
+@allure.story("Import-time budget")
+class TestImportTime:
+    """Test cases for deferred imports in conftest and the framework utilities"""
+
+    @pytest.mark.unit
+    def test_conftest_defers_heavy_imports(self):
+        """Selenium, webdriver managers, NumPy and friends are not imported by conftest"""
+        _, loaded = import_conftest()
+
+        assert loaded == [], f"conftest imported heavy modules eagerly: {loaded}"
+
+    @pytest.mark.unit
+    def test_conftest_import_within_budget(self):
+        """conftest imports well within the backstop budget (best of three, first run warms bytecode caches)"""
+        best_ms = min(import_conftest()[0] for _ in range(3))
+
+        assert best_ms < CONFTEST_BUDGET_MS, f"conftest import took {best_ms:.0f}ms (budget {CONFTEST_BUDGET_MS}ms)"
+
+    @pytest.mark.unit
+    def test_no_log_file_until_first_record(self, tmp_path):
+        """Importing and configuring logging does not create the log directory"""
+        code = ("import logging; from src.utils.logger import DeferredFileHandler; "
+                f"h = DeferredFileHandler({str(tmp_path / 'logs')!r}, 'test'); "
+                "import os; print(os.path.exists(os.path.dirname(h.baseFilename))); "
+                "h.emit(logging.makeLogRecord({'msg': 'x'})); print(os.path.exists(h.baseFilename))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+        assert result.stdout.split() == ["False", "True"]
@@ -0,0 +1,140 @@
+"""
+tests/test_lazy_element.py - LazyElement and ElementCache unit tests
+"""
+
+import pytest
+import allure
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.drivers.remote_grid import RemoteSessionPool
+from src.pages.base_page import BasePage
+from src.utils.command_profiler import CommandProfiler
+from src.utils.lazy_element import LazyElement, ElementCache
+
+ITEMS = (By.CSS_SELECTOR, "li.item")
+
+
+class FakeDriver:
+    """Minimal driver whose elements all go stale on every re-render"""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.generation = 0
+        self.find_calls = 0
+
+    def rerender(self):
+        self.generation += 1
+
+    def find_elements(self, by, value):
+        self.find_calls += 1
+        return [WebElement(self, f"{self.generation}-{i}") for i in range(len(self.texts))]
+
+    def execute(self, command, params=None):
+        generation, index = params["id"].split("-")
+        if int(generation) != self.generation:
+            raise StaleElementReferenceException("stale element reference")
+        if command == Command.GET_ELEMENT_TEXT:
+            return {"value": self.texts[int(index)]}
+        return {"value": None}
+
+    def get(self, url):
+        self.rerender()
+
+    def execute_script(self, script, *args):
+        return "complete"
+
+
+@allure.feature("Framework")
+@allure.story("Stale-resilient elements")
+class TestLazyElement:
+    """Test cases for LazyElement and ElementCache"""
+
+    @pytest.mark.unit
+    def test_element_re_resolves_after_rerender(self):
+        """Stale element is found again by locator and index"""
+        driver = FakeDriver(["BTC", "ETH"])
+        element = LazyElement(driver, ITEMS, 1, driver.find_elements(*ITEMS)[1])
+
+        driver.rerender()
+
+        assert element.text == "ETH"
+        assert element.id == "1-1"
+
+    @pytest.mark.unit
+    def test_element_resolves_lazily(self):
+        """Element without a resolved id is looked up on first use"""
+        driver = FakeDriver(["BTC"])
+        element = LazyElement(driver, ITEMS, 0)
+
+        assert driver.find_calls == 0
+        assert element.text == "BTC"
+        assert driver.find_calls == 1
+
+    @pytest.mark.unit
+    def test_get_elements_uses_cache_until_navigation(self):
+        """Repeated lookups hit the cache; navigation invalidates it"""
+        driver = FakeDriver(["BTC", "ETH", "XRP"])
+        page = BasePage(driver)
+
+        first = page.get_elements(ITEMS)
+        second = page.get_elements(ITEMS)
+        assert driver.find_calls == 1
+        assert [e.text for e in second] == ["BTC", "ETH", "XRP"]
+        assert first[0] is second[0]
+
+        page.navigate_to_url("https://example.test/")
+        assert len(ElementCache.for_driver(driver)) == 0
+        page.get_elements(ITEMS)
+        assert driver.find_calls == 2
+
+    @pytest.mark.unit
+    def test_cache_is_shared_between_page_objects(self):
+        """Page objects on the same driver share one cache"""
+        driver = FakeDriver(["BTC"])
+        assert BasePage(driver).element_cache is BasePage(driver).element_cache
+
+    @pytest.mark.unit
+    def test_cache_dropped_by_any_page_changing_command(self):
+        """Clicks and scripts sent outside BasePage invalidate the cache; reads keep it"""
+        with MockGrid() as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            page = BasePage(driver)
+            lookups = lambda: [path for _, path in grid.commands].count(f"/session/{driver.session_id}/elements")
+
+            elements = page.get_elements(ITEMS)
+            elements[0].get_attribute("class")
+            page.get_elements(ITEMS)
+            cached = lookups()
+            driver.find_element(*ITEMS).click()
+            page.get_elements(ITEMS)
+            after_click = lookups()
+            driver.execute_async_script("arguments[arguments.length - 1]();")
+            page.get_elements(ITEMS)
+            after_script = lookups()
+            driver.quit()
+
+        assert (cached, after_click, after_script) == (1, 2, 3)
+
+    @pytest.mark.unit
+    def test_cache_survives_profiler_on_reused_session(self):
+        """A profiler started before the page objects and stopped after them keeps the cache invalidating"""
+        with MockGrid() as grid:
+            pool = RemoteSessionPool(grid.url)
+            cached_after_click = []
+            for _ in range(2):
+                driver = pool.acquire("chrome", True)
+                profiler = CommandProfiler(driver).start()
+                page = BasePage(driver)
+                page.get_elements(ITEMS)
+                profiler.stop()
+                driver.find_element(*ITEMS).click()
+                cached_after_click.append(page.element_cache.get(ITEMS))
+                pool.release(driver, "chrome", True)
+            pool.close()
+
+        assert pool.reused == 1
+        assert cached_after_click == [None, None]
@@ -0,0 +1,102 @@
+"""
+tests/test_load_runner.py - Repeated-load runner and statistics unit tests, offline against a mock grid
+"""
+
+import pytest
+import allure
+from src.drivers.mock_grid import MockGrid
+from src.drivers.remote_grid import RemoteSessionPool
+from src.pages.home_page import HomePage
+from src.utils.load_runner import (LoadBaselineStore, LoadRunner, describe, holm, main, mann_whitney,
+                                   synthetic_timings)
+
+
+def run_offline(scale, seed, loads=10, browsers=2, cache="cold"):
+    """Run HomePage loads against a mock grid serving synthetic timings; returns (report, grid)"""
+    with MockGrid(script_results={"largest-contentful-paint": synthetic_timings(scale, seed)}) as grid:
+        sessions = RemoteSessionPool(grid.url)
+        drivers = [sessions.acquire("chrome", True) for _ in range(browsers)]
+        report = LoadRunner(HomePage, loads, cache).run(drivers, "home")
+        sessions.close()
+        for driver in drivers:
+            driver.quit()
+    return report, grid
+
+
+@allure.feature("Framework")
+@allure.story("Load Runner")
+class TestLoadRunner:
+    """Test cases for LoadRunner, describe and mann_whitney"""
+
+    @pytest.mark.unit
+    def test_mann_whitney_matches_reference_value(self):
+        """Fully separated samples of five give the textbook normal-approximation p-value"""
+        assert mann_whitney([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) == pytest.approx(0.0122, abs=1e-4)
+        assert mann_whitney([1, 2, 3], [1, 2, 3]) == 1.0
+
+    @pytest.mark.unit
+    def test_describe_reports_median_p95_and_interval(self):
+        """The confidence interval brackets the median"""
+        stats = describe([100, 110, 120, 130, 1000])
+
+        assert (stats["n"], stats["median"]) == (5, 120)
+        assert stats["ci"][0] <= stats["median"] <= stats["ci"][1]
+        assert stats["p95"] > 130
+
+    @pytest.mark.unit
+    def test_runner_collects_k_loads_per_browser(self):
+        """Every browser loads the page K times; cold mode clears cookies, cache and storage before each load"""
+        report, grid = run_offline(1.0, seed=1, loads=5, browsers=3)
+        cdp = [cmd for cmd, _ in grid.cdp_commands]
+        origins = {params["origin"] for cmd, params in grid.cdp_commands if cmd == "Storage.clearDataForOrigin"}
+
+        assert len(report.samples) == 15
+        assert {s["session"] for s in report.samples} == {0, 1, 2}
+        assert cdp.count("Network.clearBrowserCache") == cdp.count("Network.clearBrowserCookies") == 15
+        assert origins == {"https://trade.multibank.io"}
+
+    @pytest.mark.unit
+    def test_warm_mode_discards_priming_load(self):
+        """Warm mode measures K loads after one unmeasured load and never clears the cache"""
+        report, grid = run_offline(1.0, seed=1, loads=4, browsers=1, cache="warm")
+
+        assert len(report.samples) == 4
+        assert not [path for _, path in grid.commands if path.endswith("/goog/cdp/execute")]
+
+    @pytest.mark.unit
+    def test_comparison_flags_only_significant_slowdowns(self):
+        """A 30% slowdown regresses; a rerun of the same distribution does not"""
+        baseline, _ = run_offline(1.0, seed=1)
+        rerun, _ = run_offline(1.0, seed=2)
+        slower, _ = run_offline(1.3, seed=3)
+
+        assert not any(row["regressed"] for row in rerun.compare(baseline.samples).values())
+        assert slower.compare(baseline.samples)["lcp_ms"]["regressed"]
+
+    @pytest.mark.unit
+    def test_holm_adjusts_for_the_number_of_metrics(self):
+        """The smallest p-value is multiplied by the metric count, later ones never drop below it"""
+        adjusted = holm({"ttfb_ms": 0.04, "lcp_ms": 0.01, "cls": 0.03})
+
+        assert adjusted == pytest.approx({"lcp_ms": 0.03, "cls": 0.06, "ttfb_ms": 0.06})
+
+    @pytest.mark.unit
+    def test_cold_mode_needs_chromium(self):
+        """Firefox cannot clear its cache and storage through CDP, so a cold run refuses it"""
+        with MockGrid() as grid:
+            sessions = RemoteSessionPool(grid.url)
+            driver = sessions.acquire("firefox", True)
+            with pytest.raises(ValueError, match="Chromium"):
+                LoadRunner(HomePage, 1, "cold").run([driver])
+            sessions.close()
+            driver.quit()
+
+    @pytest.mark.unit
+    def test_cli_saves_baseline_then_fails_on_regression(self, tmp_path, monkeypatch):
+        """The offline CLI stores the first run as baseline and exits 1 on a significant regression"""
+        monkeypatch.chdir(tmp_path)
+        args = ["--loads", "10", "--browsers", "2", "--baseline-dir", "b"]
+
+        assert main(args + ["--offline", "1.0", "--seed", "1"]) == 0
+        assert LoadBaselineStore("b").load("home_cold") is not None
+        assert main(args + ["--offline", "1.3", "--seed", "2"]) == 1
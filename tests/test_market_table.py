@@ -0,0 +1,85 @@
+"""
+tests/test_market_table.py - Market table extraction, diffing and streaming fixture page unit tests
+"""
+
+import http.client
+import json
+import math
+import time
+import pytest
+import allure
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.drivers.mock_market import MockMarketServer
+from src.pages.trading_page import TradingPage
+from src.utils.market_table import MarketTable
+
+
+def columns(prices, symbols=None, volume=None):
+    """Column arrays as returned by the extraction script"""
+    symbols = symbols or [f"P{i}/USDT" for i in range(len(prices))]
+    return {"captured_at": 1000.0, "symbol": symbols, "price": prices, "change": [0.5] * len(prices),
+            "volume": volume or [1e6] * len(prices)}
+
+
+@allure.feature("Framework")
+@allure.story("Market Table")
+class TestMarketTable:
+    """Test cases for MarketTable, TradingPage.read_pairs and MockMarketServer"""
+
+    @pytest.mark.unit
+    def test_columns_become_typed_rows(self):
+        """Numbers are float64 with NaN for unparsable cells; rows read back as records"""
+        table = MarketTable.from_columns(columns([43210.55, None], ["BTC/USDT", "ETH/USDT"]))
+
+        assert table.rows.dtype["price"].kind == "f" and len(table) == 2
+        assert table["BTC/USDT"] == {"symbol": "BTC/USDT", "price": 43210.55, "change": 0.5, "volume": 1e6}
+        assert table["ETH/USDT"]["price"] is None
+        assert table.incomplete() == ["ETH/USDT"]
+
+    @pytest.mark.unit
+    def test_diff_matches_rows_by_symbol(self):
+        """Reordered rows are matched by symbol; moved, added and removed pairs are reported"""
+        before = MarketTable.from_columns(columns([1.0, 2.0, 3.0], ["A", "B", "C"]))
+        after = MarketTable.from_columns(columns([3.0, 2.5, 9.0], ["C", "B", "D"]))
+        diff = after.diff(before)
+
+        assert (diff.added, diff.removed, diff.changed, diff.unchanged) == (["D"], ["A"], ["B"], 1)
+        assert diff.price_moves == {"B": 0.5}
+        assert not before.diff(before)
+
+    @pytest.mark.unit
+    def test_read_pairs_is_one_round_trip(self):
+        """Thousands of rows are extracted with a single script call"""
+        data = columns([float(i) for i in range(5000)])
+        with MockGrid(script_results={"/* extractTable */": data}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            table = TradingPage(driver).read_pairs()
+            calls = [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/sync")
+            driver.quit()
+
+        assert len(table) == 5000 and calls == 1
+        assert table.rows["price"][-1] == 4999.0
+
+    @pytest.mark.unit
+    def test_fixture_page_streams_ticks_at_rate(self):
+        """The local market page renders every pair and /ticks streams batches at the requested rate"""
+        with MockMarketServer(pairs=50, ticks_per_second=2000) as market:
+            host, port = market.url[len("http://"):].rstrip("/").split(":")
+            connection = http.client.HTTPConnection(host, int(port), timeout=5)
+            connection.request("GET", "/")
+            page = connection.getresponse().read().decode("utf-8")
+            connection = http.client.HTTPConnection(host, int(port), timeout=5)
+            connection.request("GET", "/ticks")
+            stream = connection.getresponse()
+            started, ticks = time.perf_counter(), []
+            while time.perf_counter() - started < 0.3:
+                line = stream.fp.readline().decode("utf-8")
+                if line.startswith("data: "):
+                    ticks.extend(json.loads(line[len("data: "):]))
+            elapsed = time.perf_counter() - started
+            connection.close()
+
+        assert page.count('class="pair-item"') == 50
+        assert all(len(tick) == 4 and 0 <= tick[0] < 50 and math.isfinite(tick[1]) for tick in ticks)
+        assert 0.5 * 2000 * elapsed < len(ticks) < 1.5 * 2000 * elapsed
@@ -0,0 +1,97 @@
+"""
+tests/test_matrix_loader.py - YAML test matrix loader unit tests
+"""
+
+import pytest
+import allure
+from src.utils.matrix_loader import MatrixLoader, iter_cases
+
+MATRIX = """
+name: menu
+axes:
+  browser: [chrome, firefox]
+  option:
+    - {id: awards, label: Awards}
+    - {id: why, label: WhyMultiBank}
+exclude:
+  - {browser: firefox, option: why}
+include:
+  - {browser: edge, option: {id: awards, label: Awards}}
+"""
+
+
+@pytest.fixture
+def loader(tmp_path):
+    (tmp_path / "matrices").mkdir()
+    return MatrixLoader(tmp_path / "matrices", tmp_path / "cache")
+
+
+def write(loader, name, text):
+    loader.path_for(name).write_text(text)
+
+
+@allure.feature("Framework")
+@allure.story("Test matrices")
+class TestMatrixLoader:
+    """Test cases for MatrixLoader and iter_cases"""
+
+    @pytest.mark.unit
+    def test_cross_product_with_exclude_and_include(self, loader):
+        """Axes are crossed, excluded combinations dropped and extra cases appended"""
+        write(loader, "menu", MATRIX)
+        cases = dict(iter_cases(loader.load("menu")))
+
+        assert list(cases) == ["chrome-awards", "chrome-why", "firefox-awards", "edge-awards"]
+        assert cases["chrome-why"]["option"]["label"] == "WhyMultiBank"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("text, message", [
+        ("name: x\naxes: {}\n", "axes"),
+        ("name: x\naxes:\n  option: [{label: Awards}]\n", "axes/option/0"),
+        ("name: x\naxes:\n  option: [a]\nexclude: [{browser: chrome}]\n", "unknown axes"),
+    ])
+    def test_invalid_matrix_is_rejected(self, loader, text, message):
+        """Schema violations name the file and the failing location"""
+        write(loader, "bad", text)
+
+        with pytest.raises(ValueError, match=message):
+            loader.load("bad")
+
+    @pytest.mark.unit
+    def test_parsed_matrix_is_cached_by_file_hash(self, loader, monkeypatch):
+        """An unchanged file is served from the cache without YAML parsing; an edit re-parses"""
+        write(loader, "menu", MATRIX)
+        loader.load("menu")
+
+        fresh = MatrixLoader(loader.directory, loader.cache_dir)
+        monkeypatch.setattr(MatrixLoader, "_parse", staticmethod(lambda *a: pytest.fail("re-parsed")))
+        assert fresh.load("menu")["name"] == "menu"
+
+        monkeypatch.undo()
+        write(loader, "menu", MATRIX.replace("name: menu", "name: menu2"))
+        assert fresh.load("menu")["name"] == "menu2"
+        assert len(list(loader.cache_dir.glob("*.json"))) == 2
+
+    @pytest.mark.unit
+    def test_loader_version_is_part_of_cache_key(self, loader, monkeypatch):
+        """A matrix cached by an older loader is parsed again instead of being served stale"""
+        write(loader, "menu", MATRIX)
+        loader.load("menu")
+
+        monkeypatch.setattr(MatrixLoader, "LOADER_VERSION", MatrixLoader.LOADER_VERSION + 1)
+        parsed = []
+        parse = MatrixLoader._parse
+        monkeypatch.setattr(MatrixLoader, "_parse", staticmethod(lambda *a: parsed.append(a) or parse(*a)))
+        assert MatrixLoader(loader.directory, loader.cache_dir).load("menu")["name"] == "menu"
+        assert len(parsed) == 1
+        assert len(list(loader.cache_dir.glob("*.json"))) == 2
+
+    @pytest.mark.unit
+    def test_large_matrix_generates_lazily(self, loader):
+        """A 20x20x20 matrix yields its first case without building the product"""
+        values = ", ".join(f"v{i}" for i in range(20))
+        write(loader, "big", f"name: big\naxes:\n  a: [{values}]\n  b: [{values}]\n  c: [{values}]\n")
+        cases = iter_cases(loader.load("big"))
+
+        assert next(cases)[0] == "v0-v0-v0"
+        assert sum(1 for _ in cases) == 7999
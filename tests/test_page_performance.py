@@ -0,0 +1,91 @@
+"""
+tests/test_page_performance.py - Page-performance measurement unit tests
+"""
+
+import pytest
+import allure
+from src.config.settings import PerformanceBudgets
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.pages.base_page import BasePage
+from src.utils.page_performance import (PerformanceMonitor, PerformanceStore, budget_violations, page_metrics,
+                                        percentile, run_violations)
+
+
+def timing_entries(ttfb=120.0, lcp=900.0, cls=0.02, url="https://example.test/markets"):
+    """Raw result of the collection script for one load"""
+    return {
+        "url": url,
+        "navigation": {"responseStart": ttfb, "domContentLoadedEventEnd": 400.0, "loadEventEnd": 700.0,
+                       "transferSize": 5000},
+        "paint": [{"name": "first-paint", "startTime": 300.0}, {"name": "first-contentful-paint", "startTime": 350.0}],
+        "resources": [{"name": "app.js", "initiatorType": "script", "startTime": 10.0, "duration": 250.0,
+                       "transferSize": 20000},
+                      {"name": "logo.svg", "initiatorType": "img", "startTime": 20.0, "duration": 30.0,
+                       "transferSize": 0}],
+        "lcp": lcp,
+        "cls": cls,
+    }
+
+
+@allure.feature("Framework")
+@allure.story("Page Performance")
+class TestPagePerformance:
+    """Test cases for page metrics, budgets and PerformanceMonitor"""
+
+    @pytest.mark.unit
+    def test_entries_reduce_to_flat_metrics(self):
+        """Navigation, paint and resource entries become TTFB/FCP/LCP/CLS and transfer totals"""
+        metrics = page_metrics(timing_entries())
+
+        assert (metrics["ttfb_ms"], metrics["fcp_ms"], metrics["lcp_ms"], metrics["cls"]) == (120.0, 350.0, 900.0, 0.02)
+        assert metrics["transfer_bytes"] == 25000 and metrics["resource_count"] == 2
+        assert metrics["slowest_resources"][0]["name"] == "app.js"
+
+    @pytest.mark.unit
+    def test_budgets_apply_to_percentile_of_repeated_loads(self):
+        """One slow load in nineteen passes a p90 budget; three in twenty break it; a 0 budget is disabled"""
+        fast = [page_metrics(timing_entries(lcp=1000.0)) for _ in range(17)]
+        slow = page_metrics(timing_entries(lcp=4000.0))
+        budgets = PerformanceBudgets(percentile=90, lcp_ms=2500, ttfb_ms=0)
+
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+        assert budget_violations(fast + [fast[0], slow], budgets) == []
+        assert budget_violations(fast + [slow] * 3, budgets) == ["lcp_ms p90 4000 > 2500"]
+
+    @pytest.mark.unit
+    def test_navigation_measures_with_one_script_call(self):
+        """navigate_to_url records a sample per load through a single async script"""
+        with MockGrid(script_results={"largest-contentful-paint": timing_entries(lcp=3000.0)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            monitor = PerformanceMonitor(PerformanceBudgets(lcp_ms=2500)).attach(driver)
+            page = BasePage(driver)
+            page.navigate_to_url("https://example.test/markets")
+            page.navigate_to_url("https://example.test/markets")
+            monitor.detach(driver)
+            driver.quit()
+
+        assert [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/async") == 2
+        samples = monitor.take()
+        assert [sample["page"] for sample in samples] == ["example_test_markets"] * 2
+        assert monitor.take() == []
+
+    @pytest.mark.unit
+    def test_budgets_need_minimum_samples_and_cover_the_run(self):
+        """Two slow loads are too few for a p95; a run's loads of a page are judged together"""
+        slow = page_metrics(timing_entries(lcp=3000.0))
+        budgets = PerformanceBudgets(lcp_ms=2500, min_samples=5)
+
+        assert budget_violations([slow] * 2, budgets) == []
+        assert run_violations({"example_test_markets": [slow] * 2, "example_test_home": [slow] * 5}, budgets) \
+            == {"example_test_home": ["lcp_ms p95 3000 > 2500"]}
+
+    @pytest.mark.unit
+    def test_run_is_stored_per_page(self, tmp_path):
+        """Each run directory holds one file per page with samples, summary and violations"""
+        store = PerformanceStore(tmp_path)
+        samples = {"example_test_markets": [page_metrics(timing_entries())]}
+        run_dir = store.save_run("20260101_120000", samples, PerformanceBudgets())
+
+        assert (run_dir / "example_test_markets.json").exists()
+        assert store.load_run("20260101_120000") == samples
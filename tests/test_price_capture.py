@@ -0,0 +1,89 @@
+"""
+tests/test_price_capture.py - In-page price update capture unit tests, offline against a mock grid
+"""
+
+import json
+import pytest
+import allure
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.pages.trading_page import TradingPage
+from src.utils.price_capture import PriceCapture, WebSocketTap
+
+
+def batch(updates, now, dropped=0):
+    """Result of the drain script: updates are (symbol, epoch_ms, price)"""
+    return {"symbol": [u[0] for u in updates], "t": [u[1] for u in updates], "price": [u[2] for u in updates],
+            "dropped": dropped, "now": now}
+
+
+def capture_grid(*batches):
+    """Mock grid whose page has symbols A, B and C and drains the given batches in order"""
+    drains = iter(batches)
+    return MockGrid(script_results={
+        "/* priceCaptureInstall */": {"symbols": ["A", "B", "C"], "started_at": 0.0},
+        "/* priceCaptureDrain */": lambda: next(drains),
+    })
+
+
+class PerformanceLogDriver:
+    """Stand-in driver serving Chromium performance-log entries"""
+
+    def __init__(self, messages):
+        self.entries = [{"timestamp": 1000.0 + i, "message": json.dumps({"message": m})} for i, m in enumerate(messages)]
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+@allure.feature("Framework")
+@allure.story("Price Capture")
+class TestPriceCapture:
+    """Test cases for PriceCapture, WebSocketTap and TradingPage.verify_prices_ticking"""
+
+    @pytest.mark.unit
+    def test_batches_become_per_symbol_rate_and_staleness(self):
+        """Each drain is one call; gaps include the window edges and silent symbols are fully stale"""
+        with capture_grid(batch([("A", 100.0, 1.0), ("B", 200.0, 5.0), ("A", 300.0, 1.1)], now=500.0),
+                          batch([("A", 900.0, 1.2)], now=1000.0)) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            capture = PriceCapture(driver).start()
+            capture.drain()
+            capture.drain()
+            calls = [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/sync")
+            driver.quit()
+        metrics = capture.metrics()
+
+        assert calls == 3
+        assert metrics["A"] == {"updates": 3, "rate_per_s": 3.0, "max_gap_ms": 600.0, "staleness_ms": 100.0,
+                                "last_price": 1.2}
+        assert (metrics["B"]["staleness_ms"], metrics["B"]["max_gap_ms"]) == (800.0, 800.0)
+        assert metrics["C"]["updates"] == 0 and metrics["C"]["staleness_ms"] == 1000.0
+
+    @pytest.mark.unit
+    def test_ticking_check_reports_stale_and_silent_symbols(self):
+        """Too few ticking symbols or a stale one fails the check"""
+        with capture_grid(batch([("A", 100.0, 1.0)], now=3000.0, dropped=7),
+                          batch([("A", 2900.0, 1.0), ("B", 100.0, 2.0)], now=3000.0)) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            page = TradingPage(driver)
+            with pytest.raises(AssertionError, match="Only 1 of 3 symbols"):
+                page.verify_prices_ticking(duration=0, min_ticking=2)
+            with pytest.raises(AssertionError, match=r"stale for more than 1000 ms: \['B'\]"):
+                page.verify_prices_ticking(duration=0, max_staleness_ms=1000)
+            driver.quit()
+
+    @pytest.mark.unit
+    def test_websocket_frames_feed_the_same_metrics(self):
+        """Frames from the performance log are parsed into updates; other DevTools events are ignored"""
+        frame = {"method": "Network.webSocketFrameReceived",
+                 "params": {"response": {"payloadData": json.dumps({"s": "A", "p": 1.5})}}}
+        tap = WebSocketTap(PerformanceLogDriver([{"method": "Network.requestWillBeSent", "params": {}}, frame]),
+                           parse=lambda payload: [(json.loads(payload)["s"], json.loads(payload)["p"])])
+        capture = PriceCapture(driver=None)
+        capture.started_at, capture.last_drain_at = 0.0, 2000.0
+        capture.add_updates(tap.drain())
+
+        assert tap.frames == 1
+        assert capture.metrics()["A"]["last_price"] == 1.5
@@ -0,0 +1,101 @@
+"""
+tests/test_remote_grid.py - Remote grid backend unit tests against a local mock grid
+"""
+
+import time
+import pytest
+import allure
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.drivers.remote_grid import RemoteSessionPool
+
+
+@allure.feature("Framework")
+@allure.story("Remote Grid")
+class TestRemoteGrid:
+    """Test cases for DriverFactory remote mode and RemoteSessionPool"""
+
+    @pytest.mark.unit
+    def test_remote_driver_sends_options_as_capabilities(self):
+        """Remote sessions are created from browser options, not desired_capabilities"""
+        with MockGrid() as grid:
+            driver = DriverFactory.create_driver("chrome", headless=True, remote_url=grid.url)
+            driver.get("https://example.test/")
+            current_url = driver.current_url
+            driver.quit()
+
+        assert current_url == "https://example.test/"
+        assert grid.sessions_created == 1 and not grid.sessions
+
+    @pytest.mark.unit
+    def test_commands_reuse_keep_alive_connections(self):
+        """Many commands from several sessions travel over a handful of TCP connections"""
+        with MockGrid() as grid:
+            pool = RemoteSessionPool(grid.url)
+            drivers = [pool.acquire("chrome", True) for _ in range(3)]
+            for _ in range(20):
+                for driver in drivers:
+                    driver.get("https://example.test/")
+            for driver in drivers:
+                pool.release(driver, "chrome", True)
+            connections, commands = grid.connections, len(grid.commands)
+            pool.close()
+
+        assert commands > 60
+        assert connections == 1
+
+    @pytest.mark.unit
+    def test_released_session_is_reset_and_reused(self):
+        """A released session is cleaned and handed to the next test instead of a new one"""
+        with MockGrid() as grid:
+            pool = RemoteSessionPool(grid.url)
+            first = pool.acquire("chrome", True)
+            first.get("https://example.test/account")
+            session_id = first.session_id
+            pool.release(first, "chrome", True)
+            second = pool.acquire("chrome", True)
+            reset_url = second.current_url
+            pool.release(second, "chrome", True)
+            pool.close()
+
+        assert second.session_id == session_id
+        assert reset_url == "about:blank"
+        assert grid.sessions_created == 1 and pool.reused == 1
+        assert ("Network.clearBrowserCookies", {}) in grid.cdp_commands
+        assert ("Storage.clearDataForOrigin", {"origin": "https://example.test", "storageTypes": "all"}) \
+            in grid.cdp_commands
+        assert not grid.sessions
+
+    @pytest.mark.unit
+    def test_non_chromium_session_is_quit_on_release(self):
+        """Firefox storage cannot be cleared per origin, so its session is quit; the shared pool survives"""
+        with MockGrid() as grid:
+            pool = RemoteSessionPool(grid.url)
+            first = pool.acquire("firefox", True)
+            first.get("https://example.test/account")
+            pool.release(first, "firefox", True)
+            second = pool.acquire("firefox", True)
+            second.get("https://example.test/")
+            pool.release(second, "firefox", True)
+            pool.close()
+
+        assert type(first.command_executor).__name__ == "PooledFirefoxRemoteConnection"
+        assert second.session_id != first.session_id
+        assert grid.sessions_created == 2 and pool.reused == 0
+        assert grid.connections == 1
+        assert not grid.sessions
+
+    @pytest.mark.unit
+    def test_prewarm_creates_sessions_in_parallel(self):
+        """Session creation latency overlaps instead of adding up"""
+        with MockGrid(session_delay=0.3) as grid:
+            pool = RemoteSessionPool(grid.url)
+            start = time.perf_counter()
+            pool.prewarm("chrome", True, 4)
+            elapsed = time.perf_counter() - start
+            drivers = [pool.acquire("chrome", True) for _ in range(4)]
+            pool.close()
+
+        assert elapsed < 4 * 0.3 * 0.6
+        assert grid.sessions_created == 4
+        assert len({d.session_id for d in drivers}) == 4
@@ -0,0 +1,62 @@
+"""
+tests/test_resource_monitor.py - Browser process-tree monitor unit tests
+"""
+
+import subprocess
+import sys
+import time
+import psutil
+import pytest
+import allure
+from src.utils.resource_monitor import ProcessTreeMonitor, get_process_tree
+
+SLEEPER = [sys.executable, "-c", "import time; time.sleep(60)"]
+
+
+@pytest.fixture
+def process_tree():
+    """Parent process with one child, standing in for chromedriver + browser"""
+    parent = subprocess.Popen([sys.executable, "-c",
+                               f"import subprocess, time; subprocess.Popen({SLEEPER!r}); time.sleep(60)"])
+    for _ in range(50):
+        if len(get_process_tree(parent.pid)) == 2:
+            break
+        time.sleep(0.05)
+    yield parent
+    parent.kill()
+    parent.wait()
+
+
+@allure.feature("Framework")
+@allure.story("Browser resource monitor")
+class TestResourceMonitor:
+    """Test cases for ProcessTreeMonitor"""
+
+    @pytest.mark.unit
+    def test_samples_whole_process_tree(self, process_tree):
+        """Samples include the root process and its children"""
+        monitor = ProcessTreeMonitor(process_tree.pid, interval=0.05).start()
+        summary = monitor.stop()
+
+        assert summary["samples"] >= 1
+        assert summary["peak_processes"] == 2
+        assert summary["peak_rss_mb"] > 0
+
+    @pytest.mark.unit
+    def test_reap_kills_orphaned_children(self, process_tree):
+        """Children left behind after the root exits are killed"""
+        monitor = ProcessTreeMonitor(process_tree.pid, interval=0.05).start()
+        monitor.stop()
+        child_pids = [p.pid for p in get_process_tree(process_tree.pid)[1:]]
+
+        process_tree.kill()
+        process_tree.wait()
+        killed = monitor.reap(timeout=1)
+
+        assert set(child_pids) <= set(killed)
+        assert all(p.status() == psutil.STATUS_ZOMBIE for p in get_process_tree(child_pids[0]))
+
+    @pytest.mark.unit
+    def test_missing_process_gives_empty_summary(self):
+        """Monitoring a PID that does not exist yields no samples"""
+        assert ProcessTreeMonitor(None).stop() == {"pid": None, "samples": 0}
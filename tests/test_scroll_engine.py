@@ -0,0 +1,82 @@
+"""
+tests/test_scroll_engine.py - Scrolling engine unit tests, offline against a mock grid
+"""
+
+import pytest
+import allure
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import ELEMENT_KEY, MockGrid
+from src.pages.home_page import HomePage
+from src.utils.scroll_engine import ScrollEngine, to_css_selector, to_js_locator
+
+
+def scroll_result(found=True, steps=3):
+    """Raw result of the scroll script"""
+    return {"found": found, "element": {ELEMENT_KEY: "banner"} if found else None, "steps": steps,
+            "scrollY": 2400, "scrollHeight": 3200, "elapsedMs": 420}
+
+
+def async_calls(grid, driver):
+    return [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/async")
+
+
+@allure.feature("Framework")
+@allure.story("Scrolling Engine")
+class TestScrollEngine:
+    """Test cases for ScrollEngine and to_js_locator"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("locator, expected", [
+        ((By.CSS_SELECTOR, ".slick-slide"), ("css", ".slick-slide")),
+        ((By.XPATH, "//footer"), ("xpath", "//footer")),
+        ((By.ID, "footer"), ("xpath", '//*[@id="footer"]')),
+        ((By.CLASS_NAME, "pair-item"), ("css", ".pair-item")),
+        ((By.TAG_NAME, "footer"), ("css", "footer")),
+        ((By.LINK_TEXT, "About"), ("xpath", '//a[normalize-space(.)="About"]')),
+    ])
+    def test_locators_translate_to_in_page_lookups(self, locator, expected):
+        """Every Selenium strategy maps onto querySelector or document.evaluate"""
+        assert to_js_locator(locator) == expected
+
+    @pytest.mark.unit
+    def test_css_selector_only_for_css_translatable_locators(self):
+        """Class names become CSS for querySelector-based scripts; XPath-only locators are refused"""
+        assert to_css_selector((By.CLASS_NAME, "pair-price")) == ".pair-price"
+        with pytest.raises(ValueError, match="no CSS equivalent"):
+            to_css_selector((By.XPATH, "//button[@data-category='crypto']"))
+
+    @pytest.mark.unit
+    def test_scroll_to_returns_element_in_one_call(self):
+        """Stepping and waiting for lazy content happen in the browser: one round trip per scroll"""
+        with MockGrid(script_results={"/* scrollUntil */": scroll_result()}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            element = ScrollEngine(driver).scroll_to((By.CSS_SELECTOR, ".banner"))
+            calls = async_calls(grid, driver)
+            driver.quit()
+
+        assert isinstance(element, WebElement) and element.id == "banner"
+        assert calls == 1
+
+    @pytest.mark.unit
+    def test_unreached_element_times_out(self):
+        """Reaching the page end without the target raises TimeoutException with the scroll summary"""
+        with MockGrid(script_results={"/* scrollUntil */": scroll_result(found=False, steps=7)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            with pytest.raises(TimeoutException, match="after 7 steps"):
+                ScrollEngine(driver).scroll_to((By.ID, "missing"), timeout=1)
+            driver.quit()
+
+    @pytest.mark.unit
+    def test_banner_check_scrolls_to_banner(self):
+        """HomePage reaches the marketing banners through the engine instead of jumping to the bottom"""
+        slides = [{"index": 0, "current": True, "src": "banner_0.png", "state": "loaded"}]
+        with MockGrid(script_results={"/* scrollUntil */": scroll_result(), "/* slickSlides */": slides}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            HomePage(driver).verify_marketing_banners_visible()
+            calls = async_calls(grid, driver)
+            driver.quit()
+
+        assert calls == 1
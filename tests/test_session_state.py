@@ -0,0 +1,89 @@
+"""
+tests/test_session_state.py - Session snapshot/restore unit tests against a mock grid and a stand-in auth server
+"""
+
+import time
+import pytest
+import allure
+import requests
+from src.drivers.mock_auth import SESSION_COOKIE, MockAuthServer
+from src.drivers.mock_grid import MockGrid
+from src.drivers.remote_grid import RemoteSessionPool
+from src.utils.session_state import SessionCipher, SessionStateCache, SessionStateStore
+
+
+def captured_storage(origin="https://trade.example.test"):
+    """Result of the capture script in a logged-in browser"""
+    return {"origin": origin, "local": {"mb_user": '"trader"'}, "session": {"mb_tab_token": "abc"}}
+
+
+@allure.feature("Framework")
+@allure.story("Session State")
+class TestSessionState:
+    """Test cases for SessionCipher, SessionStateStore, SessionStateCache and MockAuthServer"""
+
+    @pytest.mark.unit
+    def test_snapshot_file_is_encrypted_and_authenticated(self, tmp_path):
+        """Nothing readable lands on disk; a modified file or another key reads as no snapshot"""
+        store = SessionStateStore(tmp_path, SessionCipher("s3cret"))
+        store.save("trader", {"cookies": [{"name": SESSION_COOKIE, "value": "token-123"}]})
+        path = store.path("trader")
+
+        assert b"token-123" not in path.read_bytes()
+        assert store.load("trader")["cookies"][0]["value"] == "token-123"
+        assert SessionStateStore(tmp_path, SessionCipher("other")).load("trader") is None
+        path.write_bytes(path.read_bytes()[:-4] + b"AAAA")
+        assert store.load("trader") is None
+
+    @pytest.mark.unit
+    def test_snapshot_expires(self, tmp_path):
+        """A snapshot older than its ttl is ignored; the key file is created on first use"""
+        store = SessionStateStore(tmp_path, ttl=0.05)
+        store.save("trader", {"cookies": []})
+        time.sleep(0.1)
+
+        assert store.load("trader") is None
+        assert (tmp_path / ".key").stat().st_mode & 0o077 == 0
+
+    @pytest.mark.unit
+    def test_login_runs_once_for_all_pooled_sessions(self, tmp_path):
+        """The first restore logs in; every pooled browser then gets cookies and storage injected"""
+        logins = []
+
+        def login(driver):
+            logins.append(driver.session_id)
+            driver.add_cookie({"name": SESSION_COOKIE, "value": "token-123", "domain": "trade.example.test"})
+
+        with MockGrid(script_results={"/* captureStorage */": captured_storage()}) as grid:
+            pool = RemoteSessionPool(grid.url)
+            drivers = [pool.acquire("chrome", True) for _ in range(3)]
+            cache = SessionStateCache(SessionStateStore(tmp_path, SessionCipher("s3cret")), "trader_gw0", login)
+            for driver in drivers:
+                cache.restore(driver)
+            jars = [list(grid.sessions[driver.session_id]["cookies"]) for driver in drivers]
+            urls = [driver.current_url for driver in drivers]
+            scripts = sum("/execute/sync" in path for _, path in grid.commands)
+            rerun = SessionStateCache(SessionStateStore(tmp_path, SessionCipher("s3cret")), "trader_gw0", login)
+            rerun.restore(drivers[0])
+            for driver in drivers:
+                pool.release(driver, "chrome", True)
+            pool.close()
+
+        assert len(logins) == 1 and cache.logins == 1 and rerun.logins == 0
+        assert all(any(c["value"] == "token-123" for c in jar) for jar in jars)
+        assert urls == ["https://trade.example.test/robots.txt"] * 3
+        assert scripts == 1 + 3  # one capture, one storage restore per browser
+
+    @pytest.mark.unit
+    def test_stand_in_server_issues_session_cookie(self):
+        """Wrong credentials are refused; a successful login's cookie authenticates /api/me"""
+        with MockAuthServer(username="trader@example.test", password="secret") as auth:
+            refused = requests.post(auth.login_url, data={"username": "trader@example.test", "password": "nope"})
+            session = requests.Session()
+            session.post(auth.login_url, data={"username": "trader@example.test", "password": "secret"})
+            me = session.get(f"{auth.url}/api/me")
+            anonymous = requests.get(f"{auth.url}/api/me")
+
+        assert refused.status_code == 401
+        assert me.json() == {"user": "trader@example.test"} and anonymous.status_code == 401
+        assert auth.logins == 1
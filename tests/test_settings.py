@@ -0,0 +1,106 @@
+"""
+tests/test_settings.py - Typed session settings unit tests
+"""
+
+import dataclasses
+import os
+import pytest
+import allure
+from src.config.settings import Settings, Timeouts, load_settings
+
+
+@allure.feature("Framework")
+@allure.story("Settings")
+class TestSettings:
+    """Test cases for load_settings and Settings"""
+
+    @pytest.mark.unit
+    def test_precedence_profile_env_cli(self):
+        """Profile overrides defaults, environment overrides profile, CLI overrides environment"""
+        environ = {"MB_TIMEOUTS__EXPLICIT": "12", "MB_BROWSER__NAME": "firefox"}
+        settings = load_settings("ci", {"browser": {"name": "edge", "headless": None}}, environ=environ)
+
+        assert settings.profile == "ci"
+        assert settings.timeouts.page_load == 45.0
+        assert settings.timeouts.explicit == 12.0
+        assert settings.timeouts.implicit == Timeouts.implicit
+        assert settings.browser.name == "edge"
+        assert settings.browser.headless is True
+
+    @pytest.mark.unit
+    def test_perf_profile_changes_timeouts_and_flags_together(self):
+        """One profile switch changes every timeout and browser flag"""
+        local, perf = load_settings("local", environ={}), load_settings("perf", environ={})
+
+        assert perf.timeouts.implicit == 0
+        assert all(getattr(perf.timeouts, f) != getattr(local.timeouts, f) for f in ("explicit", "short", "page_load"))
+        assert "--disable-background-timer-throttling" in perf.browser.chrome_arguments
+
+    @pytest.mark.unit
+    def test_driver_factory_implicit_wait_capped_by_profile(self, monkeypatch):
+        """Factory-made drivers keep a 5s implicit wait unless the profile asks for less"""
+        from src.drivers import driver_factory
+        from src.drivers.driver_factory import DriverFactory
+
+        for profile, expected in (("local", 5), ("perf", 0)):
+            settings = load_settings(profile, environ={})
+            monkeypatch.setattr(driver_factory, "get_settings", lambda: settings)
+            assert DriverFactory.implicit_wait() == expected
+
+    @pytest.mark.unit
+    def test_driver_factory_adds_its_own_chrome_flags(self, monkeypatch):
+        """The fixture launches Chrome with the profile flags; the factory adds GPU/plugin flags once"""
+        from src.drivers import driver_factory
+        from src.drivers.driver_factory import DriverFactory
+
+        local = load_settings("local", environ={})
+        assert "--disable-gpu" not in local.browser.chrome_arguments
+        for profile in ("local", "perf"):
+            settings = load_settings(profile, environ={})
+            monkeypatch.setattr(driver_factory, "get_settings", lambda: settings)
+            arguments = DriverFactory.chrome_arguments()
+            assert arguments[:len(settings.browser.chrome_arguments)] == settings.browser.chrome_arguments
+            assert arguments.count("--disable-gpu") == arguments.count("--disable-plugins") == 1
+
+    @pytest.mark.unit
+    def test_environment_strings_are_typed(self):
+        """Env values become bools, floats and tuples according to the field type"""
+        environ = {"MB_PROFILE": "local", "MB_BROWSER__HEADLESS": "yes", "MB_BROWSER__SLOW_MODE": "0.5",
+                   "MB_BROWSER__CHROME_ARGUMENTS": "--a, --b"}
+        settings = load_settings(environ=environ)
+
+        assert settings.browser.headless is True
+        assert settings.browser.slow_mode == 0.5
+        assert settings.browser.chrome_arguments == ("--a", "--b")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("profile, environ, message", [
+        ("nope", {}, "Unknown profile 'nope'"),
+        ("local", {"MB_TIMEOUTS__PAGELOAD": "5"}, "timeouts.pageload"),
+        ("local", {"MB_TIMEOUTS__PAGE_LOAD": "soon"}, "timeouts.page_load expects float"),
+        ("local", {"MB_BROWSER__HEADLESS": "maybe"}, "browser.headless expects bool"),
+    ])
+    def test_invalid_settings_are_rejected(self, profile, environ, message):
+        """Typos and wrong types fail at session start with the setting's name"""
+        with pytest.raises(ValueError, match=message):
+            load_settings(profile, environ=environ)
+
+    @pytest.mark.unit
+    def test_settings_are_frozen_and_round_trip(self):
+        """Workers rebuild identical settings from the controller's dict"""
+        settings = load_settings("perf", environ={})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.timeouts.explicit = 1
+        assert Settings.from_dict(settings.to_dict()) == settings
+
+    @pytest.mark.unit
+    def test_dotenv_file_does_not_override_environment(self, tmp_path, monkeypatch):
+        """.env fills in unset variables only"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("MB_TIMEOUTS__SHORT=7\nMB_TIMEOUTS__LONG=40\n")
+        monkeypatch.setattr(os, "environ", {"MB_TIMEOUTS__LONG": "25"})
+        settings = load_settings("local", env_file=str(env_file))
+
+        assert settings.timeouts.short == 7.0
+        assert settings.timeouts.long == 25.0
@@ -0,0 +1,103 @@
+"""
+tests/test_tab_switch.py - Category tab switching and re-render latency unit tests
+"""
+
+import itertools
+import json
+import pytest
+import allure
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.drivers.mock_market import MockMarketServer
+from src.pages.trading_page import CATEGORY_TABS, TradingPage
+from src.utils.tab_switch import summarize_switches
+
+
+def switch_result(symbols, render_ms=60.0, changed=True):
+    """Result of the switch script for a list re-rendered with symbols"""
+    return {"changed": changed, "first_change_ms": render_ms / 2 if changed else None,
+            "render_ms": render_ms if changed else None,
+            "table": {"captured_at": 1000.0, "symbol": symbols, "price": [1.0] * len(symbols),
+                      "change": [0.1] * len(symbols), "volume": [1e6] * len(symbols)}}
+
+
+@allure.feature("Framework")
+@allure.story("Category Tab Switching")
+class TestTabSwitch:
+    """Test cases for TradingPage.switch_category, benchmark_category_tabs and summarize_switches"""
+
+    @pytest.mark.unit
+    def test_switch_returns_new_list_and_timing(self):
+        """One async call clicks the tab, times the re-render and extracts the new list"""
+        result = switch_result(["EUR/USD", "GBP/USD"], render_ms=72.5)
+        with MockGrid(script_results={"/* switchTab */": result}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            page = TradingPage(driver)
+            table, timing = page.switch_category("forex")
+            calls = [path for _, path in grid.commands].count(f"/session/{driver.session_id}/execute/async")
+            driver.quit()
+
+        assert calls == 1
+        assert table.symbols.tolist() == ["EUR/USD", "GBP/USD"]
+        assert timing == {"tab": "forex", "first_change_ms": 36.25, "render_ms": 72.5, "rows": 2}
+        assert page.tab_switches == [timing]
+
+    @pytest.mark.unit
+    def test_switch_failures_raise(self):
+        """A list that never re-renders times out; a missing tab is reported as not found"""
+        results = iter([switch_result(["BTC/USDT"], changed=False), {"error": "tab not found"}])
+        with MockGrid(script_results={"/* switchTab */": lambda: next(results)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            page = TradingPage(driver)
+            with pytest.raises(TimeoutException):
+                page.switch_category("crypto", timeout=1)
+            with pytest.raises(NoSuchElementException, match="tab not found"):
+                page.switch_category("metals", timeout=1)
+            driver.quit()
+
+        assert page.tab_switches == []
+
+    @pytest.mark.unit
+    def test_already_selected_tab_returns_current_list(self):
+        """The tab selected on load is read as it is; the filter check still covers every tab"""
+        lists = {"crypto": ["BTC/USDT"], "forex": ["EUR/USD"], "metals": ["XAU/USD"], "stocks": ["AAPL"]}
+        results = iter([dict(switch_result(lists["crypto"], changed=False), selected=True)]
+                       + [switch_result(lists[category]) for category in ("forex", "metals", "stocks")])
+        with MockGrid(script_results={"/* switchTab */": lambda: next(results)}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            page = TradingPage(driver)
+            tables = page.verify_category_tabs_filter_list()
+            driver.quit()
+
+        assert {category: table.symbols.tolist() for category, table in tables.items()} == lists
+        assert [timing["tab"] for timing in page.tab_switches] == ["forex", "metals", "stocks"]
+
+    @pytest.mark.unit
+    def test_benchmark_cycles_tabs_and_summarizes(self):
+        """Each round visits every tab; latency is summarized per tab"""
+        latencies = itertools.count(10, 10)
+        with MockGrid(script_results={"/* switchTab */": lambda: switch_result(["X"], float(next(latencies)))}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url)
+            summary = TradingPage(driver).benchmark_category_tabs(rounds=3)
+            driver.quit()
+
+        assert list(summary) == list(CATEGORY_TABS)
+        assert summary["crypto"]["switches"] == 3
+        assert (summary["crypto"]["median_ms"], summary["crypto"]["max_ms"]) == (50.0, 90.0)
+        assert summary["stocks"]["rows"] == 1
+
+    @pytest.mark.unit
+    def test_summary_percentiles_and_fixture_categories(self):
+        """Percentiles per tab; the fixture page carries each pair's category and the render delay"""
+        samples = [{"tab": "forex", "render_ms": float(ms), "rows": 5} for ms in range(1, 101)]
+        summary = summarize_switches(samples)["forex"]
+        with MockMarketServer(pairs=8, render_delay_ms=75) as market:
+            page = market.render_page()
+        data = json.loads(page.split('<script id="pairs-data" type="application/json">')[1].split("</script>")[0])
+
+        assert summary["switches"] == 100 and summary["max_ms"] == 100.0
+        assert 50.0 <= summary["median_ms"] <= 51.0 and 95.0 <= summary["p95_ms"] <= 96.0
+        assert [pair["category"] for pair in data[:4]] == list(MockMarketServer.CATEGORIES)
+        assert "const RENDER_DELAY_MS = 75;" in page
+        assert page.count('class="category-tab"') == 4
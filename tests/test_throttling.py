@@ -0,0 +1,66 @@
+"""
+tests/test_throttling.py - Network/CPU throttling profile unit tests against a local mock grid
+"""
+
+import pytest
+import allure
+from src.config.settings import PerformanceBudgets
+from src.drivers.driver_factory import DriverFactory
+from src.drivers.mock_grid import MockGrid
+from src.drivers.remote_grid import RemoteSessionPool
+from src.pages.base_page import BasePage
+from src.utils.page_performance import PerformanceMonitor
+from src.utils.throttling import active_throttling, apply_throttling, resolve_profiles
+
+
+@allure.feature("Framework")
+@allure.story("Throttling")
+class TestThrottling:
+    """Test cases for throttling profiles and their CDP commands"""
+
+    @pytest.mark.unit
+    def test_profiles_combine_network_and_cpu(self):
+        """4G plus slow CPU keeps the 4G network and the 4x CPU slowdown"""
+        profile = resolve_profiles(["4g", "slow-cpu-4x"])
+
+        assert (profile.name, profile.latency_ms, profile.download_kbps, profile.cpu_rate) == \
+            ("4g+slow-cpu-4x", 170, 9000, 4)
+        with pytest.raises(ValueError, match="Unknown throttling profile"):
+            resolve_profiles(["2g"])
+
+    @pytest.mark.unit
+    def test_driver_factory_applies_profile_through_cdp(self):
+        """Network conditions go out in bytes/s and page loads are keyed by the profile"""
+        with MockGrid(script_results={"largest-contentful-paint": {"url": "https://example.test/", "lcp": 900.0}}) as grid:
+            driver = DriverFactory.create_driver("chrome", remote_url=grid.url, throttling=("3g", "slow-cpu-4x"))
+            monitor = PerformanceMonitor(PerformanceBudgets()).attach(driver)
+            BasePage(driver).navigate_to_url("https://example.test/")
+            driver.quit()
+
+        conditions = dict(grid.cdp_commands)["Network.emulateNetworkConditions"]
+        assert (conditions["latency"], conditions["downloadThroughput"]) == (300, 200000)
+        assert dict(grid.cdp_commands)["Emulation.setCPUThrottlingRate"] == {"rate": 4}
+        assert list(monitor.samples) == ["example_test@3g+slow-cpu-4x"]
+
+    @pytest.mark.unit
+    def test_reused_grid_session_is_unthrottled(self):
+        """Releasing a session to the pool restores full speed before the next test gets it"""
+        with MockGrid() as grid:
+            sessions = RemoteSessionPool(grid.url)
+            driver = sessions.acquire("chrome", True)
+            apply_throttling(driver, resolve_profiles(["3g"]))
+            sessions.release(driver, "chrome", True)
+            sessions.close()
+
+        assert ("Network.emulateNetworkConditions",
+                {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}) in grid.cdp_commands
+        assert active_throttling(driver) is None
+
+    @pytest.mark.unit
+    def test_non_chromium_browser_is_rejected_before_session(self):
+        """Firefox has no CDP emulation, so no session is started"""
+        with MockGrid() as grid:
+            with pytest.raises(ValueError, match="Chromium"):
+                DriverFactory.create_driver("firefox", remote_url=grid.url, throttling=("3g",))
+
+        assert grid.sessions_created == 0
@@ -1,137 +1,152 @@
-# import pytest
-# import allure
-# from src.pages.home_page import HomePage
-# from src.utils.logger import log_info
-#
-#
-# @allure.feature("Trading Functionality")
-# @allure.story("Spot Trading Section")
-# class TestTradingFunctionality:
-#     """Test cases for trading functionality"""
-#
-#     @pytest.mark.smoke
-#     @allure.title("Verify trading section displays correctly")
-#     @allure.description("Verify that the spot trading section is visible and displays trading pairs")
-#     def test_trading_section_visible(self, driver):
-#         """Test that trading section is visible"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         with allure.step("Verify trading section is visible"):
-#             home_page.verify_trading_section_visible()
-#
-#         log_info("✓ Trading section visibility test passed")
-#
-#     @pytest.mark.smoke
-#     @allure.title("Verify trading pairs are displayed")
-#     @allure.description("Verify that trading pairs are displayed in the trading section")
-#     def test_trading_pairs_displayed(self, driver):
-#         """Test that trading pairs are displayed"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         with allure.step("Verify trading pairs are displayed"):
-#             home_page.verify_trading_pairs_displayed()
-#
-#         pairs_count = home_page.get_trading_pairs_count()
-#         log_info(f"✓ Trading pairs display test passed - Found {pairs_count} pairs")
-#
-#     @pytest.mark.regression
-#     @allure.title("Verify trading pair data structure")
-#     @allure.description("Verify that each trading pair has correct data structure (name, price, change)")
-#     def test_trading_pair_structure(self, driver):
-#         """Test trading pair data structure"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         with allure.step("Verify trading pair structure"):
-#             home_page.verify_trading_pair_structure()
-#
-#         log_info("✓ Trading pair structure test passed")
-#
-#     @pytest.mark.regression
-#     @allure.title("Verify trading pairs have correct data")
-#     @allure.description("Verify that trading pair data is not empty and properly formatted")
-#     def test_trading_pair_data_integrity(self, driver):
-#         """Test trading pair data integrity"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         pairs = home_page.get_elements(home_page.wait.driver.find_elements(*home_page.TRADING_PAIRS))
-#
-#         assert len(pairs) > 0, "No trading pairs found"
-#
-#         with allure.step("Verify trading pair data integrity"):
-#             for i, pair in enumerate(pairs[:5]):
-#                 pair_text = pair.text
-#                 assert pair_text, f"Trading pair {i} is empty"
-#                 assert len(pair_text) > 0, f"Trading pair {i} has no data"
-#
-#         log_info(f"✓ Trading pair data integrity test passed for {len(pairs[:5])} pairs")
-#
-#     @pytest.mark.regression
-#     @allure.title("Verify category filters exist")
-#     @allure.description("Verify that trading category filters are available")
-#     def test_category_filters_exist(self, driver):
-#         """Test that category filters exist"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         with allure.step("Verify category filters exist"):
-#             home_page.verify_category_filters_exist()
-#
-#         filters_count = home_page.get_elements_count(home_page.CATEGORY_FILTERS)
-#         log_info(f"✓ Category filters test passed - Found {filters_count} filters")
-#
-#     @pytest.mark.smoke
-#     @allure.title("Verify trading data updates")
-#     @allure.description("Verify that trading data loads and displays correctly on page load")
-#     def test_trading_data_loads(self, driver):
-#         """Test that trading data loads correctly"""
-#         home_page = HomePage(driver)
-#
-#         with allure.step("Navigate to home page"):
-#             home_page.load()
-#
-#         with allure.step("Wait for trading data to load"):
-#             home_page.wait.wait_for_page_load()
-#
-#         with allure.step("Verify trading pairs are present"):
-#             pairs_count = home_page.get_trading_pairs_count()
-#             assert pairs_count > 0, "Trading pairs did not load"
-#
-#         log_info(f"✓ Trading data load test passed - {pairs_count} pairs loaded")
-#
-#     @pytest.mark.regression
-#     @allure.title("Verify multiple trading pairs display across categories")
-#     @allure.description("Verify that trading pairs are available across different categories")
-#     def test_trading_pairs_across_categories(self, driver):
-#         """Test trading pairs across categories"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         initial_count = home_page.get_trading_pairs_count()
-#
-#         with allure.step(f"Verify initial trading pairs count: {initial_count}"):
-#             assert initial_count > 0, "No trading pairs found"
-#
-#         log_info(f"✓ Trading pairs across categories test passed - {initial_count} pairs found")
-#
-#     @pytest.mark.smoke
-#     @allure.title("Verify trading section contains expected elements")
-#     @allure.description("Verify that trading section has all required elements")
-#     def test_trading_section_elements(self, driver):
-#         """Test trading section elements"""
-#         home_page = HomePage(driver)
-#         home_page.load()
-#
-#         with allure.step("Verify trading section visibility"):
-#             home_page.verify_trading_section_visible()
-#
-#         with allure.step("Verify trading pairs are displayed"):
-#             home_page.verify_trading_pairs_displayed()
-#
-#         with allure.step("Verify category filters exist"):
-#             home_page.verify_category_filters_exist()
-#
-#         log_info("✓ Trading section elements test passed")
\ No newline at end of file
+import pytest
+import allure
+from src.drivers.mock_market import MockMarketServer
+from src.pages.trading_page import TradingPage
+from src.utils.logger import log_info
+
+
+@allure.feature("Trading Functionality")
+@allure.story("Spot Trading Section")
+class TestTradingFunctionality:
+    """Test cases for trading functionality"""
+
+    @pytest.mark.smoke
+    @allure.title("Verify trading section displays correctly")
+    @allure.description("Verify that the spot trading section is visible and displays trading pairs")
+    def test_trading_section_visible(self, authenticated_driver):
+        """Test that trading section is visible"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Verify trading section is visible"):
+            trading_page.verify_trading_section_visible()
+
+        log_info("✓ Trading section visibility test passed")
+
+    @pytest.mark.smoke
+    @allure.title("Verify trading pairs are displayed")
+    @allure.description("Verify that trading pairs are displayed in the trading section")
+    def test_trading_pairs_displayed(self, authenticated_driver):
+        """Test that trading pairs are displayed"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Verify trading pairs are displayed"):
+            table = trading_page.verify_trading_pairs_displayed()
+
+        log_info(f"✓ Trading pairs display test passed - Found {len(table)} pairs")
+
+    @pytest.mark.regression
+    @allure.title("Verify trading pair data structure")
+    @allure.description("Verify that every trading pair has a symbol and a numeric price")
+    def test_trading_pair_structure(self, authenticated_driver):
+        """Test trading pair data structure"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Verify trading pair structure"):
+            trading_page.verify_trading_pair_structure()
+
+        log_info("✓ Trading pair structure test passed")
+
+    @pytest.mark.regression
+    @allure.title("Verify category tabs exist")
+    @allure.description("Verify that trading category tabs are available")
+    def test_category_tabs_exist(self, authenticated_driver):
+        """Test that category tabs exist"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Verify category tabs exist"):
+            trading_page.verify_category_tabs_exist()
+
+        log_info("✓ Category tabs test passed")
+
+    @pytest.mark.regression
+    @allure.title("Verify category tabs filter the pairs list")
+    @allure.description("Verify that each category tab re-renders the pairs list with its own pairs")
+    def test_category_tabs_filter_pairs(self, authenticated_driver):
+        """Test that category tabs switch the pairs list"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Switch through category tabs"):
+            tables = trading_page.verify_category_tabs_filter_list()
+
+        log_info(f"✓ Category tab filter test passed - {', '.join(f'{c}: {len(t)}' for c, t in tables.items())}")
+
+    @pytest.mark.regression
+    @allure.title("Verify trading prices update")
+    @allure.description("Verify that successive snapshots of the pairs list show price movement")
+    def test_trading_prices_update(self, authenticated_driver):
+        """Test that trading data updates"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Diff pairs list snapshots"):
+            diff = trading_page.verify_prices_update(timeout=30)
+
+        log_info(f"✓ Trading price update test passed - {len(diff.changed)} pairs moved")
+
+    @pytest.mark.regression
+    @allure.title("Verify trading prices tick")
+    @allure.description("Capture price changes in the page for a few seconds and check per-symbol update rates")
+    def test_trading_prices_tick(self, authenticated_driver):
+        """Test that live prices keep ticking"""
+        trading_page = TradingPage(authenticated_driver)
+        trading_page.load()
+
+        with allure.step("Capture price updates"):
+            metrics = trading_page.verify_prices_ticking(duration=10)
+
+        ticking = sum(1 for m in metrics.values() if m["updates"])
+        log_info(f"✓ Trading price tick test passed - {ticking}/{len(metrics)} symbols ticking")
+
+    @pytest.mark.slow
+    @allure.title("Verify price capture keeps up with a streamed tick rate")
+    @allure.description("Capture a local page receiving 500 ticks per second across 50 pairs without losing updates")
+    def test_price_capture_against_stream(self, authenticated_driver):
+        """Test that the in-page capture records streamed ticks"""
+        with MockMarketServer(pairs=50, ticks_per_second=500) as market:
+            trading_page = TradingPage(authenticated_driver)
+            trading_page.load(market.url)
+            metrics = trading_page.verify_prices_ticking(duration=3, min_ticking=45, max_staleness_ms=2000)
+
+        updates = sum(m["updates"] for m in metrics.values())
+        assert updates > 0.5 * 500 * 3, f"Captured only {updates} of ~1500 streamed ticks"
+        log_info(f"✓ Price capture test passed - {updates} updates captured")
+
+    @pytest.mark.slow
+    @allure.title("Benchmark pairs list extraction under a high tick rate")
+    @allure.description("Read 1000 pairs from a local page receiving 5000 synthetic ticks per second")
+    def test_pairs_extraction_throughput(self, authenticated_driver, benchmark):
+        """Test extraction throughput against the local streaming market page"""
+        with MockMarketServer(pairs=1000, ticks_per_second=5000) as market:
+            trading_page = TradingPage(authenticated_driver)
+            trading_page.load(market.url)
+            first = trading_page.read_pairs()
+            table = benchmark(trading_page.read_pairs)
+            diff = table.diff(first)
+
+        assert len(table) == 1000 and not table.incomplete()
+        assert diff.changed, "Streamed ticks did not reach the pairs list"
+        benchmark.extra_info["rows_per_second"] = len(table) / benchmark.stats.stats.mean
+        log_info(f"✓ Extraction throughput: {benchmark.extra_info['rows_per_second']:.0f} rows/s")
+
+    @pytest.mark.slow
+    @allure.title("Benchmark category tab re-render latency")
+    @allure.description("Switch category tabs on a local ticking market page and record per-tab re-render latency")
+    def test_category_switch_latency(self, authenticated_driver, benchmark):
+        """Test per-category re-render latency against the local streaming market page"""
+        with MockMarketServer(pairs=400, ticks_per_second=500, render_delay_ms=50) as market:
+            trading_page = TradingPage(authenticated_driver)
+            trading_page.load(market.url)
+            summary = benchmark.pedantic(trading_page.benchmark_category_tabs, kwargs={"rounds": 3},
+                                         rounds=1, iterations=1)
+
+        for category, stats in summary.items():
+            assert stats["rows"] == 100, f"'{category}' rendered {stats['rows']} of 100 pairs"
+            assert 50 <= stats["median_ms"] < 1000, f"'{category}' re-render took {stats['median_ms']:.0f} ms"
+            benchmark.extra_info[f"{category}_median_ms"] = stats["median_ms"]
+            benchmark.extra_info[f"{category}_p95_ms"] = stats["p95_ms"]
+        log_info(f"✓ Category switch latency: {benchmark.extra_info}")
@@ -0,0 +1,79 @@
+"""
+tests/test_visual_compare.py - Element screenshot comparison unit tests
+"""
+
+import numpy as np
+import pytest
+import allure
+from src.utils.visual_compare import VisualBaselineStore, VisualComparator, decode_png, dhash, encode_png, hamming
+
+
+def banner(shift=0, height=60, width=200):
+    """Synthetic RGBA banner: horizontal gradient with a bright block"""
+    image = np.zeros((height, width, 4), dtype=np.uint8)
+    image[..., 0] = np.linspace(0, 255, width, dtype=np.uint8)
+    image[..., 2] = 128
+    image[..., 3] = 255
+    image[10:40, 20 + shift:80 + shift, :3] = 240
+    return image
+
+
+@allure.feature("Framework")
+@allure.story("Visual comparison")
+class TestVisualCompare:
+    """Test cases for PNG round trips, perceptual hash and VisualComparator"""
+
+    @pytest.mark.unit
+    def test_png_round_trip(self):
+        """Encoded RGBA pixels decode back unchanged"""
+        image = banner(height=12, width=30)
+
+        assert np.array_equal(decode_png(encode_png(image)), image)
+
+    @pytest.mark.unit
+    def test_dhash_tolerates_noise_but_not_layout_changes(self):
+        """Small pixel noise keeps the hash, a moved block changes it"""
+        noisy = banner().copy()
+        noisy[::7, ::5, 1] += 3
+
+        assert hamming(dhash(banner()), dhash(noisy)) == 0
+        assert hamming(dhash(banner()), dhash(banner(shift=90))) > 0
+
+    @pytest.mark.unit
+    def test_comparator_escalates_from_hashes_to_pixels(self, tmp_path):
+        """Identical bytes stop at sha256, a real change reaches the pixel diff"""
+        store = VisualBaselineStore(tmp_path)
+        VisualComparator(store, update_baselines=True).compare("slide_0", encode_png(banner()))
+        comparator = VisualComparator(store)
+
+        assert comparator.compare("slide_0", encode_png(banner()))["method"] == "sha256"
+
+        changed = comparator.compare("slide_0", encode_png(banner(shift=90)))
+        assert changed["method"] == "pixels" and changed["status"] == "changed"
+        with pytest.raises(AssertionError, match="Visual regression"):
+            comparator.verify()
+
+    @pytest.mark.unit
+    def test_baselines_are_content_addressed(self, tmp_path):
+        """Two names with the same image share one stored object"""
+        store = VisualBaselineStore(tmp_path)
+        comparator = VisualComparator(store)
+        comparator.compare("slide_0", encode_png(banner()))
+        comparator.compare("slide_1", encode_png(banner()))
+
+        assert store.load_ref("slide_0")["sha256"] == store.load_ref("slide_1")["sha256"]
+        assert len(list((tmp_path / "objects").rglob("*.png"))) == 1
+
+    @pytest.mark.unit
+    def test_missing_baseline_is_recorded_and_fails(self, tmp_path):
+        """A first screenshot is stored for review but does not pass against itself"""
+        store = VisualBaselineStore(tmp_path)
+        comparator = VisualComparator(store)
+        assert store.is_empty()
+
+        assert comparator.compare("slide_0", encode_png(banner()))["status"] == "baseline saved"
+        assert not store.is_empty()
+        with pytest.raises(AssertionError, match="no baseline"):
+            comparator.verify()
+        rerun = VisualComparator(VisualBaselineStore(tmp_path))
+        assert rerun.compare("slide_0", encode_png(banner()))["status"] == "identical"